@@ -0,0 +1,137 @@
+"""
+JWT authentication with a verified-token cache.
+
+SimpleJWT's JWTAuthentication re-checks the HMAC signature and then loads
+the User row on every request. Staff automation hits the API with the
+same access token over and over, so both costs are paid many times per
+token lifetime.
+
+  CachedJWTAuthentication
+      Keeps recently verified tokens in a bounded, per-process LRU keyed
+      by the raw token string. Entries expire with the token's own `exp`
+      claim (never later than ACCESS_TOKEN_LIFETIME), so a cache hit can
+      never accept a token that SimpleJWT itself would reject. The user
+      is still loaded from the database.
+
+  CachedJWTStatelessAuthentication
+      Same cache, but returns a TokenUser rebuilt from the token claims
+      (user_id, username, is_staff, is_superuser — see
+      accounts.serializers) with no database query. Opt in per view with
+      @authentication_classes([CachedJWTStatelessAuthentication]) on
+      read endpoints that only need the identity and staff flags.
+
+Both honour revocation: revoked `jti`s are kept in a compact in-memory
+blocklist that each worker refreshes from the RevokedToken table at most
+every JWT_BLOCKLIST_REFRESH_SECONDS.
+"""
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timezone
+
+from django.conf import settings
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.authentication import (
+    JWTAuthentication,
+    JWTStatelessUserAuthentication,
+)
+from rest_framework_simplejwt.exceptions import InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+
+from .models import RevokedToken
+
+
+class VerifiedTokenCache:
+    """Thread-safe LRU of raw token -> (expires_at, validated token)."""
+
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, raw_token, now):
+        with self._lock:
+            entry = self._entries.get(raw_token)
+            if entry is None:
+                return None
+            if entry[0] <= now:
+                del self._entries[raw_token]
+                return None
+            self._entries.move_to_end(raw_token)
+            return entry[1]
+
+    def put(self, raw_token, token, expires_at):
+        with self._lock:
+            self._entries[raw_token] = (expires_at, token)
+            self._entries.move_to_end(raw_token)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+class TokenBlocklist:
+    """In-memory set of revoked jtis, refreshed from RevokedToken."""
+
+    def __init__(self, refresh_seconds):
+        self.refresh_seconds = refresh_seconds
+        self._jtis = {}            # jti -> exp (unix seconds)
+        self._loaded_at = None
+        self._lock = threading.Lock()
+
+    def _refresh(self, now):
+        rows = RevokedToken.objects.filter(
+            expires_at__gt=datetime.fromtimestamp(now, tz=timezone.utc),
+        ).values_list('jti', 'expires_at')
+        self._jtis = {jti: exp.timestamp() for jti, exp in rows}
+        self._loaded_at = now
+
+    def __contains__(self, jti):
+        now = time.time()
+        if self._loaded_at is None or now - self._loaded_at >= self.refresh_seconds:
+            with self._lock:
+                if self._loaded_at is None or now - self._loaded_at >= self.refresh_seconds:
+                    self._refresh(now)
+        exp = self._jtis.get(jti)
+        return exp is not None and exp > now
+
+    def add(self, jti, exp):
+        with self._lock:
+            self._jtis[jti] = exp
+
+
+verified_tokens = VerifiedTokenCache(settings.JWT_VERIFIED_CACHE_SIZE)
+blocklist = TokenBlocklist(settings.JWT_BLOCKLIST_REFRESH_SECONDS)
+
+
+def revoke_token(token):
+    """Revoke a validated token everywhere before it expires."""
+    jti = token[api_settings.JTI_CLAIM]
+    exp = token['exp']
+    RevokedToken.objects.get_or_create(
+        jti=jti,
+        defaults={'expires_at': datetime.fromtimestamp(exp, tz=timezone.utc)},
+    )
+    blocklist.add(jti, exp)
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """JWTAuthentication that skips signature checks for recently seen tokens."""
+
+    def get_validated_token(self, raw_token):
+        now = time.time()
+        token = verified_tokens.get(raw_token, now)
+        if token is None:
+            token = super().get_validated_token(raw_token)
+            lifetime = api_settings.ACCESS_TOKEN_LIFETIME.total_seconds()
+            verified_tokens.put(raw_token, token, min(token['exp'], now + lifetime))
+
+        if token.get(api_settings.JTI_CLAIM) in blocklist:
+            raise InvalidToken(_('Token has been revoked'))
+        return token
+
+
+class CachedJWTStatelessAuthentication(CachedJWTAuthentication, JWTStatelessUserAuthentication):
+    """Cached verification plus a TokenUser built from claims — no user query."""
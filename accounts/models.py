@@ -1,3 +1,23 @@
 # accounts/models.py
 # Using Django's built-in User model for now.
 # Extend with a custom AbstractUser here when staff roles are needed.
+from django.db import models
+
+
+class RevokedToken(models.Model):
+    """
+    Access token revoked before its natural expiry.
+
+    The table only backs the in-memory blocklist in
+    accounts.authentication; rows can be deleted once expires_at passes.
+    """
+    jti        = models.CharField(max_length=64, unique=True)
+    expires_at = models.DateTimeField(db_index=True)
+    revoked_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        verbose_name        = 'Revoked Token'
+        verbose_name_plural = 'Revoked Tokens'
+
+    def __str__(self):
+        return self.jti
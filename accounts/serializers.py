@@ -0,0 +1,17 @@
+from rest_framework_simplejwt.serializers import TokenObtainPairSerializer
+
+
+class StaffClaimsTokenObtainPairSerializer(TokenObtainPairSerializer):
+    """
+    Adds the identity claims CachedJWTStatelessAuthentication needs to
+    rebuild a TokenUser without loading the User row. Access tokens minted
+    by /token/refresh/ copy these claims from the refresh token.
+    """
+
+    @classmethod
+    def get_token(cls, user):
+        token = super().get_token(user)
+        token['username']     = user.get_username()
+        token['is_staff']     = user.is_staff
+        token['is_superuser'] = user.is_superuser
+        return token
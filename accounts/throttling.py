@@ -0,0 +1,88 @@
+"""
+Protection for the password-checking token endpoint.
+
+Every POST /api/auth/token/ runs Django's PBKDF2 hasher (hundreds of ms of
+CPU). Two layers keep a login flood from starving the public menu:
+
+  * LoginIPRateThrottle / LoginUsernameRateThrottle — token buckets from
+    core.throttling keyed by client IP and by the submitted username.
+    DRF runs throttles in APIView.initial(), before the serializer ever
+    calls authenticate(), so rejected attempts never reach the hasher.
+
+  * login_slots — a small, instance-wide pool of "hashing slots" shared by
+    all gunicorn workers through lock files. A login that cannot grab a
+    slot immediately gets a 503 instead of queueing, so at most
+    LOGIN_MAX_CONCURRENT workers are ever busy hashing passwords.
+"""
+import os
+from contextlib import contextmanager
+
+from django.conf import settings
+
+from core.throttling import TokenBucketRateThrottle
+
+try:
+    import fcntl
+except ImportError:  # Windows dev machines — no cross-process slots
+    fcntl = None
+
+
+class LoginIPRateThrottle(TokenBucketRateThrottle):
+    scope = 'login_ip'
+
+    def get_cache_key(self, request, view):
+        return self.cache_format % {
+            'scope': self.scope,
+            'ident': self.get_ident(request),
+        }
+
+
+class LoginUsernameRateThrottle(TokenBucketRateThrottle):
+    scope = 'login_user'
+
+    def get_cache_key(self, request, view):
+        try:
+            username = request.data.get('username')
+        except AttributeError:
+            return None
+        if not username or not isinstance(username, str):
+            return None
+        return self.cache_format % {
+            'scope': self.scope,
+            'ident': username.strip().lower()[:150],
+        }
+
+
+class LoginSlots:
+    """Non-blocking counting semaphore shared across processes via flock."""
+
+    def __init__(self, directory, slots):
+        self.paths = [
+            os.path.join(directory, f'dilli_da_dhaba_login_slot_{i}.lock')
+            for i in range(slots)
+        ]
+
+    @contextmanager
+    def acquire(self):
+        """Yield True while holding a free slot, or False if all are busy."""
+        if fcntl is None:
+            yield True
+            return
+
+        for path in self.paths:
+            fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                os.close(fd)
+                continue
+            try:
+                yield True
+            finally:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+                os.close(fd)
+            return
+        yield False
+
+
+login_slots = LoginSlots(settings.LOGIN_SLOT_DIR, settings.LOGIN_MAX_CONCURRENT)
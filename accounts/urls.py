@@ -4,16 +4,16 @@ JWT token endpoints:
   POST /api/auth/token/         — obtain access + refresh tokens
   POST /api/auth/token/refresh/ — rotate access token
   POST /api/auth/token/verify/  — check token validity
+  POST /api/auth/token/revoke/  — revoke the current access token
 """
 from django.urls import path
-from rest_framework_simplejwt.views import (
-    TokenObtainPairView,
-    TokenRefreshView,
-    TokenVerifyView,
-)
 
+from core.lazy import lazy_view
+
+# SimpleJWT (and DRF behind it) is only imported when a token route is hit.
 urlpatterns = [
-    path('token/',         TokenObtainPairView.as_view(), name='token-obtain'),
-    path('token/refresh/', TokenRefreshView.as_view(),    name='token-refresh'),
-    path('token/verify/',  TokenVerifyView.as_view(),     name='token-verify'),
+    path('token/',         lazy_view('accounts.views.LoginTokenObtainPairView', csrf=False),  name='token-obtain'),
+    path('token/refresh/', lazy_view('accounts.views.ThrottledTokenRefreshView', csrf=False), name='token-refresh'),
+    path('token/verify/',  lazy_view('rest_framework_simplejwt.views.TokenVerifyView', csrf=False), name='token-verify'),
+    path('token/revoke/',  lazy_view('accounts.views.token_revoke', csrf=False),              name='token-revoke'),
 ]
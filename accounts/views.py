@@ -0,0 +1,48 @@
+"""
+Token endpoints.
+
+SimpleJWT's views are wrapped so the password-checking endpoint is
+throttled and bounded before any hashing happens (see accounts.throttling),
+plus a revoke endpoint SimpleJWT does not provide.
+"""
+from rest_framework import status
+from rest_framework.decorators import api_view, authentication_classes, permission_classes
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework_simplejwt.views import TokenObtainPairView, TokenRefreshView
+
+from .authentication import CachedJWTAuthentication, revoke_token
+from .throttling import LoginIPRateThrottle, LoginUsernameRateThrottle, login_slots
+
+
+class LoginTokenObtainPairView(TokenObtainPairView):
+    """POST /api/auth/token/ — throttled by IP + username, bounded concurrency."""
+    throttle_classes = [LoginIPRateThrottle, LoginUsernameRateThrottle]
+
+    def post(self, request, *args, **kwargs):
+        with login_slots.acquire() as acquired:
+            if not acquired:
+                return Response(
+                    {'detail': 'Too many sign-in attempts in progress. Try again shortly.'},
+                    status=status.HTTP_503_SERVICE_UNAVAILABLE,
+                    headers={'Retry-After': '1'},
+                )
+            return super().post(request, *args, **kwargs)
+
+
+class ThrottledTokenRefreshView(TokenRefreshView):
+    """POST /api/auth/token/refresh/ — no hashing, but still IP-throttled."""
+    throttle_classes = [LoginIPRateThrottle]
+
+
+@api_view(['POST'])
+@authentication_classes([CachedJWTAuthentication])
+@permission_classes([IsAuthenticated])
+def token_revoke(request):
+    """
+    POST /api/auth/token/revoke/ — revoke the access token used for this call.
+
+    JWT only: a session-authenticated caller has no token to revoke (401).
+    """
+    revoke_token(request.auth)
+    return Response(status=204)
@@ -0,0 +1,62 @@
+import os
+
+from django.contrib import admin
+from django.http import FileResponse, Http404
+from django.urls import path, reverse
+from django.utils.html import format_html
+
+from .models import RequestProfile
+from .profiling import profile_file_path
+
+
+@admin.register(RequestProfile)
+class RequestProfileAdmin(admin.ModelAdmin):
+    list_display  = ('created_at', 'method', 'path', 'status_code',
+                     'duration_display', 'breakdown_display', 'mode', 'downloads')
+    list_filter   = ('mode', 'method', 'status_code')
+    search_fields = ('path', 'view_name')
+    readonly_fields = [f.name for f in RequestProfile._meta.fields] + ['downloads']
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+    def get_urls(self):
+        return [
+            path(
+                '<int:pk>/download/<str:kind>/',
+                self.admin_site.admin_view(self.download_view),
+                name='core_requestprofile_download',
+            ),
+        ] + super().get_urls()
+
+    def download_view(self, request, pk, kind):
+        profile = self.get_object(request, pk)
+        if profile is None or kind not in ('collapsed', 'speedscope'):
+            raise Http404
+        file_path = profile_file_path(profile.file_stem, kind)
+        if not os.path.exists(file_path):
+            raise Http404('Profile file has been rotated out.')
+        return FileResponse(open(file_path, 'rb'), as_attachment=True,
+                            filename=os.path.basename(file_path))
+
+    @admin.display(description='Duration', ordering='duration_ms')
+    def duration_display(self, obj):
+        return f'{obj.duration_ms:.1f} ms'
+
+    @admin.display(description='Breakdown (ms)')
+    def breakdown_display(self, obj):
+        return ', '.join(
+            f'{name} {ms:.1f}'
+            for name, ms in sorted(obj.breakdown.items(), key=lambda kv: -kv[1])
+        ) or '—'
+
+    @admin.display(description='Files')
+    def downloads(self, obj):
+        url = lambda kind: reverse('admin:core_requestprofile_download', args=[obj.pk, kind])
+        return format_html(
+            '<a href="{}">speedscope</a> · <a href="{}">collapsed</a>',
+            url('speedscope'), url('collapsed'),
+        )
@@ -0,0 +1,159 @@
+"""
+Minified, compressed HTML for template-rendered pages.
+
+WhiteNoise only compresses static files. HTMLCompressionMiddleware handles
+text/html responses (full pages and the HTMX menu fragments):
+
+  * minify — comments are dropped and whitespace runs collapse to one
+    space (or newline). Whitespace inside tags is only collapsed between
+    attributes, never inside quoted values, so Alpine `x-`/`@`/`:`
+    expressions survive intact; <pre>, <textarea>, <script> and <style>
+    bodies are passed through untouched.
+  * compress — brotli (when the optional `brotli` package is installed)
+    or gzip, by Accept-Encoding.
+
+Both results are cached per worker, keyed on a hash of the rendered
+bytes, so an unchanged page is neither re-minified nor recompressed —
+only hashed. Responses that vary on Cookie (the admin, anything with a
+CSRF token or session data) are left alone: they are per-user, and
+compressing secrets next to attacker-influenced text enables BREACH.
+"""
+import gzip
+import hashlib
+import re
+import threading
+from collections import OrderedDict
+
+from django.conf import settings
+from django.utils.cache import has_vary_header, patch_vary_headers
+from django.utils.regex_helper import _lazy_re_compile
+
+from .media import accepted_codings
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+MIN_LENGTH = 200
+GZIP_LEVEL = 9
+BROTLI_QUALITY = 5   # ~quality 9 sizes on HTML at a fraction of the CPU
+
+# One left-to-right pass. Kept verbatim: raw-text elements, conditional
+# comments and quoted attribute values (="…" / ='…'; autoescaped output
+# never has a bare quote in text). Dropped: other comments. Collapsed:
+# runs of ASCII whitespace — a literal U+00A0 is content, not layout.
+_MINIFY_RE = _lazy_re_compile(
+    r'(?P<keep><(?P<raw>pre|textarea|script|style)\b[^>]*>.*?</(?P=raw)\s*>'
+    r'|<!--\[if.*?-->'
+    r'|=[ \t\r\n]*"[^"]*"'
+    r"|=[ \t\r\n]*'[^']*')"
+    r'|(?P<comment><!--.*?-->)'
+    r'|(?P<space>[ \t\r\n\f\v]{2,}|[\t\r\n\f\v])',
+    re.IGNORECASE | re.DOTALL,
+)
+
+
+def _minify_match(match):
+    if match.lastgroup == 'space':
+        return '\n' if '\n' in match.group() else ' '
+    if match.lastgroup == 'comment':
+        return ''
+    return match.group()
+
+
+def minify_html(html):
+    """Collapse whitespace and drop comments; raw-text elements are kept as-is."""
+    return _MINIFY_RE.sub(_minify_match, html)
+
+
+def compress(data, encoding):
+    if encoding == 'br':
+        return brotli.compress(data, quality=BROTLI_QUALITY)
+    return gzip.compress(data, compresslevel=GZIP_LEVEL, mtime=0)
+
+
+def accepted_encoding(request):
+    """'br' or 'gzip' by the client's q-values (br on ties), or None."""
+    accepted = accepted_codings(request.META.get('HTTP_ACCEPT_ENCODING', ''))
+    if brotli is None:
+        accepted['br'] = 0
+    best = max(('br', 'gzip'), key=lambda name: accepted[name])
+    return best if accepted[best] > 0 else None
+
+
+class OutputCache:
+    """Per-worker LRU: content hash → {'identity': minified, 'gzip': …, 'br': …}."""
+
+    def __init__(self, max_entries):
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+
+    def get(self, key, encoding, build):
+        """Cached `encoding` variant for `key`; build(variants) makes a missing one."""
+        with self.lock:
+            variants = self.entries.get(key)
+            if variants is None:
+                variants = self.entries[key] = {}
+                while len(self.entries) > self.max_entries:
+                    self.entries.popitem(last=False)
+            else:
+                self.entries.move_to_end(key)
+        data = variants.get(encoding)
+        if data is None:
+            data = variants[encoding] = build(variants)
+        return data
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+
+
+class HTMLCompressionMiddleware:
+    """Place right after SecurityMiddleware / WhiteNoise."""
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.cache = OutputCache(settings.HTML_OUTPUT_CACHE_SIZE)
+
+    def __call__(self, request):
+        response = self.get_response(request)
+        if not self._applies(response):
+            return response
+
+        key = hashlib.blake2b(response.content, digest_size=16).digest()
+        encoding = accepted_encoding(request) if len(response.content) >= MIN_LENGTH else None
+        data = self.cache.get(key, encoding or 'identity', lambda variants: self._build(
+            response.content, response.charset, encoding, variants,
+        ))
+
+        response.content = data
+        response['Content-Length'] = str(len(data))
+        if encoding:
+            response['Content-Encoding'] = encoding
+            if response.has_header('ETag'):
+                response['ETag'] = re.sub(r'^(W/)?"', 'W/"', response['ETag'])
+        patch_vary_headers(response, ('Accept-Encoding',))
+        return response
+
+    def _applies(self, response):
+        return (
+            response.status_code == 200
+            and not response.streaming
+            and not response.has_header('Content-Encoding')
+            and response.get('Content-Type', '').startswith('text/html')
+            and not has_vary_header(response, 'Cookie')
+        )
+
+    def _build(self, content, charset, encoding, variants):
+        minified = variants.get('identity')
+        if minified is None:
+            if settings.HTML_MINIFY:
+                minified = minify_html(content.decode(charset)).encode(charset)
+            else:
+                minified = content
+            variants['identity'] = minified   # shared with the other encodings
+        if encoding is None:
+            return minified
+        return compress(minified, encoding)
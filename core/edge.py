@@ -0,0 +1,117 @@
+"""
+CDN caching for the public, anonymous responses.
+
+Views opt in with @edge_cache('<policy>'): a 200 GET response without a
+Cache-Control of its own, and without cookies (a CDN would either not
+store it or replay the cookie to everyone), gets
+
+    Cache-Control: public, max-age=…, s-maxage=…, stale-while-revalidate=…, stale-if-error=…
+
+from settings.EDGE_CACHE_POLICIES. The edge can keep responses for a
+long time because they are tagged with surrogate keys (add_keys) and
+purged by key as soon as the underlying data changes (core/purge.py);
+stale-while-revalidate / stale-if-error let it keep answering while it
+refetches, or while the origin is down.
+
+Responses that are only right until a set time (the menu, up to the next
+availability-window boundary) are marked with expire_at(): max-age and
+s-maxage then end at that moment, without stale-while-revalidate or
+stale-if-error.
+
+Keys
+    menu            everything derived from the menu (purged on reseeds)
+    categories      the category list
+    category-<id>   responses listing that category's dishes
+    item-<id>       responses showing that dish
+    featured        featured dishes (home page, /api/featured)
+    outlet-<slug>   responses for one outlet's menu
+    reviews         reviews, review summary, the home page testimonials
+    pages           static pages (about, contact)
+"""
+import functools
+
+from django.conf import settings
+from django.utils import timezone
+from django.utils.cache import patch_cache_control
+
+MENU = 'menu'
+CATEGORIES = 'categories'
+FEATURED = 'featured'
+REVIEWS = 'reviews'
+PAGES = 'pages'
+
+# More item keys than this and a response relies on its category keys,
+# keeping the header well below CDN limits (Fastly: 16 KB).
+MAX_ITEM_KEYS = 200
+
+
+def category_key(category_id):
+    return f'category-{category_id}'
+
+
+def item_key(item_id):
+    return f'item-{item_id}'
+
+
+def outlet_key(slug):
+    return f'outlet-{slug}'
+
+
+def menu_keys(items, category_ids=(), outlet=None):
+    """Keys for a response showing `items` (snapshot dicts) from `category_ids`."""
+    keys = {MENU}
+    keys.update(category_key(c) for c in category_ids)
+    keys.update(category_key(item['category']) for item in items)
+    if len(items) <= MAX_ITEM_KEYS:
+        keys.update(item_key(item['id']) for item in items)
+    if outlet:
+        keys.add(outlet_key(outlet))
+    return keys
+
+
+def add_keys(response, keys):
+    header = settings.EDGE_SURROGATE_KEY_HEADER
+    existing = set(response.get(header, '').split())
+    response[header] = ' '.join(sorted(existing | set(keys)))
+    return response
+
+
+def expire_at(response, moment):
+    """Let caches keep `response` until `moment` at most (None = no limit)."""
+    if moment is not None:
+        current = getattr(response, 'edge_expires', None)
+        response.edge_expires = moment if current is None else min(current, moment)
+    return response
+
+
+def _directives(policy, expires):
+    directives = dict(settings.EDGE_CACHE_POLICIES[policy])
+    if expires is not None:
+        seconds = max(0, int((expires - timezone.now()).total_seconds()))
+        for name in ('max_age', 's_maxage'):
+            if directives.get(name, seconds) > seconds:
+                directives[name] = seconds
+                # Past the boundary a stale copy is a wrong copy.
+                directives.pop('stale_while_revalidate', None)
+                directives.pop('stale_if_error', None)
+    return directives
+
+
+def edge_cache(policy):
+    """Apply EDGE_CACHE_POLICIES[policy] to the view's successful GET responses."""
+    def decorator(view):
+        @functools.wraps(view)
+        def wrapped(request, *args, **kwargs):
+            response = view(request, *args, **kwargs)
+            if (
+                settings.EDGE_CACHE_ENABLED
+                and request.method in ('GET', 'HEAD')
+                and response.status_code == 200
+                and not response.has_header('Cache-Control')
+                and not response.cookies
+            ):
+                directives = _directives(policy, getattr(response, 'edge_expires', None))
+                patch_cache_control(response, public=True, **directives)
+            return response
+        return wrapped
+    return decorator
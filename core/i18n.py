@@ -0,0 +1,53 @@
+"""
+Language negotiation for the public pages and the API.
+
+LanguageMiddleware is Django's LocaleMiddleware (responses get Vary:
+Accept-Language and Content-Language) with the language taken from the
+URL or the request headers only:
+
+  1. ?lang=<code>, which the language switcher on /menu/ adds and API
+     clients can send without setting headers;
+  2. otherwise Accept-Language, then settings.LANGUAGE_CODE.
+
+The language cookie and the session are not read, and nothing is written
+back: every input is part of the CDN's cache key (the URL, or the
+Accept-Language it varies on), so the public responses stay cacheable,
+cookie-free and compressible (core/edge.py, core/compression.py).
+
+The menu itself is translated ahead of time: menu.snapshot keeps one
+live snapshot per language, chosen with the active language.
+"""
+from django.conf import settings
+from django.middleware.locale import LocaleMiddleware
+from django.utils import translation
+from django.utils.translation.trans_real import parse_accept_lang_header
+
+LANGUAGE_PARAM = 'lang'
+
+
+def requested_language(request):
+    """The supported language named in ?lang=, or None."""
+    code = request.GET.get(LANGUAGE_PARAM, '').lower()
+    if code in dict(settings.LANGUAGES):
+        return code
+    return None
+
+
+def accepted_language(request):
+    """The best supported language in Accept-Language, else LANGUAGE_CODE."""
+    for code, _ in parse_accept_lang_header(request.META.get('HTTP_ACCEPT_LANGUAGE', '')):
+        if code == '*':
+            break
+        try:
+            return translation.get_supported_language_variant(code)
+        except LookupError:
+            continue
+    return settings.LANGUAGE_CODE
+
+
+class LanguageMiddleware(LocaleMiddleware):
+    """Place before CommonMiddleware."""
+
+    def process_request(self, request):
+        translation.activate(requested_language(request) or accepted_language(request))
+        request.LANGUAGE_CODE = translation.get_language()
@@ -0,0 +1,40 @@
+"""
+Jinja2 environment for the ported public templates in jinja2/.
+
+Optional: the engine is only configured when jinja2 is installed, and a
+view only uses it when its URL name is listed in settings.JINJA2_VIEWS
+(see core.rendering.render_public). Compiled templates are cached on
+disk in JINJA2_BYTECODE_DIR, so a fresh worker loads bytecode instead of
+re-parsing every template.
+"""
+import os
+
+from django.templatetags.static import static
+from django.template.defaultfilters import floatformat, pluralize
+from django.urls import reverse
+from django.utils import timezone
+from django.utils.translation import get_language
+from jinja2 import Environment, FileSystemBytecodeCache
+
+
+def url(viewname, *args, **kwargs):
+    return reverse(viewname, args=args or None, kwargs=kwargs or None)
+
+
+def environment(bytecode_cache_dir=None, **options):
+    if bytecode_cache_dir:
+        os.makedirs(bytecode_cache_dir, exist_ok=True)
+        options['bytecode_cache'] = FileSystemBytecodeCache(bytecode_cache_dir)
+    env = Environment(**options)
+    env.globals.update({
+        'static':    static,
+        'url':       url,
+        'localtime': timezone.localtime,
+        'get_language': get_language,
+    })
+    # Django's own filters, so numbers and plurals render exactly alike.
+    env.filters.update({
+        'floatformat': floatformat,
+        'pluralize':   pluralize,
+    })
+    return env
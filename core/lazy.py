@@ -0,0 +1,35 @@
+"""
+Lazily imported views.
+
+URLconfs are imported as soon as anything calls reverse() — i.e. on the
+very first page render — so a plain `from x.views import y` in urls.py
+pulls DRF and SimpleJWT into every cold-started worker before it can
+serve the home page. lazy_view() defers that import to the first request
+that actually hits the route.
+"""
+from django.utils.module_loading import import_string
+from django.views.decorators.csrf import csrf_exempt
+
+
+def lazy_view(dotted_path, csrf=True, **initkwargs):
+    """
+    Return a view that imports `dotted_path` on first call.
+
+    Class-based views are resolved with .as_view(**initkwargs). Pass
+    csrf=False for views that are CSRF-exempt once loaded (all DRF
+    views): CsrfViewMiddleware inspects the URL's callback before the
+    real view exists, so the wrapper has to carry the flag itself.
+    """
+    resolved = None
+
+    def view(request, *args, **kwargs):
+        nonlocal resolved
+        if resolved is None:
+            target = import_string(dotted_path)
+            resolved = target.as_view(**initkwargs) if hasattr(target, 'as_view') else target
+        return resolved(request, *args, **kwargs)
+
+    view.__name__ = dotted_path.rpartition('.')[2]
+    view.__qualname__ = view.__name__
+    view.__module__ = dotted_path.rpartition('.')[0]
+    return view if csrf else csrf_exempt(view)
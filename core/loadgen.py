@@ -0,0 +1,183 @@
+"""
+Minimal HTTP/1.1 load-generation toolkit used by `manage.py loadtest` and
+`manage.py measure_gunicorn`.
+
+Only the standard library is used: an asyncio keep-alive client that
+speaks just enough HTTP/1.1 (Content-Length and chunked bodies), latency
+statistics with a fixed log-scale histogram, and helpers to start a
+local gunicorn / uvicorn process on a free port.
+"""
+import asyncio
+import os
+import signal
+import socket
+import subprocess
+import sys
+import time
+from collections import Counter, defaultdict
+
+from django.conf import settings
+
+HISTOGRAM_BOUNDS_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000)
+
+
+# ---------------------------------------------------------------------------
+# Local server
+# ---------------------------------------------------------------------------
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def wait_for_port(port, timeout=30):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=0.5).close()
+            return True
+        except OSError:
+            time.sleep(0.2)
+    return False
+
+
+def start_server(kind, port, env_overrides=None, quiet=True):
+    """Start gunicorn (with gunicorn.conf.py) or uvicorn on 127.0.0.1:port."""
+    env = {**os.environ, **(env_overrides or {}), "PORT": str(port)}
+    if kind == "uvicorn":
+        cmd = [sys.executable, "-m", "uvicorn", "dilli_da_dhaba.asgi:application",
+               "--host", "127.0.0.1", "--port", str(port), "--no-access-log"]
+    else:
+        cmd = [sys.executable, "-m", "gunicorn", "dilli_da_dhaba.wsgi",
+               "-c", "gunicorn.conf.py", "--access-logfile", "/dev/null"]
+    output = subprocess.DEVNULL if quiet else None
+    return subprocess.Popen(cmd, cwd=settings.BASE_DIR, env=env,
+                            stdout=output, stderr=output)
+
+
+def stop_server(proc):
+    proc.send_signal(signal.SIGTERM)
+    try:
+        proc.wait(timeout=30)
+    except subprocess.TimeoutExpired:
+        proc.kill()
+
+
+# ---------------------------------------------------------------------------
+# Client
+# ---------------------------------------------------------------------------
+class HTTPConnection:
+    """One keep-alive HTTP/1.1 connection driven by asyncio streams."""
+
+    def __init__(self, host, port, extra_headers=None):
+        self.host, self.port = host, port
+        self.extra_headers = extra_headers or {}
+        self.reader = self.writer = None
+
+    async def close(self):
+        if self.writer is not None:
+            self.writer.close()
+            try:
+                await self.writer.wait_closed()
+            except OSError:
+                pass
+        self.reader = self.writer = None
+
+    async def request(self, method, path, body=b"", headers=None):
+        """Return (status, headers, body). Reconnects once on a stale socket."""
+        for attempt in (1, 2):
+            if self.writer is None:
+                self.reader, self.writer = await asyncio.open_connection(self.host, self.port)
+            try:
+                return await self._roundtrip(method, path, body, headers or {})
+            except (ConnectionError, asyncio.IncompleteReadError):
+                await self.close()
+                if attempt == 2:
+                    raise
+
+    async def _roundtrip(self, method, path, body, headers):
+        lines = [f"{method} {path} HTTP/1.1", f"Host: {self.host}",
+                 f"Content-Length: {len(body)}"]
+        lines += [f"{k}: {v}" for k, v in {**self.extra_headers, **headers}.items()]
+        self.writer.write(("\r\n".join(lines) + "\r\n\r\n").encode("latin-1") + body)
+        await self.writer.drain()
+
+        status_line = await self.reader.readuntil(b"\r\n")
+        if not status_line:
+            raise ConnectionError("server closed connection")
+        status = int(status_line.split()[1])
+
+        response_headers = {}
+        while True:
+            line = await self.reader.readuntil(b"\r\n")
+            if line == b"\r\n":
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            response_headers[name.strip().lower()] = value.strip()
+
+        if response_headers.get("transfer-encoding", "").lower() == "chunked":
+            chunks = []
+            while True:
+                size = int((await self.reader.readuntil(b"\r\n")).split(b";")[0], 16)
+                if size == 0:
+                    await self.reader.readuntil(b"\r\n")
+                    break
+                chunks.append(await self.reader.readexactly(size))
+                await self.reader.readexactly(2)
+            payload = b"".join(chunks)
+        else:
+            payload = await self.reader.readexactly(int(response_headers.get("content-length", 0)))
+
+        if response_headers.get("connection", "").lower() == "close":
+            await self.close()
+        return status, response_headers, payload
+
+
+# ---------------------------------------------------------------------------
+# Statistics
+# ---------------------------------------------------------------------------
+class StepStats:
+    def __init__(self):
+        self.latencies = []
+        self.statuses  = Counter()
+        self.errors    = 0
+        self.bytes     = 0
+
+    def record(self, latency_ms, status=None, size=0):
+        if status is None:
+            self.errors += 1
+            return
+        self.latencies.append(latency_ms)
+        self.statuses[status] += 1
+        self.bytes += size
+
+    @property
+    def count(self):
+        return len(self.latencies) + self.errors
+
+    def percentile(self, pct):
+        if not self.latencies:
+            return 0.0
+        ordered = sorted(self.latencies)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+    def histogram(self):
+        buckets = Counter()
+        for latency in self.latencies:
+            for bound in HISTOGRAM_BOUNDS_MS:
+                if latency <= bound:
+                    buckets[bound] += 1
+                    break
+            else:
+                buckets[float("inf")] += 1
+        return buckets
+
+
+class Recorder:
+    """StepStats per (phase, step name)."""
+
+    def __init__(self):
+        self.steps = defaultdict(StepStats)
+
+    def __getitem__(self, key):
+        return self.steps[key]
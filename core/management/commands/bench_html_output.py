@@ -0,0 +1,83 @@
+"""
+Management command: bench_html_output
+
+Usage:
+    python manage.py bench_html_output
+    python manage.py bench_html_output -n 500 --path /menu/?category=all
+
+Measures what core.compression.HTMLCompressionMiddleware does to the
+public pages: bytes on the wire (as rendered, minified, gzip, brotli)
+and CPU per request — rendering the view, then the middleware on a cache
+miss (minify + compress) and on a hit (hash + lookup). Views are called
+directly, without an HTTP server.
+"""
+import statistics
+import time
+
+from django.core.management.base import BaseCommand
+from django.http import HttpResponse
+from django.test import RequestFactory
+from django.urls import resolve
+
+from core import compression
+from core.compression import HTMLCompressionMiddleware
+
+PAGES = ["/", "/menu/", "/menu/?category=all", "/about/", "/contact/"]
+
+
+def _cpu_ms(call, repeat):
+    timings = []
+    for _ in range(repeat):
+        started = time.process_time()
+        call()
+        timings.append((time.process_time() - started) * 1000)
+    return statistics.median(timings)
+
+
+class Command(BaseCommand):
+    help = "Benchmark HTML minification and compression: bytes and CPU per request."
+
+    def add_arguments(self, parser):
+        parser.add_argument("-n", "--requests", type=int, default=200)
+        parser.add_argument("--path", action="append", dest="paths",
+                            help="Page to measure (repeatable; default: all public pages).")
+
+    def handle(self, *args, **options):
+        factory = RequestFactory()
+        repeat = options["requests"]
+        encodings = ["gzip"] + (["br"] if compression.brotli is not None else [])
+
+        self.stdout.write(
+            f"\n  {'page':<22}{'rendered':>10}{'minified':>10}"
+            + "".join(f"{e:>8}" for e in encodings)
+            + f"   {'CPU ms: render':>15}{'miss':>8}{'hit':>8}"
+        )
+        for path in options["paths"] or PAGES:
+            request = factory.get(path)
+            request.resolver_match = match = resolve(request.path)
+            render = lambda: match.func(request, *match.args, **match.kwargs)
+            raw = render().content
+
+            def respond(_request):
+                return HttpResponse(raw, content_type="text/html; charset=utf-8")
+
+            middleware = HTMLCompressionMiddleware(respond)
+            sizes, miss, hit = {}, {}, {}
+            for encoding in ["identity"] + encodings:
+                req = factory.get(path, HTTP_ACCEPT_ENCODING=encoding)
+                sizes[encoding] = len(middleware(req).content)
+
+                def cold():
+                    middleware.cache.clear()
+                    middleware(req)
+
+                miss[encoding] = _cpu_ms(cold, repeat)
+                hit[encoding] = _cpu_ms(lambda: middleware(req), repeat)
+
+            best = encodings[-1]
+            self.stdout.write(
+                f"  {path:<22}{len(raw):>10}{sizes['identity']:>10}"
+                + "".join(f"{sizes[e]:>8}" for e in encodings)
+                + f"   {_cpu_ms(render, repeat):>15.2f}{miss[best]:>8.2f}{hit[best]:>8.3f}"
+            )
+        self.stdout.write(f"\n  miss / hit columns are for {best}; bytes are the response body.")
@@ -0,0 +1,229 @@
+"""
+Management command: compare_templates
+
+Usage:
+    python manage.py compare_templates                  # verify, then benchmark
+    python manage.py compare_templates --verify-only
+    python manage.py compare_templates --items 2000 -n 200
+
+Checks that the Jinja2 ports in jinja2/ render the same pages as the
+Django templates in templates/, then times both engines.
+
+Verification renders /, /about/, /contact/ and /menu/ (a few filters)
+through the real views, once per engine, plus the menu card grid for a
+synthetic item list full of characters that need escaping. Outputs are
+compared after collapsing whitespace and decoding HTML entities (Django
+writes ' as &#x27;, Jinja2 as &#39;). Any difference fails the command.
+
+The benchmark renders the home page with 8 featured dishes and 6
+testimonials and a menu page with --items synthetic dishes, and times
+loading home.html in a fresh engine (the Jinja2 one with an empty and a
+warm bytecode cache).
+"""
+import difflib
+import html
+import re
+import statistics
+import tempfile
+import time
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.management.base import BaseCommand, CommandError
+from django.template import engines
+from django.template.backends.django import DjangoTemplates
+from django.template.backends.jinja2 import Jinja2
+from django.template.loader import render_to_string
+from django.test import RequestFactory, override_settings
+from django.urls import resolve
+from django.utils import timezone
+
+from core.rendering import DJANGO_ENGINE, JINJA2_ENGINE
+from menu import fragments
+from menu.snapshot import get_live_snapshot
+from reviews.models import Review
+
+PAGES = ["/", "/about/", "/contact/", "/menu/", "/menu/?category=all&diet=veg"]
+PUBLIC_VIEWS = ["home", "about", "contact", "menu"]
+
+
+def _normalize(content):
+    return re.sub(r"\s+", " ", html.unescape(content)).strip()
+
+
+def _synthetic_items(count):
+    return [
+        {
+            "id": n,
+            "name": f"Dal & Chawal <No. {n}> \"Chef's\"",
+            "description": "Slow-cooked overnight; served with 'pyaaz' & achaar" if n % 2 else "",
+            "category": n % 12,
+            "category_name": f"Category {n % 12}",
+            "veg": n % 3 != 0,
+            "egg": n % 7 == 0,
+            "price_regular": None if n % 4 == 0 else f"{100 + n % 300}.00",
+            "price_half": f"{90 + n % 50}.00" if n % 4 == 0 else None,
+            "price_full": f"{160 + n % 90}.00" if n % 4 == 0 else None,
+            "display_price": f"₹{100 + n % 300}",
+            "has_half_full": n % 4 == 0,
+            "image_url": f"/media/menu/dish-{n}.3f2a9c1b7d4e.jpg" if n % 5 else None,
+            "featured": n % 10 == 0,
+            "is_available": True,
+        }
+        for n in range(count)
+    ]
+
+
+class Command(BaseCommand):
+    help = "Verify the Jinja2 template ports match the Django templates and benchmark both."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--verify-only", action="store_true")
+        parser.add_argument("--items", type=int, default=1000,
+                            help="Dishes on the synthetic menu page.")
+        parser.add_argument("-n", "--renders", type=int, default=100)
+
+    def handle(self, *args, **options):
+        if JINJA2_ENGINE not in {e.name for e in engines.all()}:
+            raise CommandError("The Jinja2 engine is not configured — pip install jinja2.")
+        self.factory = RequestFactory()
+
+        failures = self._verify()
+        if failures:
+            raise CommandError(f"{failures} page(s) render differently")
+        self.stdout.write(self.style.SUCCESS("  ✔  Jinja2 ports render the same as the Django templates"))
+        if not options["verify_only"]:
+            self._bench(options["items"], options["renders"])
+
+    # ------------------------------------------------------------------
+    def _render_view(self, path, engine):
+        request = self.factory.get(path)
+        request.resolver_match = resolve(request.path)
+        jinja2_views = PUBLIC_VIEWS if engine == JINJA2_ENGINE else []
+        with override_settings(JINJA2_VIEWS=jinja2_views):
+            self._forget_fragments(request)
+            response = request.resolver_match.func(request)
+        assert response.status_code == 200, (path, response.status_code)
+        return response.content.decode()
+
+    def _forget_fragments(self, request):
+        # Both engines would otherwise share the cached card grid.
+        snapshot_id, payload = get_live_snapshot()
+        category, diet = fragments.resolve_filters(request.GET, payload["categories"])
+        caches[settings.MENU_FRAGMENT_CACHE_ALIAS].delete(
+            fragments.cache_key(snapshot_id, category, diet, payload["segment"])
+        )
+
+    def _verify(self):
+        outputs = [
+            (path, self._render_view(path, DJANGO_ENGINE), self._render_view(path, JINJA2_ENGINE))
+            for path in PAGES
+        ]
+        items = {"items": _synthetic_items(40)}
+        outputs.append((
+            "menu/_cards.html (synthetic)",
+            render_to_string("menu/_cards.html", items, using=DJANGO_ENGINE),
+            render_to_string("menu/_cards.html", items, using=JINJA2_ENGINE),
+        ))
+        _, payload = get_live_snapshot()
+        outputs.append((
+            "menu/_counts.html",
+            fragments.render_counts(payload["categories"], "all", "veg", using=DJANGO_ENGINE),
+            fragments.render_counts(payload["categories"], "all", "veg", using=JINJA2_ENGINE),
+        ))
+
+        failures = 0
+        for label, django_out, jinja_out in outputs:
+            a, b = _normalize(django_out), _normalize(jinja_out)
+            if a == b:
+                self.stdout.write(f"  same  {label}")
+                continue
+            failures += 1
+            self.stdout.write(self.style.ERROR(f"  DIFF  {label}"))
+            diff = difflib.unified_diff(
+                a.replace("> <", ">\n<").splitlines(), b.replace("> <", ">\n<").splitlines(),
+                "django", "jinja2", lineterm="", n=1,
+            )
+            for line in list(diff)[:20]:
+                self.stdout.write(f"        {line}")
+        return failures
+
+    # ------------------------------------------------------------------
+    def _bench(self, item_count, renders):
+        request = self.factory.get("/")
+        request.resolver_match = resolve("/")
+        items = _synthetic_items(max(item_count, 8))
+        home = {
+            "featured_items": items[:8],
+            "testimonials": [
+                Review(reviewer_name=f"Guest {n}", rating=5 - n % 3, source="Google",
+                       body="Best butter chicken in Bengaluru, and the dal makhani is unreal.",
+                       created_at=timezone.now())
+                for n in range(6)
+            ],
+            "review_summary": {"count": 1284, "average": 4.63},
+        }
+        categories = [
+            {"id": n, "name": f"Category {n}", "display_order": n,
+             "counts": {"all": 12, "veg": 6, "egg": 2, "nonveg": 4}}
+            for n in range(12)
+        ]
+        menu = {
+            **fragments.pill_context(categories, "all", "all"),
+            "active_category": "all",
+            "active_diet": "all",
+            "outlet": "",
+        }
+
+        self.stdout.write(f"\n  Render time, p50 of {renders}   {'django':>10} {'jinja2':>10}")
+        self._row("home (8 dishes, 6 reviews)", {
+            engine: lambda e=engine: engines[e].get_template("core/home.html").render(home, request)
+            for engine in (DJANGO_ENGINE, JINJA2_ENGINE)
+        }, renders)
+
+        def menu_page(engine):
+            cards = render_to_string("menu/_cards.html", {"items": items[:item_count]}, using=engine)
+            context = {**menu, "cards": fragments.mark_safe(cards)}
+            return engines[engine].get_template("menu/menu.html").render(context, request)
+
+        self._row(f"menu ({item_count} dishes)", {
+            engine: lambda e=engine: menu_page(e) for engine in (DJANGO_ENGINE, JINJA2_ENGINE)
+        }, renders)
+        self._bench_load()
+
+    def _row(self, label, calls, renders):
+        medians = {}
+        for engine, call in calls.items():
+            call()   # warm the template loaders
+            timings = []
+            for _ in range(renders):
+                started = time.perf_counter()
+                call()
+                timings.append((time.perf_counter() - started) * 1000)
+            medians[engine] = statistics.median(timings)
+        self.stdout.write(
+            f"  {label:<32}{medians[DJANGO_ENGINE]:>8.2f} ms{medians[JINJA2_ENGINE]:>8.2f} ms"
+            f"   ({medians[DJANGO_ENGINE] / medians[JINJA2_ENGINE]:.1f}×)"
+        )
+
+    def _bench_load(self):
+        """First load of home.html (and its base/partials) in a brand-new engine."""
+        def fresh(backend, params, options=None):
+            started = time.perf_counter()
+            backend({"NAME": "fresh", "APP_DIRS": False, "OPTIONS": options or {}, **params}) \
+                .get_template("core/home.html")
+            return (time.perf_counter() - started) * 1000
+
+        by_name = {t.get("NAME"): t for t in settings.TEMPLATES}
+        django_dirs = {"DIRS": by_name[DJANGO_ENGINE]["DIRS"]}
+        jinja_dirs = {"DIRS": by_name[JINJA2_ENGINE]["DIRS"]}
+        with tempfile.TemporaryDirectory() as bytecode_dir:
+            options = {"environment": "core.jinja2.environment", "bytecode_cache_dir": bytecode_dir}
+            jinja_cold = fresh(Jinja2, jinja_dirs, options)
+            jinja_warm = fresh(Jinja2, jinja_dirs, options)
+        django_s = fresh(DjangoTemplates, django_dirs)
+
+        self.stdout.write("\n  First load of core/home.html in a fresh engine")
+        self.stdout.write(f"    django                          {django_s:>8.2f} ms")
+        self.stdout.write(f"    jinja2, empty bytecode cache    {jinja_cold:>8.2f} ms")
+        self.stdout.write(f"    jinja2, warm bytecode cache     {jinja_warm:>8.2f} ms")
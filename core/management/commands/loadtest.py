@@ -0,0 +1,221 @@
+"""
+Management command: loadtest
+
+Usage:
+    python manage.py loadtest                              # browse, gunicorn, 20 users, 30 s
+    python manage.py loadtest --scenario api --users 50 --duration 60
+    python manage.py loadtest --server uvicorn
+    python manage.py loadtest --server none --port 8000    # an already running server
+    python manage.py loadtest --scenario login-flood --flood-users 20
+    python manage.py loadtest --scenario api --no-throttle
+
+Drives a locally started gunicorn (via gunicorn.conf.py) or uvicorn with
+an asyncio HTTP/1.1 client — real sockets, keep-alive, WhiteNoise and
+worker saturation included, no network beyond 127.0.0.1.
+
+Scenarios (each virtual user loops until the time is up):
+  browse       /  →  /menu/  →  a few filter clicks on
+               /api/menu?category=..&diet=.., mirroring menuApp in
+               templates/menu/menu.html
+  api          filter clicks on /api/menu only
+  static       /static/css/styles.css + /static/js/main.js (WhiteNoise)
+  login-flood  browse for the first half; in the second half
+               --flood-users also hammer POST /api/auth/token/ with bad
+               credentials. Compare the two phases' menu latency.
+
+Reports requests/sec, latency percentiles and histogram, error rate and
+429 (throttled) responses per step.
+
+Every virtual user connects from 127.0.0.1, so they all share one
+anonymous rate-limit bucket (120/min) and the api and browse scenarios
+are mostly answered with 429s. --no-throttle starts the server with
+ANON_THROTTLE_RATE='' (the login throttles stay on); steps where 429s
+are the majority are flagged in the report, since their figures
+measure the throttle rather than the view.
+"""
+import asyncio
+import json
+import random
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from core.loadgen import (
+    HISTOGRAM_BOUNDS_MS,
+    HTTPConnection,
+    Recorder,
+    free_port,
+    start_server,
+    stop_server,
+    wait_for_port,
+)
+
+DIETS = (None, "veg", "egg", "nonveg")
+
+
+class Command(BaseCommand):
+    help = "End-to-end HTTP load test against a local gunicorn/uvicorn server."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--scenario", default="browse",
+                            choices=["browse", "api", "static", "login-flood"])
+        parser.add_argument("--users", type=int, default=20, help="Concurrent virtual users.")
+        parser.add_argument("--duration", type=float, default=30.0, help="Seconds of load.")
+        parser.add_argument("--think-ms", type=float, default=0.0,
+                            help="Pause between a user's requests.")
+        parser.add_argument("--clicks", type=int, default=3,
+                            help="Filter clicks per browse iteration.")
+        parser.add_argument("--flood-users", type=int, default=10,
+                            help="Concurrent login attackers (login-flood only).")
+        parser.add_argument("--server", default="gunicorn",
+                            choices=["gunicorn", "uvicorn", "none"])
+        parser.add_argument("--port", type=int, help="Port of an existing server (--server none).")
+        parser.add_argument("--no-throttle", action="store_true",
+                            help="Start the server without the anonymous rate limit.")
+
+    def handle(self, *args, **options):
+        if options["server"] == "none":
+            if not options["port"]:
+                raise CommandError("--server none needs --port")
+            if options["no_throttle"]:
+                raise CommandError("--no-throttle needs a server started by loadtest")
+            port, proc = options["port"], None
+        else:
+            port = free_port()
+            overrides = {"ANON_THROTTLE_RATE": ""} if options["no_throttle"] else None
+            proc = start_server(options["server"], port, overrides)
+            if not wait_for_port(port):
+                stop_server(proc)
+                raise CommandError(f"{options['server']} did not start listening in time")
+        try:
+            recorder, elapsed = asyncio.run(self._run(port, options))
+        finally:
+            if proc is not None:
+                stop_server(proc)
+        self._report(recorder, elapsed)
+
+    # ------------------------------------------------------------------
+    async def _run(self, port, options):
+        headers = {"X-Forwarded-Proto": "https", "Accept": "*/*"}
+        probe = HTTPConnection("127.0.0.1", port, headers)
+        status, _, body = await probe.request("GET", "/api/categories")
+        await probe.close()
+        category_ids = [c["id"] for c in json.loads(body)] if status == 200 else []
+
+        recorder = Recorder()
+        scenario = options["scenario"]
+        duration = options["duration"]
+        start = time.monotonic()
+
+        if scenario == "login-flood":
+            half = start + duration / 2
+            end  = start + duration
+            users = [self._user("browse", port, headers, recorder, category_ids, options,
+                                until=end, phase_switch=half)
+                     for _ in range(options["users"])]
+            flood = [self._flooder(port, headers, recorder, start_at=half, until=end)
+                     for _ in range(options["flood_users"])]
+            await asyncio.gather(*users, *flood)
+        else:
+            end = start + duration
+            await asyncio.gather(*[
+                self._user(scenario, port, headers, recorder, category_ids, options, until=end)
+                for _ in range(options["users"])
+            ])
+        return recorder, time.monotonic() - start
+
+    def _steps(self, scenario, category_ids, clicks):
+        if scenario == "static":
+            return [("static css", "/static/css/styles.css"),
+                    ("static js", "/static/js/main.js")]
+        steps = [] if scenario == "api" else [("home", "/"), ("menu page", "/menu/")]
+        for _ in range(clicks):
+            params = []
+            category = random.choice([None] + category_ids)
+            diet = random.choice(DIETS)
+            if category is not None:
+                params.append(f"category={category}")
+            if diet is not None:
+                params.append(f"diet={diet}")
+            steps.append(("api menu filter", "/api/menu?" + "&".join(params)))
+        return steps
+
+    async def _user(self, scenario, port, headers, recorder, category_ids, options,
+                    until, phase_switch=None):
+        conn = HTTPConnection("127.0.0.1", port, headers)
+        think = options["think_ms"] / 1000
+        try:
+            while time.monotonic() < until:
+                for name, path in self._steps(scenario, category_ids, options["clicks"]):
+                    if time.monotonic() >= until:
+                        break
+                    phase = ""
+                    if phase_switch is not None:
+                        phase = "flood: " if time.monotonic() >= phase_switch else "calm:  "
+                    await self._timed(conn, recorder[phase + name], "GET", path)
+                    if think:
+                        await asyncio.sleep(think)
+        finally:
+            await conn.close()
+
+    async def _flooder(self, port, headers, recorder, start_at, until):
+        await asyncio.sleep(max(0.0, start_at - time.monotonic()))
+        conn = HTTPConnection("127.0.0.1", port, {**headers, "Content-Type": "application/json"})
+        try:
+            while time.monotonic() < until:
+                body = json.dumps({
+                    "username": f"attacker{random.randrange(10 ** 6)}",
+                    "password": "not-the-password",
+                }).encode()
+                await self._timed(conn, recorder["flood: login attempt"], "POST",
+                                  "/api/auth/token/", body)
+        finally:
+            await conn.close()
+
+    async def _timed(self, conn, stats, method, path, body=b""):
+        started = time.perf_counter()
+        try:
+            status, _, payload = await conn.request(method, path, body)
+        except (OSError, asyncio.IncompleteReadError, ValueError):
+            stats.record(0, None)
+            await conn.close()
+            return
+        stats.record((time.perf_counter() - started) * 1000, status, len(payload))
+
+    # ------------------------------------------------------------------
+    def _report(self, recorder, elapsed):
+        total = sum(s.count for s in recorder.steps.values())
+        self.stdout.write(f"\n  {total} requests in {elapsed:.1f} s — {total / elapsed:.1f} req/s (latencies in ms)\n")
+        self.stdout.write(
+            f"  {'step':<30}{'count':>8}{'req/s':>9}{'p50':>9}{'p90':>9}{'p99':>9}"
+            f"{'max':>9}{'errors':>8}{'429s':>7}{'5xx':>6}"
+        )
+        throttled = []
+        for name in sorted(recorder.steps):
+            s = recorder[name]
+            fivexx = sum(n for code, n in s.statuses.items() if code >= 500)
+            if s.statuses[429] * 2 > s.count and "login attempt" not in name:
+                throttled.append(name)
+            self.stdout.write(
+                f"  {name:<30}{s.count:>8}{s.count / elapsed:>9.1f}"
+                f"{s.percentile(50):>9.1f}{s.percentile(90):>9.1f}{s.percentile(99):>9.1f}"
+                f"{max(s.latencies, default=0):>9.1f}{s.errors:>8}{s.statuses[429]:>7}{fivexx:>6}"
+            )
+        if throttled:
+            self.stdout.write(self.style.WARNING(
+                f"\n  ⚠  Mostly 429s in: {', '.join(throttled)}. These figures measure the rate "
+                f"limiter, not the view; re-run with --no-throttle."
+            ))
+
+        self.stdout.write("\n  Latency histogram (ms, all steps)")
+        combined = {}
+        for s in recorder.steps.values():
+            for bound, n in s.histogram().items():
+                combined[bound] = combined.get(bound, 0) + n
+        peak = max(combined.values(), default=1)
+        lower = 0
+        for bound in (*HISTOGRAM_BOUNDS_MS, float("inf")):
+            n = combined.get(bound, 0)
+            label = f"> {lower}" if bound == float("inf") else f"{lower}–{bound}"
+            self.stdout.write(f"  {label:>11} {n:>8}  {'█' * round(40 * n / peak)}")
+            lower = bound
@@ -0,0 +1,158 @@
+"""
+Management command: measure_gunicorn
+
+Usage:
+    python manage.py measure_gunicorn
+    python manage.py measure_gunicorn --duration 20 --concurrency 16
+    python manage.py measure_gunicorn \\
+        --config "sync-1:WEB_CONCURRENCY=1,GUNICORN_WORKER_CLASS=sync" \\
+        --config "gthread-3x4:WEB_CONCURRENCY=3,GUNICORN_THREADS=4"
+
+Starts gunicorn with gunicorn.conf.py once per configuration (each one a
+set of environment overrides), drives it from localhost with keep-alive
+client threads, and reports requests/sec plus per-worker memory:
+RSS, and PSS (proportional share, which shows copy-on-write sharing
+from preload_app).
+"""
+import http.client
+import threading
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from core.loadgen import free_port, start_server, stop_server, wait_for_port
+
+DEFAULT_CONFIGS = [
+    "sync-1-nopreload:WEB_CONCURRENCY=1,GUNICORN_WORKER_CLASS=sync,GUNICORN_PRELOAD=false",
+    "auto-nopreload:GUNICORN_PRELOAD=false",
+    "auto-preload:GUNICORN_PRELOAD=true",
+]
+
+
+def _parse_config(spec):
+    name, _, overrides = spec.partition(":")
+    env = {}
+    for pair in filter(None, overrides.split(",")):
+        key, _, value = pair.partition("=")
+        env[key.strip()] = value.strip()
+    return name, env
+
+
+def _worker_pids(master_pid):
+    try:
+        with open(f"/proc/{master_pid}/task/{master_pid}/children") as fh:
+            return [int(pid) for pid in fh.read().split()]
+    except OSError:
+        return []
+
+
+def _memory_kb(pid):
+    """Return (rss_kb, pss_kb) for a process, or (None, None) off Linux."""
+    rss = pss = None
+    try:
+        with open(f"/proc/{pid}/smaps_rollup") as fh:
+            for line in fh:
+                if line.startswith("Rss:"):
+                    rss = int(line.split()[1])
+                elif line.startswith("Pss:"):
+                    pss = int(line.split()[1])
+    except OSError:
+        pass
+    return rss, pss
+
+
+class Command(BaseCommand):
+    help = "Compare gunicorn configurations by requests/sec and per-worker memory."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--config", action="append", dest="configs",
+            help='"name:ENV=VALUE,ENV=VALUE" overrides for gunicorn.conf.py (repeatable).',
+        )
+        parser.add_argument("--paths", default="/,/menu/,/about/",
+                            help="Comma-separated paths to request in rotation.")
+        parser.add_argument("--duration", type=float, default=10.0,
+                            help="Seconds of load per configuration.")
+        parser.add_argument("--concurrency", type=int, default=8,
+                            help="Client threads (one keep-alive connection each).")
+
+    def handle(self, *args, **options):
+        paths   = [p.strip() for p in options["paths"].split(",") if p.strip()]
+        configs = [_parse_config(c) for c in (options["configs"] or DEFAULT_CONFIGS)]
+
+        results = []
+        for name, overrides in configs:
+            self.stdout.write(f"\n==> {name}  {overrides or ''}")
+            results.append((name, *self._measure(overrides, paths, options)))
+
+        self.stdout.write(
+            f"\n  {'config':<24}{'workers':>8}{'req/s':>10}{'errors':>8}"
+            f"{'RSS/worker':>13}{'PSS/worker':>13}"
+        )
+        for name, workers, rps, errors, rss, pss in results:
+            self.stdout.write(
+                f"  {name:<24}{workers:>8}{rps:>10.1f}{errors:>8}"
+                f"{_mb(rss):>13}{_mb(pss):>13}"
+            )
+
+    # ------------------------------------------------------------------
+    def _measure(self, overrides, paths, options):
+        port = free_port()
+        proc = start_server("gunicorn", port, overrides)
+        try:
+            if not wait_for_port(port):
+                raise CommandError("gunicorn did not start listening in time")
+
+            ok, errors = self._drive(port, paths, options["duration"], options["concurrency"])
+            pids   = _worker_pids(proc.pid)
+            memory = [_memory_kb(pid) for pid in pids]
+            rss    = _avg([m[0] for m in memory])
+            pss    = _avg([m[1] for m in memory])
+            return len(pids), ok / options["duration"], errors, rss, pss
+        finally:
+            stop_server(proc)
+
+    def _drive(self, port, paths, duration, concurrency):
+        counts   = {"ok": 0, "errors": 0}
+        lock     = threading.Lock()
+        deadline = time.monotonic() + duration
+        headers  = {"Host": "127.0.0.1", "X-Forwarded-Proto": "https"}
+
+        def client(offset):
+            conn = http.client.HTTPConnection("127.0.0.1", port, timeout=10)
+            ok = errors = 0
+            i = offset
+            while time.monotonic() < deadline:
+                try:
+                    conn.request("GET", paths[i % len(paths)], headers=headers)
+                    resp = conn.getresponse()
+                    resp.read()
+                    if resp.status < 400:
+                        ok += 1
+                    else:
+                        errors += 1
+                except (OSError, http.client.HTTPException):
+                    errors += 1
+                    conn.close()
+                    conn = http.client.HTTPConnection("127.0.0.1", port, timeout=10)
+                i += 1
+            conn.close()
+            with lock:
+                counts["ok"] += ok
+                counts["errors"] += errors
+
+        threads = [threading.Thread(target=client, args=(n,)) for n in range(concurrency)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        return counts["ok"], counts["errors"]
+
+
+def _avg(values):
+    values = [v for v in values if v is not None]
+    return sum(values) / len(values) if values else None
+
+
+def _mb(kb):
+    return "n/a" if kb is None else f"{kb / 1024:.1f} MB"
@@ -0,0 +1,82 @@
+"""
+Management command: query_report
+
+Usage:
+    python manage.py query_report
+    python manage.py query_report --sort p95 --limit 10
+    python manage.py query_report --max-age 3600     # workers seen in the last hour
+    python manage.py query_report --reset
+
+Lists the most expensive query fingerprints recorded by
+core.querylog.QueryLogMiddleware. Every worker on the instance flushes
+its table to QUERYLOG_DB_PATH; this merges them. Counts and times are
+summed, and p95 is taken over the workers' pooled recent samples. Each
+row shows the views that ran the query and its normalized SQL.
+
+Workers flush every QUERYLOG_FLUSH_SECONDS, so the newest queries may
+not be included yet. Nothing is recorded unless QUERYLOG_ENABLED is set
+(off by default).
+"""
+import textwrap
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from core import querylog
+
+SORT_KEYS = {
+    'total': 'total_ms',
+    'count': 'count',
+    'p95':   'p95_ms',
+    'mean':  'mean_ms',
+    'max':   'max_ms',
+}
+
+
+class Command(BaseCommand):
+    help = "Show the query fingerprints that cost the most time across workers."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--sort", choices=SORT_KEYS, default="total")
+        parser.add_argument("--limit", type=int, default=20)
+        parser.add_argument("--max-age", type=float, default=None,
+                            help="Ignore workers that have not flushed for this many seconds.")
+        parser.add_argument("--sql-width", type=int, default=160,
+                            help="Truncate SQL to this many characters (0 = full).")
+        parser.add_argument("--reset", action="store_true",
+                            help="Delete all stored statistics and exit.")
+
+    def handle(self, *args, **options):
+        store = querylog.get_store()
+        if options["reset"]:
+            store.clear()
+            self.stdout.write(self.style.SUCCESS("Query statistics cleared."))
+            return
+
+        rows = store.load(options["max_age"])
+        if not rows:
+            self.stdout.write(f"No query statistics in {settings.QUERYLOG_DB_PATH} yet.")
+            return
+
+        merged = querylog.merge(rows)
+        key = SORT_KEYS[options["sort"]]
+        top = sorted(merged.items(), key=lambda item: item[1][key], reverse=True)[:options["limit"]]
+        workers = len({worker for worker, _, _ in rows})
+        grand_total = sum(entry["total_ms"] for entry in merged.values()) or 1
+
+        self.stdout.write(
+            f"\n  {len(merged)} fingerprints from {workers} worker(s), sorted by {options['sort']}\n"
+        )
+        self.stdout.write(
+            f"  {'#':>3}{'total ms':>12}{'share':>7}{'count':>9}{'mean':>9}{'p95':>9}{'max':>9}"
+        )
+        for rank, (sql, entry) in enumerate(top, 1):
+            self.stdout.write(
+                f"  {rank:>3}{entry['total_ms']:>12.1f}{entry['total_ms'] / grand_total:>7.1%}"
+                f"{entry['count']:>9}{entry['mean_ms']:>9.2f}{entry['p95_ms']:>9.2f}{entry['max_ms']:>9.2f}"
+            )
+            if entry["views"]:
+                self.stdout.write(f"       views: {', '.join(sorted(entry['views']))}")
+            width = options["sql_width"]
+            shown = sql if not width or len(sql) <= width else sql[:width - 1] + "…"
+            self.stdout.write(textwrap.indent(textwrap.fill(shown, 100), "       "))
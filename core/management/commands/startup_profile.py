@@ -0,0 +1,122 @@
+"""
+Management command: startup_profile
+
+Usage:
+    python manage.py startup_profile                   # boot + GET /
+    python manage.py startup_profile --path /api/menu --top 30
+    python manage.py startup_profile --runs 5          # median of 5 boots
+
+Boots the WSGI application in a fresh interpreter with `-X importtime`,
+exactly as a cold gunicorn worker would, serves one request in-process,
+and reports:
+
+  * time to import + set up Django, and time to the first response
+  * the most expensive top-level imports (cumulative µs)
+  * self time grouped by top-level package
+  * which optional heavy modules (DRF, SimpleJWT, Pillow, admin) were
+    loaded by the time the first response was produced
+"""
+import json
+import os
+import statistics
+import subprocess
+import sys
+from collections import defaultdict
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+WATCHED_MODULES = [
+    "rest_framework.views",
+    "rest_framework_simplejwt.authentication",
+    "rest_framework_simplejwt.views",
+    "PIL.Image",
+    "django.contrib.admin.sites",
+    "corsheaders.middleware",
+]
+
+BOOT_SCRIPT = r"""
+import io, json, sys, time
+t0 = time.perf_counter()
+from dilli_da_dhaba.wsgi import application
+t1 = time.perf_counter()
+status = []
+environ = {
+    'REQUEST_METHOD': 'GET', 'PATH_INFO': sys.argv[1], 'QUERY_STRING': '',
+    'SERVER_NAME': '127.0.0.1', 'SERVER_PORT': '80', 'HTTP_HOST': '127.0.0.1',
+    'HTTP_X_FORWARDED_PROTO': 'https', 'REMOTE_ADDR': '127.0.0.1',
+    'wsgi.input': io.BytesIO(), 'wsgi.errors': sys.stderr,
+    'wsgi.url_scheme': 'http', 'wsgi.version': (1, 0),
+    'wsgi.multithread': False, 'wsgi.multiprocess': True, 'wsgi.run_once': False,
+}
+body = b''.join(application(environ, lambda s, h, e=None: status.append(s)))
+t2 = time.perf_counter()
+print(json.dumps({
+    'setup_ms': (t1 - t0) * 1000, 'first_response_ms': (t2 - t1) * 1000,
+    'status': status[0], 'bytes': len(body),
+    'loaded': [m for m in sys.argv[2:] if m in sys.modules],
+}))
+"""
+
+
+def _parse_importtime(stderr):
+    """Yield (self_us, cumulative_us, depth, name) from -X importtime output."""
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        _, self_us, cumulative, name = (part for part in line.replace("import time:", "|", 1).split("|"))
+        depth = (len(name) - len(name.lstrip())) // 2
+        yield int(self_us), int(cumulative), depth, name.strip()
+
+
+class Command(BaseCommand):
+    help = "Profile worker cold start: import costs and time to first response."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--path", default="/", help="Path of the first request.")
+        parser.add_argument("--top", type=int, default=20, help="Rows per table.")
+        parser.add_argument("--runs", type=int, default=1,
+                            help="Boot this many times and report medians.")
+
+    def handle(self, *args, **options):
+        runs = [self._boot(options["path"]) for _ in range(max(1, options["runs"]))]
+        result, imports = runs[-1]
+
+        setup_ms = statistics.median(r["setup_ms"] for r, _ in runs)
+        first_ms = statistics.median(r["first_response_ms"] for r, _ in runs)
+        self.stdout.write(
+            f"\n  GET {options['path']} → {result['status']} ({result['bytes']} bytes)"
+            f"\n  Django import + setup : {setup_ms:8.1f} ms"
+            f"\n  First response        : {first_ms:8.1f} ms"
+            f"\n  Time to first byte    : {setup_ms + first_ms:8.1f} ms"
+            f"  (median of {len(runs)})\n"
+        )
+
+        top_level = sorted((i for i in imports if i[2] == 0), key=lambda i: -i[1])
+        self.stdout.write(f"  {'cumulative':>12}  top-level import")
+        for _, cumulative, _, name in top_level[:options["top"]]:
+            self.stdout.write(f"  {cumulative / 1000:>9.1f} ms  {name}")
+
+        by_package = defaultdict(int)
+        for self_us, _, _, name in imports:
+            by_package[name.split(".")[0]] += self_us
+        self.stdout.write(f"\n  {'self time':>12}  package")
+        for name, self_us in sorted(by_package.items(), key=lambda kv: -kv[1])[:options["top"]]:
+            self.stdout.write(f"  {self_us / 1000:>9.1f} ms  {name}")
+
+        self.stdout.write("\n  Loaded before first response:")
+        for module in WATCHED_MODULES:
+            mark = "yes" if module in result["loaded"] else "no (lazy)"
+            self.stdout.write(f"    {module:<42} {mark}")
+
+    def _boot(self, path):
+        proc = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", BOOT_SCRIPT, path, *WATCHED_MODULES],
+            cwd=settings.BASE_DIR,
+            env={**os.environ, "PYTHONDONTWRITEBYTECODE": "1"},
+            capture_output=True, text=True,
+        )
+        if proc.returncode != 0:
+            raise CommandError(proc.stderr[-2000:])
+        result = json.loads(proc.stdout.strip().splitlines()[-1])
+        return result, list(_parse_importtime(proc.stderr))
@@ -0,0 +1,194 @@
+"""
+Production view for files under MEDIA_ROOT (uploaded menu photos).
+
+Files saved by core.storage.HashedMediaStorage carry a content hash in
+their name, so they are sent with a one-year `immutable` Cache-Control
+and the hash as a strong ETag: browsers and any CDN in front never ask
+again. Older, unhashed uploads get a short max-age and an mtime/size
+ETag instead.
+
+The body itself is handed off whenever possible:
+
+  MEDIA_ACCEL_REDIRECT_PREFIX  nginx `internal` location mapped to
+                               MEDIA_ROOT; the response is an empty
+                               X-Accel-Redirect and nginx sends the file
+                               (Range and all).
+  MEDIA_SENDFILE_HEADER        e.g. "X-Sendfile" for Apache/lighttpd.
+
+Without either, the file is streamed with FileResponse, which gunicorn
+turns into os.sendfile() through wsgi.file_wrapper. Single byte ranges
+of the original file are answered with 206 (and If-Range is honoured);
+`.br` / `.gz` siblings written at upload time are served, with an ETag
+of their own, when the client accepts them (q > 0, highest q first) and
+asks for no range.
+"""
+import mimetypes
+import os
+import re
+from urllib.parse import quote
+
+from django.conf import settings
+from django.core.exceptions import SuspiciousFileOperation
+from django.http import (
+    FileResponse, Http404, HttpResponse, HttpResponseNotModified, StreamingHttpResponse,
+)
+from django.utils._os import safe_join
+from django.utils.http import http_date, parse_http_date_safe
+from django.views.decorators.http import require_safe
+
+from .storage import content_hash
+
+IMMUTABLE_CACHE_CONTROL = 'public, max-age=31536000, immutable'
+MUTABLE_CACHE_CONTROL   = 'public, max-age=3600'
+ENCODINGS               = (('br', '.br'), ('gzip', '.gz'))
+RANGE_RE                = re.compile(r'^bytes=(\d*)-(\d*)$')
+CHUNK_SIZE              = 64 * 1024
+
+
+@require_safe
+def serve_media(request, path):
+    try:
+        full_path = safe_join(settings.MEDIA_ROOT, path)
+    except (SuspiciousFileOperation, ValueError):
+        raise Http404
+    try:
+        stat = os.stat(full_path)
+    except OSError:
+        raise Http404
+    if not os.path.isfile(full_path):
+        raise Http404
+
+    digest = content_hash(path)
+    tag = digest or f'{int(stat.st_mtime):x}-{stat.st_size:x}'
+    cache_control = IMMUTABLE_CACHE_CONTROL if digest else MUTABLE_CACHE_CONTROL
+    compressible = any(os.path.isfile(full_path + extension) for _, extension in ENCODINGS)
+    content_type, _ = mimetypes.guess_type(full_path)
+    content_type = content_type or 'application/octet-stream'
+
+    range_header = request.headers.get('Range')
+    if range_header is not None and not _if_range_matches(request, f'"{tag}"', stat.st_mtime):
+        range_header = None
+
+    # Precompressed variant (compressible types only; never mixed with Range).
+    encoding = None
+    if range_header is None:
+        accepted = accepted_codings(request.headers.get('Accept-Encoding', ''))
+        for name, extension in sorted(ENCODINGS, key=lambda e: -accepted.get(e[0], 0)):
+            if accepted.get(name, 0) > 0 and os.path.isfile(full_path + extension):
+                encoding = name
+                full_path += extension
+                path += extension
+                stat = os.stat(full_path)
+                break
+    # Each encoding is a different representation with its own validator.
+    etag = f'"{tag}-{encoding}"' if encoding else f'"{tag}"'
+
+    if etag in _etag_list(request.headers.get('If-None-Match', '')):
+        response = HttpResponseNotModified()
+        response['ETag'] = etag
+        response['Cache-Control'] = cache_control
+        if compressible:
+            response['Vary'] = 'Accept-Encoding'
+        return response
+
+    accel_prefix = getattr(settings, 'MEDIA_ACCEL_REDIRECT_PREFIX', '')
+    sendfile_header = getattr(settings, 'MEDIA_SENDFILE_HEADER', '')
+    if accel_prefix:
+        response = HttpResponse(content_type=content_type)
+        response['X-Accel-Redirect'] = accel_prefix.rstrip('/') + '/' + quote(path)
+    elif sendfile_header:
+        response = HttpResponse(content_type=content_type)
+        response[sendfile_header] = full_path
+    elif range_header is not None:
+        response = _range_response(full_path, stat.st_size, content_type, range_header)
+    else:
+        response = FileResponse(open(full_path, 'rb'), content_type=content_type)
+        response['Content-Length'] = stat.st_size
+
+    response['ETag'] = etag
+    if response.status_code != 416:
+        response['Cache-Control'] = cache_control
+    response['Last-Modified'] = http_date(stat.st_mtime)
+    response['Accept-Ranges'] = 'bytes'
+    if encoding:
+        response['Content-Encoding'] = encoding
+    if compressible:
+        response['Vary'] = 'Accept-Encoding'
+    return response
+
+
+def accepted_codings(header):
+    """
+    {coding: q} from an Accept-Encoding header, for the codings in
+    ENCODINGS; q=0 means refused, and `*` covers codings not listed.
+    """
+    listed = {}
+    for part in header.split(','):
+        coding, _, params = part.partition(';')
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        q = 1.0
+        name, _, value = params.partition('=')
+        if name.strip().lower() == 'q':
+            try:
+                q = float(value)
+            except ValueError:
+                q = 0.0
+        listed[coding] = q
+    wildcard = listed.get('*', 0.0)
+    return {name: listed.get(name, wildcard) for name, _ in ENCODINGS}
+
+
+def _etag_list(header):
+    return {tag.strip().removeprefix('W/') for tag in header.split(',') if tag.strip()}
+
+
+def _if_range_matches(request, etag, mtime):
+    """Whether Range applies: no If-Range, or one naming the current file (strong ETag or date)."""
+    value = request.headers.get('If-Range')
+    if value is None:
+        return True
+    value = value.strip()
+    if value.startswith(('"', 'W/')):
+        return value == etag
+    return parse_http_date_safe(value) == int(mtime)
+
+
+def _range_response(full_path, size, content_type, range_header):
+    """206 for a single satisfiable range, 416 if unsatisfiable, else 200."""
+    match = RANGE_RE.match(range_header.strip())
+    if not match or match.groups() == ('', ''):
+        # Multiple or malformed ranges: ignoring Range is always allowed.
+        response = FileResponse(open(full_path, 'rb'), content_type=content_type)
+        response['Content-Length'] = size
+        return response
+
+    first, last = match.groups()
+    if first == '':
+        start, end = max(size - int(last), 0), size - 1
+    else:
+        start = int(first)
+        end = min(int(last), size - 1) if last else size - 1
+    if start >= size or start > end:
+        response = HttpResponse(status=416)
+        response['Content-Range'] = f'bytes */{size}'
+        return response
+
+    length = end - start + 1
+
+    def chunks():
+        with open(full_path, 'rb') as fh:
+            fh.seek(start)
+            remaining = length
+            while remaining:
+                data = fh.read(min(CHUNK_SIZE, remaining))
+                if not data:
+                    break
+                remaining -= len(data)
+                yield data
+
+    response = StreamingHttpResponse(chunks(), status=206, content_type=content_type)
+    response['Content-Range'] = f'bytes {start}-{end}/{size}'
+    response['Content-Length'] = length
+    return response
@@ -0,0 +1,35 @@
+# Generated by Django 5.1.15 on 2026-10-19 14:37
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RequestProfile',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True, db_index=True)),
+                ('method', models.CharField(max_length=10)),
+                ('path', models.CharField(max_length=500)),
+                ('view_name', models.CharField(blank=True, max_length=200)),
+                ('status_code', models.PositiveSmallIntegerField()),
+                ('duration_ms', models.FloatField()),
+                ('mode', models.CharField(help_text='sampling or cprofile', max_length=20)),
+                ('sample_count', models.PositiveIntegerField(default=0)),
+                ('breakdown', models.JSONField(default=dict, help_text='Milliseconds attributed to orm / serialization / templates / middleware / view.')),
+                ('file_stem', models.CharField(help_text='Basename of the .collapsed.txt / .speedscope.json files.', max_length=100)),
+            ],
+            options={
+                'verbose_name': 'Request Profile',
+                'verbose_name_plural': 'Request Profiles',
+                'ordering': ['-created_at'],
+            },
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 5.1.15 on 2026-10-19 15:45
+
+from django.db import migrations, models
+
+
+def clear_cprofile_counts(apps, schema_editor):
+    # cProfile rows stored the number of profiled functions, not samples.
+    RequestProfile = apps.get_model('core', 'RequestProfile')
+    RequestProfile.objects.filter(mode='cprofile').update(sample_count=None)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0001_requestprofile'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='requestprofile',
+            name='sample_count',
+            field=models.PositiveIntegerField(blank=True, help_text='Stacks taken by the sampler; empty in cprofile mode, which does not sample.', null=True),
+        ),
+        migrations.RunPython(clear_cprofile_counts, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,36 @@
+from django.db import models
+
+
+class RequestProfile(models.Model):
+    """
+    One profiled request (see core.profiling). The stack data lives on
+    disk under settings.PROFILE_DIR; this row is the index the admin
+    browses, and only the newest PROFILE_MAX_FILES rows are kept.
+    """
+    created_at    = models.DateTimeField(auto_now_add=True, db_index=True)
+    method        = models.CharField(max_length=10)
+    path          = models.CharField(max_length=500)
+    view_name     = models.CharField(max_length=200, blank=True)
+    status_code   = models.PositiveSmallIntegerField()
+    duration_ms   = models.FloatField()
+    mode          = models.CharField(max_length=20, help_text='sampling or cprofile')
+    sample_count  = models.PositiveIntegerField(
+        null=True, blank=True,
+        help_text='Stacks taken by the sampler; empty in cprofile mode, which does not sample.',
+    )
+    breakdown     = models.JSONField(
+        default=dict,
+        help_text='Milliseconds attributed to orm / serialization / templates / middleware / view.',
+    )
+    file_stem     = models.CharField(
+        max_length=100,
+        help_text='Basename of the .collapsed.txt / .speedscope.json files.',
+    )
+
+    class Meta:
+        verbose_name        = 'Request Profile'
+        verbose_name_plural = 'Request Profiles'
+        ordering            = ['-created_at']
+
+    def __str__(self):
+        return f'{self.method} {self.path} ({self.duration_ms:.0f} ms)'
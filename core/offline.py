@@ -0,0 +1,70 @@
+"""
+Offline support: the precache manifest read by the service worker.
+
+The worker script itself lives in static/js/sw.js but is served from
+/sw.js (core.views.service_worker) so that its scope covers the whole
+site. On install, and whenever a page is opened after CHECK_INTERVAL,
+it fetches /sw-manifest.json and compares versions:
+
+  shell_version  hash of the app shell URLs; static files have content
+                 hashes in their names, so it changes only on deploys
+                 that touch them
+  menu_version   the live base MenuSnapshot id and availability-window
+                 segment; changes on every publish and at every window
+                 boundary
+
+Each version has its own cache, so an unchanged part is never
+downloaded again and a changed one is replaced as a whole.
+"""
+import functools
+import hashlib
+
+from django.conf import settings
+from django.templatetags.static import static
+from django.urls import reverse
+
+from menu.snapshot import get_live_snapshot
+
+# Loaded by base.html from CDNs — keep in step with it.
+SHELL_CDN = [
+    'https://cdn.tailwindcss.com',
+    'https://unpkg.com/htmx.org@1.9.12',
+    'https://unpkg.com/alpinejs@3.x.x/dist/cdn.min.js',
+    'https://fonts.googleapis.com/css2?family=Inter:wght@400;500;600&family=Playfair+Display:ital,wght@0,600;0,700;1,600&display=swap',
+]
+SHELL_STATIC = ['css/styles.css', 'js/main.js']
+CHECK_INTERVAL_SECONDS = 5 * 60
+
+
+@functools.lru_cache(maxsize=1)
+def shell():
+    """(version, urls) of the app shell; constant for the life of a worker."""
+    urls = [static(name) for name in SHELL_STATIC] + SHELL_CDN
+    version = hashlib.sha256('\n'.join(urls).encode()).hexdigest()[:12]
+    return version, urls
+
+
+def precache_manifest():
+    shell_version, shell_urls = shell()
+    snapshot_id, payload = get_live_snapshot()
+    cards_url = reverse('menu-cards')
+    return {
+        'shell_version': shell_version,
+        'shell': shell_urls,
+        'menu_version': f"{snapshot_id}.{payload['segment']}",
+        'menu': [
+            {'url': reverse('home')},
+            {'url': reverse('menu')},
+            {'url': reverse('api-menu')},
+            {'url': reverse('api-categories')},
+        ] + [
+            # Exactly what the HTMX filter form requests for each tab.
+            {'url': f'{cards_url}?category={c["id"]}&diet=all', 'headers': {'HX-Request': 'true'}}
+            for c in payload['categories']
+        ] + [
+            {'url': f'{cards_url}?category=all&diet=all', 'headers': {'HX-Request': 'true'}},
+        ],
+        'image_cache_entries': settings.SW_IMAGE_CACHE_ENTRIES,
+        'media_prefix': settings.MEDIA_URL,
+        'check_interval': CHECK_INTERVAL_SECONDS,
+    }
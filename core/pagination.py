@@ -0,0 +1,40 @@
+"""
+Admin pagination without an exact COUNT(*) on large tables.
+
+The changelist counts the filtered rows on every page load to draw the
+paginator. On PostgreSQL that count scans the whole table (or index).
+Above ESTIMATE_THRESHOLD rows, EstimatedCountPaginator uses the planner's
+row estimate instead (EXPLAIN; no rows are read). Page links near the
+end may then be off by a few pages, which an admin paging through
+thousands of dishes never notices. Smaller results, and other databases,
+get the exact count.
+
+Pair it with ModelAdmin.show_full_result_count = False, which drops the
+second, unfiltered COUNT(*) behind "N results (M total)".
+"""
+import json
+
+from django.core.paginator import Paginator
+from django.db import connections
+from django.utils.functional import cached_property
+
+ESTIMATE_THRESHOLD = 10_000
+
+
+def estimate_count(queryset):
+    """The planner's row estimate for `queryset`, or None where there is none."""
+    if connections[queryset.db].vendor != 'postgresql':
+        return None
+    plan = json.loads(queryset.order_by().explain(format='json'))
+    return int(plan[0]['Plan']['Plan Rows'])
+
+
+class EstimatedCountPaginator(Paginator):
+    @cached_property
+    def count(self):
+        estimate = None
+        if hasattr(self.object_list, 'explain'):
+            estimate = estimate_count(self.object_list)
+        if estimate is None or estimate < ESTIMATE_THRESHOLD:
+            return super().count
+        return estimate
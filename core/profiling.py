@@ -0,0 +1,301 @@
+"""
+Opt-in per-request profiling.
+
+A request is profiled when either
+  * it carries `?_profile=1` or an `X-Profile: 1` header and a session
+    cookie of a staff user (checked before the profiler starts; requests
+    without the flag or without a cookie never touch the session), or
+  * it falls inside settings.PROFILE_SAMPLE_RATE (0.0 – 1.0).
+
+Two profilers are available (settings.PROFILE_MODE):
+  * 'sampling' (default) — a helper thread snapshots the request
+    thread's stack every PROFILE_INTERVAL_MS via sys._current_frames().
+    Overhead is a few percent and independent of how many Python calls
+    the request makes.
+  * 'cprofile' — deterministic cProfile, for when exact call counts
+    matter more than overhead. Stacks are reconstructed one level deep
+    (caller;callee) from the pstats call graph.
+
+Each profile is written as a collapsed-stack file (flamegraph.pl /
+speedscope compatible) and a speedscope JSON file, indexed by a
+RequestProfile row. Only the newest PROFILE_MAX_FILES are kept on disk.
+Time is attributed to ORM, DRF serialization, template rendering,
+middleware (stack outside the view) or the view itself.
+"""
+import cProfile
+import json
+import logging
+import os
+import pstats
+import random
+import sys
+import threading
+import time
+import uuid
+from collections import Counter
+from importlib import import_module
+from types import SimpleNamespace
+
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+# Checked leaf → root; the first matching frame decides the category.
+CATEGORY_MARKERS = (
+    ('orm',           (os.sep.join(('django', 'db', '')),)),
+    ('serialization', (os.sep.join(('rest_framework', 'serializers')),
+                       os.sep.join(('rest_framework', 'fields')),
+                       os.sep.join(('rest_framework', 'renderers')))),
+    ('templates',     (os.sep.join(('django', 'template', '')),
+                       os.sep.join(('jinja2', '')))),
+)
+
+
+def _frame_label(code):
+    filename = code.co_filename
+    roots = [root for root in sys.path if root and filename.startswith(root)]
+    if roots:
+        filename = filename[len(max(roots, key=len)):].lstrip(os.sep)
+    return f'{code.co_name} ({filename}:{code.co_firstlineno})'
+
+
+def _categorise(stack, view_code):
+    """stack is a tuple of code objects, leaf first."""
+    for code in stack:
+        for category, markers in CATEGORY_MARKERS:
+            if any(marker in code.co_filename for marker in markers):
+                return category
+    if view_code is not None and view_code in stack:
+        return 'view'
+    return 'middleware'
+
+
+class StackSampler(threading.Thread):
+    """Samples one thread's Python stack at a fixed interval."""
+
+    def __init__(self, thread_id, interval):
+        super().__init__(name='request-profiler', daemon=True)
+        self.thread_id = thread_id
+        self.interval  = interval
+        self.stacks    = Counter()
+        self._halt     = threading.Event()
+
+    def run(self):
+        current_frames = sys._current_frames
+        while not self._halt.wait(self.interval):
+            frame = current_frames().get(self.thread_id)
+            stack = []
+            while frame is not None:
+                stack.append(frame.f_code)
+                frame = frame.f_back
+            if stack:
+                self.stacks[tuple(stack)] += 1
+
+    def stop(self):
+        self._halt.set()
+        self.join()
+
+
+class SamplingProfile:
+    mode = 'sampling'
+
+    def __init__(self):
+        interval = settings.PROFILE_INTERVAL_MS / 1000
+        self.sampler = StackSampler(threading.get_ident(), interval)
+
+    def start(self):
+        self.sampler.start()
+
+    def stop(self):
+        if self.sampler.ident is not None:
+            self.sampler.stop()
+
+    @property
+    def sample_count(self):
+        return sum(self.sampler.stacks.values())
+
+    def weighted_stacks(self, duration_ms):
+        """Return [(stack leaf-first, ms)] scaled to the wall-clock duration."""
+        total = sum(self.sampler.stacks.values())
+        if not total:
+            return []
+        per_sample = duration_ms / total
+        return [(stack, count * per_sample) for stack, count in self.sampler.stacks.items()]
+
+
+class CProfileProfile:
+    mode = 'cprofile'
+
+    def __init__(self):
+        self.profiler = cProfile.Profile()
+
+    def start(self):
+        self.profiler.enable()
+
+    def stop(self):
+        self.profiler.disable()
+
+    # Deterministic: every call is recorded, there are no samples to count.
+    sample_count = None
+
+    def weighted_stacks(self, duration_ms):
+        stats = pstats.Stats(self.profiler).stats
+        codes = {}
+        for entry in self.profiler.getstats():
+            if not isinstance(entry.code, str):
+                code = entry.code
+                codes[(code.co_filename, code.co_firstlineno, code.co_name)] = code
+        stacks = []
+        for func, (_, _, tottime, _, callers) in stats.items():
+            callee = codes.get(func)
+            if not callers:
+                if callee is not None:
+                    stacks.append(((callee,), tottime * 1000))
+                continue
+            caller_total = sum(c[2] for c in callers.values()) or 1
+            for caller, caller_stats in callers.items():
+                share  = tottime * 1000 * caller_stats[2] / caller_total
+                parent = codes.get(caller)
+                # Built-ins have no code object; charge them to the caller.
+                stack  = tuple(c for c in (callee, parent) if c is not None)
+                if stack:
+                    stacks.append((stack, share))
+        return stacks
+
+
+PROFILERS = {
+    'sampling': SamplingProfile,
+    'cprofile': CProfileProfile,
+}
+
+
+def _write_profile(stem, stacks, duration_ms, title):
+    directory = settings.PROFILE_DIR
+    os.makedirs(directory, exist_ok=True)
+
+    labels = {}
+    collapsed = Counter()
+    for stack, ms in stacks:
+        names = [labels.setdefault(code, _frame_label(code)) for code in reversed(stack)]
+        collapsed[';'.join(names)] += ms
+
+    with open(os.path.join(directory, f'{stem}.collapsed.txt'), 'w') as fh:
+        for line, ms in collapsed.most_common():
+            # flamegraph.pl wants integer weights — use microseconds.
+            fh.write(f'{line} {max(1, round(ms * 1000))}\n')
+
+    frame_index = {}
+    frames, samples, weights = [], [], []
+    for line, ms in collapsed.items():
+        sample = []
+        for name in line.split(';'):
+            if name not in frame_index:
+                frame_index[name] = len(frames)
+                frames.append({'name': name})
+            sample.append(frame_index[name])
+        samples.append(sample)
+        weights.append(round(ms, 3))
+    speedscope = {
+        '$schema': 'https://www.speedscope.app/file-format-schema.json',
+        'shared': {'frames': frames},
+        'profiles': [{
+            'type': 'sampled', 'name': title, 'unit': 'milliseconds',
+            'startValue': 0, 'endValue': round(duration_ms, 3),
+            'samples': samples, 'weights': weights,
+        }],
+        'name': title,
+        'exporter': 'dilli_da_dhaba.core.profiling',
+    }
+    with open(os.path.join(directory, f'{stem}.speedscope.json'), 'w') as fh:
+        json.dump(speedscope, fh)
+
+
+def profile_file_path(stem, kind):
+    """Absolute path of a stored profile; kind is 'collapsed' or 'speedscope'."""
+    suffix = {'collapsed': '.collapsed.txt', 'speedscope': '.speedscope.json'}[kind]
+    return os.path.join(settings.PROFILE_DIR, os.path.basename(stem) + suffix)
+
+
+def _trim_ring_buffer():
+    from .models import RequestProfile
+
+    stale = RequestProfile.objects.order_by('-created_at')[settings.PROFILE_MAX_FILES:]
+    for profile in stale:
+        for kind in ('collapsed', 'speedscope'):
+            try:
+                os.remove(profile_file_path(profile.file_stem, kind))
+            except FileNotFoundError:
+                pass
+    RequestProfile.objects.filter(pk__in=[p.pk for p in stale]).delete()
+
+
+def _is_requested(request):
+    return (request.GET.get('_profile') == '1'
+            or request.META.get('HTTP_X_PROFILE') == '1')
+
+
+def _is_staff(request):
+    """Whether the session cookie belongs to a staff user (runs before SessionMiddleware)."""
+    from django.contrib.auth import get_user
+
+    session_key = request.COOKIES.get(settings.SESSION_COOKIE_NAME)
+    if not session_key:
+        return False
+    session = import_module(settings.SESSION_ENGINE).SessionStore(session_key)
+    return get_user(SimpleNamespace(session=session)).is_staff
+
+
+class RequestProfilerMiddleware:
+    """Place first in MIDDLEWARE so middleware time is captured too."""
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        requested = _is_requested(request) and _is_staff(request)
+        sampled   = not requested and random.random() < settings.PROFILE_SAMPLE_RATE
+        if not (requested or sampled):
+            return self.get_response(request)
+
+        profile = PROFILERS.get(settings.PROFILE_MODE, SamplingProfile)()
+        start = time.perf_counter()
+        try:
+            profile.start()
+            response = self.get_response(request)
+        finally:
+            profile.stop()
+        duration_ms = (time.perf_counter() - start) * 1000
+
+        try:
+            self._store(request, response, profile, duration_ms)
+        except Exception:
+            logger.exception('Could not store request profile for %s', request.path)
+        return response
+
+    def _store(self, request, response, profile, duration_ms):
+        from .models import RequestProfile
+
+        match = getattr(request, 'resolver_match', None)
+        view_code = getattr(getattr(match, 'func', None), '__code__', None)
+        stacks = profile.weighted_stacks(duration_ms)
+
+        breakdown = Counter()
+        for stack, ms in stacks:
+            breakdown[_categorise(stack, view_code)] += ms
+
+        stem  = f'{time.strftime("%Y%m%d-%H%M%S")}-{uuid.uuid4().hex[:8]}'
+        title = f'{request.method} {request.get_full_path()}'
+        _write_profile(stem, stacks, duration_ms, title)
+
+        RequestProfile.objects.create(
+            method=request.method,
+            path=request.get_full_path()[:500],
+            view_name=(match.view_name if match else '')[:200],
+            status_code=response.status_code,
+            duration_ms=duration_ms,
+            mode=profile.mode,
+            sample_count=profile.sample_count,
+            breakdown={k: round(v, 2) for k, v in breakdown.items()},
+            file_stem=stem,
+        )
+        _trim_ring_buffer()
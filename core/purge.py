@@ -0,0 +1,138 @@
+"""
+Surrogate-key purging (see core/edge.py for the keys).
+
+purge_keys() is the dispatcher. Inside a transaction it waits for the
+commit, so the edge never refetches data that is about to be rolled
+back, and all keys scheduled in one transaction, or one batched() block,
+go out in a single call. Menu keys are computed by menu.snapshot.flip
+from the difference between the old and new live snapshot, so a purge
+always happens after the new menu is live.
+
+The backend is settings.EDGE_PURGE_BACKEND:
+
+    core.purge.NullPurgeBackend     do nothing (no CDN)
+    core.purge.LocMemPurgeBackend   remember purges in memory (tests, dev)
+    core.purge.FastlyPurgeBackend   Fastly soft purge by surrogate key
+
+Purge failures are logged and never break the request that caused them;
+the edge then serves the old copy until s-maxage expires.
+"""
+import json
+import logging
+import threading
+import urllib.request
+from collections import deque
+from contextlib import contextmanager
+
+from django.conf import settings
+from django.db import transaction
+from django.utils.module_loading import import_string
+
+logger = logging.getLogger(__name__)
+
+_local = threading.local()
+
+
+# ---------------------------------------------------------------------------
+# Backends
+# ---------------------------------------------------------------------------
+class BasePurgeBackend:
+    def purge(self, keys):
+        raise NotImplementedError
+
+
+class NullPurgeBackend(BasePurgeBackend):
+    def purge(self, keys):
+        pass
+
+
+class LocMemPurgeBackend(BasePurgeBackend):
+    """Records purges in `history` (newest last) instead of calling a CDN."""
+    history = deque(maxlen=1000)
+
+    def purge(self, keys):
+        self.history.append(sorted(keys))
+        logger.info('Purged surrogate keys: %s', ' '.join(sorted(keys)))
+
+
+class FastlyPurgeBackend(BasePurgeBackend):
+    """Soft purge: Fastly marks the objects stale, so stale-while-revalidate still applies."""
+    endpoint = 'https://api.fastly.com/service/{service_id}/purge'
+    batch_size = 256   # Fastly's limit per request
+
+    def purge(self, keys):
+        keys = sorted(keys)
+        for start in range(0, len(keys), self.batch_size):
+            request = urllib.request.Request(
+                self.endpoint.format(service_id=settings.FASTLY_SERVICE_ID),
+                data=json.dumps({'surrogate_keys': keys[start:start + self.batch_size]}).encode(),
+                method='POST',
+                headers={
+                    'Fastly-Key': settings.FASTLY_API_TOKEN,
+                    'Fastly-Soft-Purge': '1',
+                    'Content-Type': 'application/json',
+                    'Accept': 'application/json',
+                },
+            )
+            with urllib.request.urlopen(request, timeout=5):
+                pass
+
+
+_backend = None
+
+
+def get_backend():
+    global _backend
+    if _backend is None:
+        _backend = import_string(settings.EDGE_PURGE_BACKEND)()
+    return _backend
+
+
+# ---------------------------------------------------------------------------
+# Dispatcher
+# ---------------------------------------------------------------------------
+def _send(keys):
+    if not keys:
+        return
+    try:
+        get_backend().purge(keys)
+    except Exception:
+        logger.exception('Purging %d surrogate key(s) failed', len(keys))
+
+
+def _purge_on_commit():
+    keys, _local.pending = _local.pending, set()
+    _send(keys)
+
+
+def purge_keys(keys):
+    """Purge `keys` now, at the end of the batched() block, or on commit."""
+    keys = set(keys)
+    if not keys:
+        return
+    batch = getattr(_local, 'batch', None)
+    if batch is not None:
+        batch.update(keys)
+        return
+    connection = transaction.get_connection()
+    if not connection.in_atomic_block:
+        _send(keys)
+    elif not any(entry[1] is _purge_on_commit for entry in connection.run_on_commit):
+        _local.pending = keys
+        transaction.on_commit(_purge_on_commit)
+    else:
+        _local.pending.update(keys)
+
+
+@contextmanager
+def batched():
+    """Collect purge_keys() calls in the block and send them as one purge."""
+    if getattr(_local, 'batch', None) is not None:
+        yield
+        return
+    _local.batch = set()
+    try:
+        yield
+    finally:
+        keys, _local.batch = _local.batch, None
+        purge_keys(keys)
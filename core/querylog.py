@@ -0,0 +1,316 @@
+"""
+Slow-query log and per-fingerprint query statistics.
+
+QueryLogMiddleware wraps every request's database calls in a
+connection.execute_wrapper. Each query is timed and reduced to a
+fingerprint: its SQL with literals and parameters replaced by `?`,
+IN-lists collapsed and whitespace normalized. For example,
+
+    SELECT ... WHERE "menu_menuitem"."category_id" = 12 LIMIT 21
+    SELECT ... WHERE "menu_menuitem"."category_id" = %s LIMIT 21
+
+both become  SELECT ... WHERE "menu_menuitem"."category_id" = ? LIMIT ?
+
+Per fingerprint, each worker keeps the count, total and max time, the
+durations of the latest SAMPLES queries (for p95) and the views that ran
+it. The table is bounded: when it holds QUERYLOG_MAX_FINGERPRINTS
+entries, the one with the least total time makes room.
+
+Queries slower than SLOW_QUERY_MS are logged (logger 'core.querylog')
+with the view and the first call site in project code.
+
+Every QUERYLOG_FLUSH_SECONDS, and at exit, a worker writes its table to
+a small SQLite file (QUERYLOG_DB_PATH) shared by all workers on the
+instance. `manage.py query_report` merges the workers' tables and lists
+the top offenders.
+"""
+import atexit
+import json
+import logging
+import os
+import re
+import socket
+import sqlite3
+import sys
+import threading
+import time
+from collections import OrderedDict, deque
+from contextlib import ExitStack
+
+from django.conf import settings
+from django.db import connections
+
+logger = logging.getLogger(__name__)
+
+SAMPLES = 200           # durations kept per fingerprint for percentiles
+FINGERPRINT_CACHE = 2048
+SQL_LOG_CHARS = 500
+
+# One pass over the SQL: quoted strings and numbers become ?; quoted
+# identifiers are kept, except Django's savepoint names (s<thread>_x<n>),
+# which differ per thread and call.
+_LITERAL_RE = re.compile(
+    r"\"?\bs\d+_x\d+\b\"?"
+    r"|(?P<ident>\"[^\"]*\")"
+    r"|'(?:[^']|'')*'"
+    r"|\b\d+(?:\.\d+)?\b"
+    r"|%s"
+)
+_IN_LIST_RE = re.compile(r'\(\s*\?(?:\s*,\s*\?)+\s*\)')
+_SPACE_RE = re.compile(r'\s+')
+
+
+def _literal(match):
+    return match.group('ident') or '?'
+
+
+_fingerprints = OrderedDict()
+_fingerprints_lock = threading.Lock()
+
+
+def fingerprint(sql):
+    """Normalized SQL: literals and parameters as ?, IN-lists as (...)."""
+    cached = _fingerprints.get(sql)
+    if cached is not None:
+        return cached
+    normalized = _LITERAL_RE.sub(_literal, sql)
+    normalized = _IN_LIST_RE.sub('(...)', normalized)
+    normalized = _SPACE_RE.sub(' ', normalized).strip()
+    with _fingerprints_lock:
+        _fingerprints[sql] = normalized
+        while len(_fingerprints) > FINGERPRINT_CACHE:
+            _fingerprints.popitem(last=False)
+    return normalized
+
+
+def percentile(values, fraction):
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+# ---------------------------------------------------------------------------
+# Per-worker table
+# ---------------------------------------------------------------------------
+class QueryStats:
+    """Bounded fingerprint → {count, total_ms, max_ms, samples, views} table."""
+
+    def __init__(self, max_entries):
+        self.max_entries = max_entries
+        self.entries = {}
+        self.lock = threading.Lock()
+
+    def record(self, sql, duration_ms, view):
+        key = fingerprint(sql)
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                if len(self.entries) >= self.max_entries:
+                    cheapest = min(self.entries, key=lambda k: self.entries[k]['total_ms'])
+                    del self.entries[cheapest]
+                entry = self.entries[key] = {
+                    'count': 0, 'total_ms': 0.0, 'max_ms': 0.0,
+                    'samples': deque(maxlen=SAMPLES), 'views': set(),
+                }
+            entry['count'] += 1
+            entry['total_ms'] += duration_ms
+            entry['max_ms'] = max(entry['max_ms'], duration_ms)
+            entry['samples'].append(duration_ms)
+            if view and len(entry['views']) < 10:
+                entry['views'].add(view)
+
+    def snapshot(self):
+        with self.lock:
+            return {
+                key: {**entry, 'samples': list(entry['samples']), 'views': sorted(entry['views'])}
+                for key, entry in self.entries.items()
+            }
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+
+
+# ---------------------------------------------------------------------------
+# Shared file store
+# ---------------------------------------------------------------------------
+class QueryLogStore:
+    """Each worker's latest table, in a SQLite file shared by the instance's workers."""
+
+    def __init__(self, path):
+        self.path = str(path)
+
+    def connection(self):
+        conn = sqlite3.connect(self.path, timeout=5, isolation_level=None)
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute(
+            'CREATE TABLE IF NOT EXISTS fingerprint ('
+            ' worker TEXT NOT NULL, sql TEXT NOT NULL, count INTEGER NOT NULL,'
+            ' total_ms REAL NOT NULL, max_ms REAL NOT NULL, samples TEXT NOT NULL,'
+            ' views TEXT NOT NULL, updated REAL NOT NULL, PRIMARY KEY (worker, sql)'
+            ')'
+        )
+        return conn
+
+    def save(self, worker, table):
+        """Replace `worker`'s rows with `table` (QueryStats.snapshot())."""
+        now = time.time()
+        conn = self.connection()
+        try:
+            conn.execute('BEGIN IMMEDIATE')
+            conn.execute('DELETE FROM fingerprint WHERE worker = ?', (worker,))
+            conn.executemany(
+                'INSERT INTO fingerprint VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+                [
+                    (worker, sql, e['count'], e['total_ms'], e['max_ms'],
+                     json.dumps(e['samples']), json.dumps(e['views']), now)
+                    for sql, e in table.items()
+                ],
+            )
+            conn.execute('COMMIT')
+        finally:
+            conn.close()
+
+    def load(self, max_age=None):
+        """[(worker, sql, entry)] for workers that flushed within `max_age` seconds."""
+        conn = self.connection()
+        try:
+            query = 'SELECT worker, sql, count, total_ms, max_ms, samples, views FROM fingerprint'
+            params = ()
+            if max_age is not None:
+                query += ' WHERE updated >= ?'
+                params = (time.time() - max_age,)
+            return [
+                (worker, sql, {
+                    'count': count, 'total_ms': total_ms, 'max_ms': max_ms,
+                    'samples': json.loads(samples), 'views': json.loads(views),
+                })
+                for worker, sql, count, total_ms, max_ms, samples, views in conn.execute(query, params)
+            ]
+        finally:
+            conn.close()
+
+    def clear(self):
+        conn = self.connection()
+        try:
+            conn.execute('DELETE FROM fingerprint')
+        finally:
+            conn.close()
+
+
+def merge(rows):
+    """Combine the workers' entries per fingerprint; p95 over their pooled samples."""
+    merged = {}
+    for _, sql, entry in rows:
+        total = merged.setdefault(sql, {
+            'count': 0, 'total_ms': 0.0, 'max_ms': 0.0, 'samples': [], 'views': set(),
+        })
+        total['count'] += entry['count']
+        total['total_ms'] += entry['total_ms']
+        total['max_ms'] = max(total['max_ms'], entry['max_ms'])
+        total['samples'].extend(entry['samples'])
+        total['views'].update(entry['views'])
+    for entry in merged.values():
+        entry['p95_ms'] = percentile(entry['samples'], 0.95)
+        entry['mean_ms'] = entry['total_ms'] / entry['count'] if entry['count'] else 0.0
+    return merged
+
+
+# ---------------------------------------------------------------------------
+# Recording
+# ---------------------------------------------------------------------------
+_stats = None
+_stats_lock = threading.Lock()
+_local = threading.local()
+_worker = None
+_last_flush = time.monotonic()
+
+
+def get_stats():
+    global _stats
+    if _stats is None:
+        with _stats_lock:
+            if _stats is None:
+                _stats = QueryStats(settings.QUERYLOG_MAX_FINGERPRINTS)
+    return _stats
+
+
+def get_store():
+    return QueryLogStore(settings.QUERYLOG_DB_PATH)
+
+
+def worker_id():
+    # pid + start time: a restarted worker that reuses a pid starts fresh.
+    global _worker
+    if _worker is None or not _worker.startswith(f'{socket.gethostname()}:{os.getpid()}:'):
+        _worker = f'{socket.gethostname()}:{os.getpid()}:{int(time.time())}'
+    return _worker
+
+
+def flush():
+    try:
+        get_store().save(worker_id(), get_stats().snapshot())
+    except Exception:
+        logger.exception('Could not write query statistics to %s', settings.QUERYLOG_DB_PATH)
+
+
+def _maybe_flush():
+    global _last_flush
+    now = time.monotonic()
+    if now - _last_flush >= settings.QUERYLOG_FLUSH_SECONDS:
+        _last_flush = now
+        flush()
+
+
+def call_site():
+    """'path/to/file.py:line in function' of the innermost project frame, or ''."""
+    root = str(settings.BASE_DIR) + os.sep
+    frame = sys._getframe(1)
+    while frame is not None:
+        filename = frame.f_code.co_filename
+        if (filename.startswith(root) and filename != __file__
+                and 'site-packages' not in filename):
+            return f'{filename[len(root):]}:{frame.f_lineno} in {frame.f_code.co_name}'
+        frame = frame.f_back
+    return ''
+
+
+def record_query(execute, sql, params, many, context):
+    """connection.execute_wrapper callable."""
+    started = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        duration_ms = (time.perf_counter() - started) * 1000
+        view = getattr(_local, 'view', '')
+        get_stats().record(sql, duration_ms, view)
+        if duration_ms >= settings.SLOW_QUERY_MS:
+            logger.warning(
+                'Slow query (%.1f ms) in %s at %s: %s',
+                duration_ms, view or '-', call_site() or '-', sql[:SQL_LOG_CHARS],
+            )
+
+
+class QueryLogMiddleware:
+    """Place near the top of MIDDLEWARE; a no-op unless settings.QUERYLOG_ENABLED."""
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if settings.QUERYLOG_ENABLED:
+            atexit.register(flush)
+
+    def __call__(self, request):
+        if not settings.QUERYLOG_ENABLED:
+            return self.get_response(request)
+        _local.view = ''
+        with ExitStack() as stack:
+            for alias in connections:
+                stack.enter_context(connections[alias].execute_wrapper(record_query))
+            response = self.get_response(request)
+        _maybe_flush()
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        if settings.QUERYLOG_ENABLED:
+            _local.view = f'{view_func.__module__}.{getattr(view_func, "__name__", type(view_func).__name__)}'
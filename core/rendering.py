@@ -0,0 +1,28 @@
+"""
+Engine selection for the public pages.
+
+Every public template exists twice: templates/ (Django) and jinja2/
+(Jinja2 ports). settings.JINJA2_VIEWS lists the URL names rendered with
+Jinja2, e.g. JINJA2_VIEWS=home,menu; everything else stays on the Django
+engine. `manage.py compare_templates` checks that both render the same.
+"""
+from django.conf import settings
+from django.shortcuts import render
+
+DJANGO_ENGINE = 'django'
+JINJA2_ENGINE = 'jinja2'
+
+
+def engine_for(request, url_name=None):
+    """The engine for the current view, or for the view named `url_name`."""
+    if url_name is None:
+        match = request.resolver_match
+        url_name = match.url_name if match is not None else None
+    if url_name in settings.JINJA2_VIEWS:
+        return JINJA2_ENGINE
+    return DJANGO_ENGINE
+
+
+def render_public(request, template_name, context=None, **kwargs):
+    """render() using the engine configured for the current view."""
+    return render(request, template_name, context, using=engine_for(request), **kwargs)
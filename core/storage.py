@@ -0,0 +1,83 @@
+"""
+Local media storage with content-hashed filenames.
+
+Uploaded menu photos are saved as `menu/<name>.<hash12>.<ext>`, so a URL
+always refers to the same bytes and can be cached forever (see
+core.media.serve_media). Re-uploading an identical file reuses the
+existing name instead of writing a copy.
+
+Compressible types (SVG, plain text) also get `.gz` — and `.br` when the
+optional `brotli` package is installed — written next to the original,
+so they can be served precompressed without per-request CPU.
+"""
+import gzip
+import hashlib
+import mimetypes
+import os
+import re
+
+from django.core.files.base import ContentFile
+from django.core.files.storage import FileSystemStorage
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+HASH_LENGTH = 12
+HASHED_NAME_RE = re.compile(r'\.([0-9a-f]{%d})\.[^./]+$' % HASH_LENGTH)
+COMPRESSIBLE_TYPES = ('image/svg+xml', 'text/', 'application/json')
+
+
+def content_hash(name):
+    """Return the content hash embedded in a stored name, or None."""
+    match = HASHED_NAME_RE.search(name)
+    return match.group(1) if match else None
+
+
+class HashedMediaStorage(FileSystemStorage):
+
+    # Matches the default max_length of FileField / ImageField.
+    max_name_length = 100
+
+    def _save(self, name, content):
+        digest = hashlib.sha256()
+        content.seek(0)
+        for chunk in content.chunks():
+            digest.update(chunk)
+        content.seek(0)
+
+        directory, filename = os.path.split(name)
+        stem, ext = os.path.splitext(filename)
+        suffix = f'.{digest.hexdigest()[:HASH_LENGTH]}{ext.lower()}'
+        room = self.max_name_length - len(directory) - 1 - len(suffix)
+        hashed = os.path.join(directory, stem[:max(room, 1)] + suffix)
+
+        if self.exists(hashed):
+            return hashed
+        hashed = super()._save(hashed, content)
+        self._write_precompressed(hashed)
+        return hashed
+
+    def get_available_name(self, name, max_length=None):
+        # Collisions are impossible once the hash is in the name; an
+        # existing file with the same name has the same content.
+        return name
+
+    def delete(self, name):
+        super().delete(name)
+        for extension in ('.gz', '.br'):
+            super().delete(name + extension)
+
+    def _write_precompressed(self, name):
+        content_type, _ = mimetypes.guess_type(name)
+        if not content_type or not content_type.startswith(COMPRESSIBLE_TYPES):
+            return
+        with self.open(name, 'rb') as fh:
+            raw = fh.read()
+        variants = [('.gz', gzip.compress(raw, compresslevel=9))]
+        if brotli is not None:
+            variants.append(('.br', brotli.compress(raw)))
+        for extension, data in variants:
+            if len(data) < len(raw):
+                super()._save(name + extension, ContentFile(data))
@@ -0,0 +1,159 @@
+"""
+Token-bucket throttles shared by every gunicorn worker on the instance.
+
+DRF's stock SimpleRateThrottle keeps a list of request timestamps per
+client in the default cache. With no CACHES configured that cache is a
+per-process LocMemCache, so each worker counts separately and the
+effective limit is multiplied by the worker count; the whole list is
+also pickled and rewritten on every request.
+
+The throttles here keep one fixed-size bucket per client instead:
+(tokens, last refill timestamp). A bucket holds `num_requests` tokens
+and refills at `num_requests / duration` tokens per second, so the
+long-run rate matches the configured '120/min' string and bursts are
+capped at the same number of requests.
+
+Buckets live in a bucket store:
+
+  * SQLiteBucketStore (default) — a small SQLite file on local disk,
+    updated with one atomic UPSERT per request, so all workers on the
+    instance share the same counts.
+  * CacheBucketStore — any Django cache alias; use this when a shared
+    cache (Redis / Memcached) is configured. Read-modify-write is not
+    atomic, which is acceptable for rate limiting.
+
+Select with settings.THROTTLE_STORE ('sqlite' or 'cache').
+"""
+import os
+import sqlite3
+import threading
+import time
+
+from django.conf import settings
+from django.core.cache import caches
+from rest_framework.throttling import AnonRateThrottle, SimpleRateThrottle
+
+
+class SQLiteBucketStore:
+    """Token buckets in a local SQLite file shared across processes."""
+
+    # Stale buckets (full again, so indistinguishable from a new client)
+    # are pruned once every PRUNE_EVERY successful takes per process.
+    PRUNE_EVERY = 5000
+
+    _TAKE_SQL = """
+        INSERT INTO bucket (key, tokens, stamp) VALUES (?1, ?2 - 1, ?3)
+        ON CONFLICT (key) DO UPDATE SET
+            tokens = min(?2, tokens + (?3 - stamp) * ?4) - 1,
+            stamp  = ?3
+        WHERE min(?2, tokens + (?3 - stamp) * ?4) >= 1
+    """
+
+    def __init__(self, path):
+        self.path = str(path)
+        self._local = threading.local()
+        self._calls = 0
+
+    def connection(self):
+        # Connections must not cross a fork, so key them on the pid too.
+        conn = getattr(self._local, 'conn', None)
+        if conn is None or self._local.pid != os.getpid():
+            conn = sqlite3.connect(self.path, timeout=5, isolation_level=None)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=OFF')
+            conn.execute(
+                'CREATE TABLE IF NOT EXISTS bucket ('
+                ' key TEXT PRIMARY KEY, tokens REAL NOT NULL, stamp REAL NOT NULL'
+                ') WITHOUT ROWID'
+            )
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
+
+    def take(self, key, capacity, refill_rate, now):
+        """
+        Try to take one token. Returns None on success, otherwise the
+        number of seconds until a token will be available.
+        """
+        conn = self.connection()
+        cursor = conn.execute(self._TAKE_SQL, (key, capacity, now, refill_rate))
+        if cursor.rowcount:
+            self._calls += 1
+            if self._calls % self.PRUNE_EVERY == 0:
+                conn.execute(
+                    'DELETE FROM bucket WHERE stamp < ?',
+                    (now - capacity / refill_rate,),
+                )
+            return None
+
+        row = conn.execute(
+            'SELECT tokens, stamp FROM bucket WHERE key = ?', (key,)
+        ).fetchone()
+        tokens = min(capacity, row[0] + (now - row[1]) * refill_rate) if row else 0
+        return (1 - tokens) / refill_rate
+
+
+class CacheBucketStore:
+    """Token buckets in a Django cache alias."""
+
+    def __init__(self, alias):
+        self.cache = caches[alias]
+
+    def take(self, key, capacity, refill_rate, now):
+        tokens, stamp = self.cache.get(key, (capacity, now))
+        tokens = min(capacity, tokens + (now - stamp) * refill_rate)
+        if tokens < 1:
+            return (1 - tokens) / refill_rate
+        # Expire once the bucket would have refilled completely anyway.
+        self.cache.set(key, (tokens - 1, now), int(capacity / refill_rate) + 1)
+        return None
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_bucket_store():
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                if settings.THROTTLE_STORE == 'cache':
+                    _store = CacheBucketStore(settings.THROTTLE_CACHE_ALIAS)
+                else:
+                    _store = SQLiteBucketStore(settings.THROTTLE_DB_PATH)
+    return _store
+
+
+class TokenBucketRateThrottle(SimpleRateThrottle):
+    """
+    Drop-in replacement for SimpleRateThrottle backed by a bucket store.
+    Subclasses only need to define `scope` and `get_cache_key()`.
+    """
+    timer = time.time
+    cache_format = 'bucket_%(scope)s_%(ident)s'
+
+    def allow_request(self, request, view):
+        if self.rate is None:
+            return True
+
+        self.key = self.get_cache_key(request, view)
+        if self.key is None:
+            return True
+
+        self._wait = get_bucket_store().take(
+            self.key,
+            self.num_requests,
+            self.num_requests / self.duration,
+            self.timer(),
+        )
+        if self._wait is None:
+            return True
+        return self.throttle_failure()
+
+    def wait(self):
+        return getattr(self, '_wait', None)
+
+
+class SharedAnonRateThrottle(TokenBucketRateThrottle, AnonRateThrottle):
+    """AnonRateThrottle ('anon' scope, keyed by client IP) on shared buckets."""
@@ -1,8 +1,12 @@
 from django.urls import path
-from .views import home, about, contact
+from .views import home, about, contact, offline_manifest, service_worker
 
 urlpatterns = [
     path('',         home,    name='home'),
     path('about/',   about,   name='about'),
     path('contact/', contact, name='contact'),
+
+    # Offline support — the worker must live at the root to control every page
+    path('sw.js',            service_worker,   name='service-worker'),
+    path('sw-manifest.json', offline_manifest, name='offline-manifest'),
 ]
@@ -1,23 +1,56 @@
-from django.shortcuts import render
-from menu.models import MenuItem
+from django.contrib.staticfiles import finders
+from django.http import Http404, HttpResponse, JsonResponse
+from django.utils.cache import patch_cache_control
+
+from core import edge
+from core.offline import precache_manifest
+from core.rendering import render_public
+from menu.snapshot import get_live_snapshot
+from reviews import aggregates
 from reviews.models import Review
 
 
+@edge.edge_cache('page')
 def home(request):
-    featured_items = (
-        MenuItem.objects.filter(featured=True, is_available=True)
-        .select_related('category')[:8]
-    )
+    _, menu = get_live_snapshot()
+    featured_items = [item for item in menu['items'] if item['featured']][:8]
     testimonials = Review.objects.filter(is_approved=True).order_by('-created_at')[:6]
-    return render(request, 'core/home.html', {
+    response = render_public(request, 'core/home.html', {
         'featured_items': featured_items,
         'testimonials': testimonials,
+        'review_summary': aggregates.summary(),
     })
+    edge.expire_at(response, menu['changes_at'])
+    return edge.add_keys(response, edge.menu_keys(featured_items) | {edge.FEATURED, edge.REVIEWS})
 
 
+@edge.edge_cache('static_page')
 def about(request):
-    return render(request, 'core/about.html')
+    return edge.add_keys(render_public(request, 'core/about.html'), {edge.PAGES})
 
 
+@edge.edge_cache('static_page')
 def contact(request):
-    return render(request, 'core/contact.html')
+    return edge.add_keys(render_public(request, 'core/contact.html'), {edge.PAGES})
+
+
+def service_worker(request):
+    """
+    static/js/sw.js, served from the site root so its scope is the whole
+    site. Never cached by the browser: updates must be picked up at once.
+    """
+    path = finders.find('js/sw.js')
+    if path is None:
+        raise Http404('sw.js not found')
+    with open(path, 'rb') as fh:
+        response = HttpResponse(fh.read(), content_type='text/javascript; charset=utf-8')
+    response['Service-Worker-Allowed'] = '/'
+    patch_cache_control(response, no_cache=True)
+    return response
+
+
+def offline_manifest(request):
+    """Precache manifest for the service worker (see core/offline.py)."""
+    response = JsonResponse(precache_manifest())
+    patch_cache_control(response, no_cache=True)
+    return response
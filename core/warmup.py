@@ -0,0 +1,31 @@
+"""
+Cache warming for freshly started server processes (see gunicorn.conf.py).
+
+warm_shared() fills caches that are identical in every worker, so it runs
+once in the gunicorn master when the app is preloaded.
+
+Connections are not warmed: the database and throttle-store connections
+are per thread, and gthread workers serve requests on pool threads, so a
+connection opened by the worker's main thread would never be used.
+"""
+from django.db import connections
+from django.template.loader import get_template
+from django.urls import reverse
+
+PUBLIC_TEMPLATES = (
+    'core/home.html',
+    'core/about.html',
+    'core/contact.html',
+    'menu/menu.html',
+)
+
+
+def warm_shared():
+    """Populate the URL resolver and compile the public templates."""
+    reverse('home')  # imports every URLconf and builds the reverse tables
+    for name in PUBLIC_TEMPLATES:
+        get_template(name)
+    # Nothing above should need the database, but never hand a live
+    # connection to forked children.
+    connections.close_all()
+
@@ -5,7 +5,10 @@ Django settings for Dilli Da Dhaba - Production-ready configuration.
 from pathlib import Path
 from datetime import timedelta
 import environ
+from django.core.exceptions import ImproperlyConfigured
+import importlib.util
 import os
+import tempfile
 
 # ---------------------------------------------------------------------------
 # BASE
@@ -56,9 +59,11 @@ DJANGO_APPS = [
     'django.contrib.staticfiles',
 ]
 
+# rest_framework_simplejwt is deliberately not listed: it only needs to be
+# an app for its token_blacklist models or translations, and loading its
+# models at startup imports django.test (~30 ms per cold worker).
 THIRD_PARTY_APPS = [
     'rest_framework',
-    'rest_framework_simplejwt',
     'corsheaders',
 ]
 
@@ -67,6 +72,7 @@ LOCAL_APPS = [
     'menu.apps.MenuConfig',
     'reviews.apps.ReviewsConfig',
     'accounts.apps.AccountsConfig',
+    'orders.apps.OrdersConfig',
 ]
 
 INSTALLED_APPS = DJANGO_APPS + THIRD_PARTY_APPS + LOCAL_APPS
@@ -75,10 +81,14 @@ INSTALLED_APPS = DJANGO_APPS + THIRD_PARTY_APPS + LOCAL_APPS
 # MIDDLEWARE
 # ---------------------------------------------------------------------------
 MIDDLEWARE = [
+    'core.profiling.RequestProfilerMiddleware',
+    'core.querylog.QueryLogMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'whitenoise.middleware.WhiteNoiseMiddleware',
+    'core.compression.HTMLCompressionMiddleware',
     'corsheaders.middleware.CorsMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
+    'core.i18n.LanguageMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
@@ -93,12 +103,14 @@ ROOT_URLCONF = 'dilli_da_dhaba.urls'
 # ---------------------------------------------------------------------------
 TEMPLATES = [
     {
-        'BACKEND': 'django.template.backends.django.DjangoTemplates',
+        'NAME': 'django',
+        'BACKEND': 'core.template_backends.DjangoTemplates',
         'DIRS': [BASE_DIR / 'templates'],
         'APP_DIRS': True,
         'OPTIONS': {
             'context_processors': [
                 'django.template.context_processors.debug',
+                'django.template.context_processors.i18n',
                 'django.template.context_processors.request',
                 'django.contrib.auth.context_processors.auth',
                 'django.contrib.messages.context_processors.messages',
@@ -107,6 +119,26 @@ TEMPLATES = [
     },
 ]
 
+# Optional Jinja2 ports of the public templates (jinja2/). Views listed in
+# JINJA2_VIEWS by URL name render with it — see core/rendering.py.
+if importlib.util.find_spec('jinja2') is not None:
+    TEMPLATES.append({
+        'NAME': 'jinja2',
+        'BACKEND': 'django.template.backends.jinja2.Jinja2',
+        'DIRS': [BASE_DIR / 'jinja2'],
+        'APP_DIRS': False,
+        'OPTIONS': {
+            'environment': 'core.jinja2.environment',
+            'bytecode_cache_dir': env(
+                'JINJA2_BYTECODE_DIR',
+                default=os.path.join(tempfile.gettempdir(), 'dilli_da_dhaba_jinja2'),
+            ),
+        },
+    })
+JINJA2_VIEWS = env.list('JINJA2_VIEWS', default=[])
+if JINJA2_VIEWS and importlib.util.find_spec('jinja2') is None:
+    raise ImproperlyConfigured('JINJA2_VIEWS is set but jinja2 is not installed (pip install Jinja2).')
+
 WSGI_APPLICATION = 'dilli_da_dhaba.wsgi.application'
 
 # ---------------------------------------------------------------------------
@@ -119,6 +151,14 @@ DATABASES = {
     )
 }
 
+if DATABASES['default']['ENGINE'] == 'django.db.backends.sqlite3':
+    # Concurrent writers (order intake across gunicorn workers): take the
+    # write lock when a transaction starts and wait for it, instead of
+    # failing with "database is locked" when a read upgrades to a write.
+    DATABASES['default'].setdefault('OPTIONS', {})
+    DATABASES['default']['OPTIONS'].setdefault('transaction_mode', 'IMMEDIATE')
+    DATABASES['default']['OPTIONS'].setdefault('timeout', 20)
+
 # ---------------------------------------------------------------------------
 # AUTH
 # ---------------------------------------------------------------------------
@@ -132,22 +172,45 @@ AUTH_PASSWORD_VALIDATORS = [
 # ---------------------------------------------------------------------------
 # INTERNATIONALISATION
 # ---------------------------------------------------------------------------
-LANGUAGE_CODE = 'en-us'
+LANGUAGE_CODE = 'en'
 TIME_ZONE = 'Asia/Kolkata'
 USE_I18N = True
 USE_TZ = True
 
+# The menu is published once per language (menu/snapshot.py); Hindi names
+# come from MenuItem.name_hi / description_hi and Category.name_hi.
+LANGUAGES = [
+    ('en', 'English'),
+    ('hi', 'हिन्दी'),
+]
+
 # ---------------------------------------------------------------------------
 # STATIC & MEDIA
 # ---------------------------------------------------------------------------
 STATIC_URL = '/static/'
 STATIC_ROOT = BASE_DIR / 'staticfiles'
 STATICFILES_DIRS = [BASE_DIR / 'static']
-STATICFILES_STORAGE = 'whitenoise.storage.CompressedManifestStaticFilesStorage'
 
 MEDIA_URL = '/media/'
 MEDIA_ROOT = BASE_DIR / 'media'
 
+# Uploads get content-hashed names so core.media.serve_media can mark them
+# immutable. Swap "default" for Cloudinary below once keys are set.
+STORAGES = {
+    'default': {
+        'BACKEND': 'core.storage.HashedMediaStorage',
+    },
+    'staticfiles': {
+        'BACKEND': 'whitenoise.storage.CompressedManifestStaticFilesStorage',
+    },
+}
+
+# Hand media bodies to the front-end server instead of streaming them from
+# Python: an nginx `internal` location aliased to MEDIA_ROOT (e.g.
+# "/protected-media/"), or a sendfile header such as "X-Sendfile".
+MEDIA_ACCEL_REDIRECT_PREFIX = env('MEDIA_ACCEL_REDIRECT_PREFIX', default='')
+MEDIA_SENDFILE_HEADER       = env('MEDIA_SENDFILE_HEADER', default='')
+
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
 # ---------------------------------------------------------------------------
@@ -158,14 +221,14 @@ DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 #     'API_KEY':    env('CLOUDINARY_API_KEY'),
 #     'API_SECRET': env('CLOUDINARY_API_SECRET'),
 # }
-# DEFAULT_FILE_STORAGE = 'cloudinary_storage.storage.MediaCloudinaryStorage'
+# STORAGES['default'] = {'BACKEND': 'cloudinary_storage.storage.MediaCloudinaryStorage'}
 
 # ---------------------------------------------------------------------------
 # DRF
 # ---------------------------------------------------------------------------
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': (
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        'accounts.authentication.CachedJWTAuthentication',
         'rest_framework.authentication.SessionAuthentication',
     ),
     'DEFAULT_PERMISSION_CLASSES': (
@@ -175,13 +238,110 @@ REST_FRAMEWORK = {
         'rest_framework.renderers.JSONRenderer',
     ),
     'DEFAULT_THROTTLE_CLASSES': [
-        'rest_framework.throttling.AnonRateThrottle',
+        'core.throttling.SharedAnonRateThrottle',
     ],
     'DEFAULT_THROTTLE_RATES': {
-        'anon': '120/min',
+        'anon': env('ANON_THROTTLE_RATE', default='120/min') or None,   # '' = off (loadtest --no-throttle)
+        'login_ip': '20/min',
+        'login_user': '5/min',
+        'orders': env('ORDER_THROTTLE_RATE', default='10/min'),
     },
 }
 
+# ---------------------------------------------------------------------------
+# CACHES & THROTTLING
+# ---------------------------------------------------------------------------
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    },
+}
+
+# Token buckets for core.throttling — 'sqlite' shares one local file across
+# all gunicorn workers; 'cache' uses THROTTLE_CACHE_ALIAS (e.g. Redis).
+THROTTLE_STORE = env('THROTTLE_STORE', default='sqlite')
+THROTTLE_DB_PATH = env(
+    'THROTTLE_DB_PATH',
+    default=os.path.join(tempfile.gettempdir(), 'dilli_da_dhaba_throttle.sqlite3'),
+)
+THROTTLE_CACHE_ALIAS = env('THROTTLE_CACHE_ALIAS', default='default')
+
+# Rendered /menu/ card grids (menu/fragments.py), keyed by menu snapshot id.
+MENU_FRAGMENT_CACHE_ALIAS = env('MENU_FRAGMENT_CACHE_ALIAS', default='default')
+
+# core.compression — minified, gzip/brotli HTML responses, cached per worker
+# by content hash (entries, each holding every encoding served so far).
+HTML_MINIFY            = env.bool('HTML_MINIFY', default=True)
+HTML_OUTPUT_CACHE_SIZE = env.int('HTML_OUTPUT_CACHE_SIZE', default=128)
+
+# Dish photos the service worker keeps for offline use (oldest evicted).
+SW_IMAGE_CACHE_ENTRIES = env.int('SW_IMAGE_CACHE_ENTRIES', default=80)
+
+# core.edge / core.purge — CDN caching of public responses. The edge keeps
+# them for s-maxage and is purged by surrogate key when data changes;
+# browsers revalidate after max-age. Off unless the purge backend reaches
+# the CDN: with the in-process backends an admin edit would stay hidden
+# behind a shared cache for up to s-maxage.
+EDGE_PURGE_BACKEND         = env('EDGE_PURGE_BACKEND', default='core.purge.LocMemPurgeBackend')
+EDGE_CACHE_ENABLED         = env.bool(
+    'EDGE_CACHE_ENABLED', default=EDGE_PURGE_BACKEND == 'core.purge.FastlyPurgeBackend',
+)
+EDGE_SURROGATE_KEY_HEADER  = env('EDGE_SURROGATE_KEY_HEADER', default='Surrogate-Key')
+FASTLY_SERVICE_ID          = env('FASTLY_SERVICE_ID', default='')
+FASTLY_API_TOKEN           = env('FASTLY_API_TOKEN', default='')
+EDGE_CACHE_POLICIES = {
+    'menu':        {'max_age': 60,   's_maxage': 86400,  'stale_while_revalidate': 3600, 'stale_if_error': 86400},
+    'page':        {'max_age': 60,   's_maxage': 86400,  'stale_while_revalidate': 3600, 'stale_if_error': 86400},
+    'reviews':     {'max_age': 300,  's_maxage': 3600,   'stale_while_revalidate': 600,  'stale_if_error': 86400},
+    'static_page': {'max_age': 3600, 's_maxage': 604800, 'stale_while_revalidate': 3600, 'stale_if_error': 604800},
+}
+
+# accounts.throttling — at most this many workers instance-wide may be
+# running the password hasher for /api/auth/token/ at once.
+LOGIN_MAX_CONCURRENT = env.int('LOGIN_MAX_CONCURRENT', default=1)
+LOGIN_SLOT_DIR = env('LOGIN_SLOT_DIR', default=tempfile.gettempdir())
+
+# ---------------------------------------------------------------------------
+# ORDER INTAKE (orders.intake)
+# ---------------------------------------------------------------------------
+# With write-behind on, POST /api/orders/ validates and answers 202 at once;
+# a background thread per worker inserts queued orders in batches. Queued
+# orders are flushed on clean worker shutdown; when the queue is full,
+# requests fall back to writing synchronously. The queue is in memory: a
+# worker killed by a timeout or the OOM killer loses orders it accepted,
+# and other workers 404 an order until it is written (orders/intake.py).
+ORDERS_WRITE_BEHIND = env.bool('ORDERS_WRITE_BEHIND', default=False)
+ORDERS_BATCH_SIZE   = env.int('ORDERS_BATCH_SIZE', default=200)
+ORDERS_FLUSH_MS     = env.int('ORDERS_FLUSH_MS', default=20)
+ORDERS_QUEUE_MAX    = env.int('ORDERS_QUEUE_MAX', default=5000)
+
+# ---------------------------------------------------------------------------
+# REQUEST PROFILING (core.profiling)
+# ---------------------------------------------------------------------------
+# Staff can profile any request with ?_profile=1 or an `X-Profile: 1`
+# header; PROFILE_SAMPLE_RATE additionally profiles a random fraction.
+PROFILE_SAMPLE_RATE = env.float('PROFILE_SAMPLE_RATE', default=0.0)
+PROFILE_MODE        = env('PROFILE_MODE', default='sampling')   # or 'cprofile'
+PROFILE_INTERVAL_MS = env.float('PROFILE_INTERVAL_MS', default=1.0)
+PROFILE_DIR         = env('PROFILE_DIR', default=str(BASE_DIR / 'profiles'))
+PROFILE_MAX_FILES   = env.int('PROFILE_MAX_FILES', default=50)
+
+# ---------------------------------------------------------------------------
+# QUERY LOG (core.querylog)
+# ---------------------------------------------------------------------------
+# Per-fingerprint query statistics, flushed by every worker to one local
+# SQLite file (`manage.py query_report`); queries over SLOW_QUERY_MS are
+# logged with their view and call site. Opt-in, like the request profiler:
+# turn it on while diagnosing, not permanently in production.
+QUERYLOG_ENABLED          = env.bool('QUERYLOG_ENABLED', default=False)
+SLOW_QUERY_MS             = env.float('SLOW_QUERY_MS', default=200.0)
+QUERYLOG_MAX_FINGERPRINTS = env.int('QUERYLOG_MAX_FINGERPRINTS', default=500)
+QUERYLOG_FLUSH_SECONDS    = env.float('QUERYLOG_FLUSH_SECONDS', default=30.0)
+QUERYLOG_DB_PATH          = env(
+    'QUERYLOG_DB_PATH',
+    default=os.path.join(tempfile.gettempdir(), 'dilli_da_dhaba_querylog.sqlite3'),
+)
+
 # ---------------------------------------------------------------------------
 # SIMPLEJWT
 # ---------------------------------------------------------------------------
@@ -189,8 +349,14 @@ SIMPLE_JWT = {
     'ACCESS_TOKEN_LIFETIME': timedelta(minutes=60),
     'REFRESH_TOKEN_LIFETIME': timedelta(days=7),
     'ROTATE_REFRESH_TOKENS': True,
+    'TOKEN_OBTAIN_SERIALIZER': 'accounts.serializers.StaffClaimsTokenObtainPairSerializer',
 }
 
+# accounts.authentication — verified-token LRU size (per worker) and how
+# often each worker reloads the revoked-jti blocklist.
+JWT_VERIFIED_CACHE_SIZE = env.int('JWT_VERIFIED_CACHE_SIZE', default=1024)
+JWT_BLOCKLIST_REFRESH_SECONDS = env.int('JWT_BLOCKLIST_REFRESH_SECONDS', default=5)
+
 # ---------------------------------------------------------------------------
 # CORS
 # ---------------------------------------------------------------------------
@@ -1,7 +1,8 @@
 from django.contrib import admin
-from django.urls import path, include
+from django.urls import path, include, re_path
 from django.conf import settings
-from django.conf.urls.static import static
+
+from core.media import serve_media
 
 # Customise built-in admin site labels from settings
 admin.site.site_header = settings.ADMIN_SITE_HEADER
@@ -14,6 +15,10 @@ urlpatterns = [
 
     # Public API
     path('api/', include('menu.api_urls')),
+    path('api/', include('reviews.api_urls')),
+
+    # Online orders
+    path('api/orders/', include('orders.urls')),
 
     # JWT auth tokens
     path('api/auth/', include('accounts.urls')),
@@ -21,7 +26,7 @@ urlpatterns = [
     # Template-rendered pages
     path('', include('core.urls')),
     path('menu/', include('menu.urls')),
-]
 
-if settings.DEBUG:
-    urlpatterns += static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
+    # Uploaded media (menu photos) — in every environment, see core/media.py
+    re_path(r'^%s(?P<path>.+)$' % settings.MEDIA_URL.lstrip('/'), serve_media, name='media'),
+]
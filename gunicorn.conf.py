@@ -0,0 +1,91 @@
+"""
+gunicorn.conf.py — production server settings (read automatically by
+gunicorn from the working directory, and passed explicitly in render.yaml).
+
+Sizing:
+  * workers — (2 × CPUs + 1), capped by how many WEB_WORKER_MEMORY_MB
+    budgets fit into the container's memory limit, never below 1.
+  * threads — gthread workers; admin image uploads and DB waits are
+    I/O-bound, so a few threads per worker keep one slow upload from
+    blocking the menu.
+Every value can be overridden through the environment variables below
+(see `python manage.py measure_gunicorn` to compare configurations).
+
+The Django app is preloaded in the master so workers share its memory
+copy-on-write; URL patterns and compiled templates are warmed once
+before forking.
+"""
+import os
+
+
+def _cpu_count():
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:  # macOS / Windows
+        return os.cpu_count() or 1
+
+
+def _memory_limit_mb():
+    """Container memory limit (cgroup v2 / v1), else physical RAM."""
+    for path in ('/sys/fs/cgroup/memory.max',
+                 '/sys/fs/cgroup/memory/memory.limit_in_bytes'):
+        try:
+            with open(path) as fh:
+                raw = fh.read().strip()
+        except OSError:
+            continue
+        if raw.isdigit() and int(raw) < 1 << 60:
+            return int(raw) // (1024 * 1024)
+    try:
+        with open('/proc/meminfo') as fh:
+            for line in fh:
+                if line.startswith('MemTotal:'):
+                    return int(line.split()[1]) // 1024
+    except OSError:
+        pass
+    return None
+
+
+def _default_workers():
+    by_cpu = 2 * _cpu_count() + 1
+    memory = _memory_limit_mb()
+    if memory is None:
+        return by_cpu
+    per_worker = int(os.environ.get('WEB_WORKER_MEMORY_MB', 120))
+    return max(1, min(by_cpu, memory // per_worker))
+
+
+bind = f"0.0.0.0:{os.environ.get('PORT', '8000')}"
+
+workers      = int(os.environ.get('WEB_CONCURRENCY', _default_workers()))
+worker_class = os.environ.get('GUNICORN_WORKER_CLASS', 'gthread')
+threads      = int(os.environ.get('GUNICORN_THREADS', 4))
+preload_app  = os.environ.get('GUNICORN_PRELOAD', 'true').lower() == 'true'
+
+timeout          = int(os.environ.get('GUNICORN_TIMEOUT', 30))
+graceful_timeout = 30
+keepalive        = 5
+
+# Recycle workers periodically to cap slow leaks; jitter stops every
+# worker from restarting at the same moment.
+max_requests        = int(os.environ.get('GUNICORN_MAX_REQUESTS', 1000))
+max_requests_jitter = int(os.environ.get('GUNICORN_MAX_REQUESTS_JITTER', 100))
+
+accesslog = '-'
+errorlog  = '-'
+
+
+def when_ready(server):
+    # With preload_app the master has already imported Django; anything
+    # warmed here is inherited by every worker copy-on-write.
+    if preload_app:
+        from core.warmup import warm_shared
+        warm_shared()
+
+
+def post_worker_init(worker):
+    # Runs in each forked worker once the WSGI app is loaded — unlike
+    # post_fork, which fires before a non-preloaded worker imports Django.
+    if not preload_app:
+        from core.warmup import warm_shared
+        warm_shared()
@@ -1,14 +1,88 @@
+from django import forms
 from django.contrib import admin
+from django.contrib.admin import helpers
+from django.core.exceptions import PermissionDenied
+from django.db import transaction
+from django.db.models import Q
+from django.http import Http404, JsonResponse
+from django.template.response import TemplateResponse
+from django.templatetags.static import static
+from django.urls import path, reverse
+from django.utils import timezone
+from django.utils.decorators import method_decorator
 from django.utils.html import format_html
-from .models import Category, MenuItem
+from django.views.decorators.http import require_POST
+
+from core.pagination import EstimatedCountPaginator
+
+from . import facets, pricing, search, snapshot
+from .models import AvailabilityWindow, Category, MenuItem, MenuSnapshot, Outlet, OutletItemOverride
+
+# Flags switched from the changelist with one single-row UPDATE each
+# (js/admin_toggles.js) rather than a list_editable formset post.
+TOGGLE_FIELDS = ('featured', 'is_available')
+
+
+class PriceAdjustmentForm(forms.Form):
+    """Intermediate form for MenuItemAdmin.adjust_prices."""
+    change   = forms.ChoiceField(choices=[
+        ('percent', 'Percentage (%)'),
+        ('flat',    'Flat amount (₹)'),
+    ])
+    amount   = forms.DecimalField(
+        max_digits=8, decimal_places=2,
+        help_text='Negative to lower prices, e.g. 10 = +10 % or +₹10, -5 = −5 % or −₹5.',
+    )
+    rounding = forms.ChoiceField(
+        choices=[
+            ('paisa', 'Nearest paisa'),
+            ('rupee', 'Nearest ₹1'),
+            ('five',  'Nearest ₹5'),
+            ('ten',   'Nearest ₹10'),
+        ],
+        initial='rupee',
+    )
+
+    def clean_amount(self):
+        amount = self.cleaned_data['amount']
+        if amount == 0:
+            raise forms.ValidationError('Enter a non-zero change.')
+        if self.data.get('change') == 'percent' and amount <= -100:
+            raise forms.ValidationError('A decrease must be less than 100 %.')
+        return amount
+
+
+class MissingTranslationFilter(admin.SimpleListFilter):
+    """Items whose Hindi name or description is still empty (shown in English)."""
+    title          = 'Hindi translation'
+    parameter_name = 'hindi'
+
+    def lookups(self, request, model_admin):
+        return [('missing', 'Missing'), ('done', 'Translated')]
+
+    def queryset(self, request, queryset):
+        missing = Q(name_hi='') | (~Q(description='') & Q(description_hi=''))
+        if self.value() == 'missing':
+            return queryset.filter(missing)
+        if self.value() == 'done':
+            return queryset.exclude(missing)
+        return queryset
+
+
+class AvailabilityWindowInline(admin.TabularInline):
+    """Serving times; a dish's own windows replace its category's (menu/schedule.py)."""
+    model  = AvailabilityWindow
+    extra  = 0
+    fields = ('label', 'days', 'start_time', 'end_time')
 
 
 @admin.register(Category)
 class CategoryAdmin(admin.ModelAdmin):
-    list_display  = ('name', 'display_order', 'item_count', 'created_at')
-    list_editable = ('display_order',)
+    list_display  = ('name', 'name_hi', 'display_order', 'item_count', 'created_at')
+    list_editable = ('name_hi', 'display_order')
     ordering      = ('display_order',)
-    search_fields = ('name',)
+    search_fields = ('name', 'name_hi')
+    inlines       = (AvailabilityWindowInline,)
 
     @admin.display(description='Items')
     def item_count(self, obj):
@@ -17,15 +91,21 @@ class CategoryAdmin(admin.ModelAdmin):
 
 @admin.register(MenuItem)
 class MenuItemAdmin(admin.ModelAdmin):
+    """
+    Built for menus with tens of thousands of rows: one query for the page
+    (category joined in), an estimated total on PostgreSQL, indexed search
+    (menu/search.py) and per-row AJAX toggles instead of list_editable.
+    """
     list_display = (
         'name',
         'category',
         'veg_badge',
         'price_display',
-        'featured',
-        'is_available',
+        'featured_toggle',
+        'available_toggle',
         'needs_verification',
         'image_preview',
+        'name_hi',
     )
     list_filter  = (
         'category',
@@ -34,15 +114,26 @@ class MenuItemAdmin(admin.ModelAdmin):
         'featured',
         'is_available',
         'needs_verification',
+        MissingTranslationFilter,
     )
-    list_editable = ('featured', 'is_available')
-    search_fields = ('name', 'description')
+    list_select_related    = ('category',)
+    list_per_page          = 50
+    paginator              = EstimatedCountPaginator
+    show_full_result_count = False
+    actions       = ['adjust_prices']
+    search_fields = ('name', 'name_hi', 'description')
     autocomplete_fields = ('category',)
     readonly_fields = ('image_preview', 'created_at', 'updated_at')
+    inlines         = (AvailabilityWindowInline,)
     fieldsets = (
         ('Basic Info', {
             'fields': ('category', 'name', 'description', 'veg', 'egg'),
         }),
+        ('Hindi', {
+            'fields': ('name_hi', 'description_hi'),
+            'description': 'Shown to visitors reading the menu in Hindi; '
+                           'leave empty to show the English text.',
+        }),
         ('Pricing', {
             'fields': ('price_regular', 'price_half', 'price_full'),
             'description': 'Fill price_regular for single-portion items, '
@@ -72,6 +163,93 @@ class MenuItemAdmin(admin.ModelAdmin):
     def price_display(self, obj):
         return obj.display_price
 
+    def _toggle(self, obj, field):
+        value = getattr(obj, field)
+        return format_html(
+            '<button type="button" class="menu-toggle" data-url="{}" aria-pressed="{}"'
+            ' style="border:0;background:none;padding:0;cursor:pointer">'
+            '<img src="{}" alt="{}"></button>',
+            reverse('admin:menu_menuitem_toggle', args=[obj.pk, field]),
+            'true' if value else 'false',
+            static(f'admin/img/icon-{"yes" if value else "no"}.svg'),
+            value,
+        )
+
+    @admin.display(description='Featured', ordering='featured')
+    def featured_toggle(self, obj):
+        return self._toggle(obj, 'featured')
+
+    @admin.display(description='Available', ordering='is_available')
+    def available_toggle(self, obj):
+        return self._toggle(obj, 'is_available')
+
+    def get_urls(self):
+        return [
+            path('<int:pk>/toggle/<str:field>/', self.admin_site.admin_view(self.toggle_view),
+                 name='menu_menuitem_toggle'),
+        ] + super().get_urls()
+
+    @method_decorator(require_POST)
+    def toggle_view(self, request, pk, field):
+        """POST value=1|0 — set one flag of one item with a single-row UPDATE."""
+        if field not in TOGGLE_FIELDS:
+            raise Http404
+        if not self.has_change_permission(request):
+            raise PermissionDenied
+        obj = MenuItem.objects.select_related('category').filter(pk=pk).first()
+        if obj is None:
+            raise Http404
+        value = request.POST.get('value') == '1'
+        with transaction.atomic():
+            MenuItem.objects.filter(pk=pk).update(**{field: value, 'updated_at': timezone.now()})
+            # update() sends no signals: keep the facet counts in step and republish.
+            old_key = obj.facet_key()
+            setattr(obj, field, value)
+            facets.record_change(old_key, obj.facet_key())
+            snapshot.schedule_publish()
+        self.log_change(request, obj, [{'changed': {'fields': [MenuItem._meta.get_field(field).verbose_name]}}])
+        return JsonResponse({'id': pk, field: value})
+
+    def get_search_results(self, request, queryset, search_term):
+        if search.is_indexed(queryset) and search.has_words(search_term):
+            return search.search(queryset, search_term), False
+        return super().get_search_results(request, queryset, search_term)
+
+    class Media:
+        js = ('js/admin_toggles.js',)
+
+    @admin.action(description='Adjust prices of selected items…')
+    def adjust_prices(self, request, queryset):
+        """
+        Percentage or flat change to every price of the selection, applied as
+        one UPDATE (filter by category first to reprice a whole section).
+        """
+        form = PriceAdjustmentForm(request.POST if 'apply' in request.POST else None)
+        if form.is_valid():
+            data = form.cleaned_data
+            if data['change'] == 'percent':
+                updated = pricing.adjust_prices(queryset, percent=data['amount'],
+                                                rounding=data['rounding'])
+            else:
+                updated = pricing.adjust_prices(queryset,
+                                                flat_paise=pricing.to_paise(data['amount']),
+                                                rounding=data['rounding'])
+            # queryset.update() sends no signals; republish explicitly.
+            snapshot.schedule_publish()
+            self.message_user(request, f'Prices adjusted on {updated} item(s).')
+            return None
+
+        return TemplateResponse(request, 'admin/menu/menuitem/adjust_prices.html', {
+            **self.admin_site.each_context(request),
+            'title':           'Adjust prices',
+            'opts':            self.model._meta,
+            'form':            form,
+            'queryset':        queryset,
+            'item_count':      queryset.count(),
+            'action_checkbox_name': helpers.ACTION_CHECKBOX_NAME,
+            'select_across':   request.POST.get('select_across', '0'),
+        })
+
     @admin.display(description='Image')
     def image_preview(self, obj):
         if obj.image:
@@ -80,3 +258,53 @@ class MenuItemAdmin(admin.ModelAdmin):
                 obj.image.url,
             )
         return '—'
+
+
+class OutletItemOverrideInline(admin.TabularInline):
+    model               = OutletItemOverride
+    extra               = 0
+    autocomplete_fields = ('item',)
+    fields              = ('item', 'price_regular', 'price_half', 'price_full',
+                           'is_available', 'featured')
+
+
+@admin.register(Outlet)
+class OutletAdmin(admin.ModelAdmin):
+    list_display        = ('name', 'slug', 'is_active', 'override_count', 'created_at')
+    list_filter         = ('is_active',)
+    search_fields       = ('name', 'slug')
+    prepopulated_fields = {'slug': ('name',)}
+    inlines             = (OutletItemOverrideInline,)
+
+    @admin.display(description='Overrides')
+    def override_count(self, obj):
+        return obj.overrides.count()
+
+
+@admin.register(MenuSnapshot)
+class MenuSnapshotAdmin(admin.ModelAdmin):
+    list_display = ('id', 'outlet', 'language', 'created_at', 'published_at', 'category_count',
+                    'item_count', 'is_live')
+    list_filter  = ('outlet', 'language')
+    list_select_related = ('outlet',)
+    exclude      = ('payload',)
+    actions      = ('make_live',)
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+    @admin.display(description='Live', boolean=True)
+    def is_live(self, obj):
+        return obj.pk == snapshot.live_snapshot_id(obj.outlet.slug if obj.outlet_id else None, obj.language)
+
+    @admin.action(description='Make selected snapshot live (roll back / forward)')
+    def make_live(self, request, queryset):
+        if queryset.count() != 1:
+            self.message_user(request, 'Select exactly one snapshot.', level='error')
+            return
+        target = queryset.get()
+        snapshot.flip(target)
+        self.message_user(request, f'{target} is now live.')
@@ -1,11 +1,15 @@
 """
 URL routes that live under /api/
+
+Views are imported on first use (see core.lazy) so template-only traffic
+never loads DRF.
 """
 from django.urls import path
-from .api_views import category_list, menu_list, featured_items
+
+from core.lazy import lazy_view
 
 urlpatterns = [
-    path('categories', category_list,  name='api-categories'),
-    path('menu',       menu_list,       name='api-menu'),
-    path('featured',   featured_items,  name='api-featured'),
+    path('categories', lazy_view('menu.api_views.category_list', csrf=False), name='api-categories'),
+    path('menu',       lazy_view('menu.api_views.menu_list', csrf=False),     name='api-menu'),
+    path('featured',   lazy_view('menu.api_views.featured_items', csrf=False), name='api-featured'),
 ]
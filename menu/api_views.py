@@ -1,32 +1,67 @@
 """
 DRF API views for the public-facing Menu API.
 All endpoints are read-only and unauthenticated.
+
+authentication_classes([]) skips JWT decoding and the session/user lookup
+that DEFAULT_AUTHENTICATION_CLASSES would otherwise run whenever a browser
+sends its admin session cookie along with a public API call.
 """
-from rest_framework.decorators import api_view, permission_classes, throttle_classes
+from rest_framework.decorators import (
+    api_view,
+    authentication_classes,
+    permission_classes,
+    throttle_classes,
+)
+from rest_framework.exceptions import NotFound
 from rest_framework.permissions import AllowAny
 from rest_framework.response import Response
-from rest_framework.throttling import AnonRateThrottle
 
-from .models import Category, MenuItem
-from .serializers import (
-    CategoryListSerializer,
-    MenuItemSerializer,
-)
+from core import edge
+from core.throttling import SharedAnonRateThrottle
+
+from .fragments import DIET_FILTERS
+from .models import Outlet
+from .snapshot import get_live_snapshot
+
 
+def _live_payload(request):
+    """Live snapshot payload for ?outlet=<slug>, or the base menu without it."""
+    try:
+        _, payload = get_live_snapshot(request.query_params.get('outlet') or None)
+    except Outlet.DoesNotExist:
+        raise NotFound('Unknown outlet.')
+    return payload
 
+
+def _with_absolute_images(request, items):
+    """Snapshots store relative image URLs; absolutize them per request."""
+    return [
+        {**item, 'image_url': request.build_absolute_uri(item['image_url'])}
+        if item['image_url'] else item
+        for item in items
+    ]
+
+
+@edge.edge_cache('menu')
 @api_view(['GET'])
+@authentication_classes([])
 @permission_classes([AllowAny])
-@throttle_classes([AnonRateThrottle])
+@throttle_classes([SharedAnonRateThrottle])
 def category_list(request):
     """GET /api/categories — list all categories ordered by display_order."""
-    qs = Category.objects.all()
-    serializer = CategoryListSerializer(qs, many=True, context={'request': request})
-    return Response(serializer.data)
+    payload = _live_payload(request)
+    keys = {edge.MENU, edge.CATEGORIES}
+    if request.query_params.get('outlet'):
+        keys.add(edge.outlet_key(request.query_params['outlet']))
+    response = edge.expire_at(Response(payload['categories']), payload['changes_at'])
+    return edge.add_keys(response, keys)
 
 
+@edge.edge_cache('menu')
 @api_view(['GET'])
+@authentication_classes([])
 @permission_classes([AllowAny])
-@throttle_classes([AnonRateThrottle])
+@throttle_classes([SharedAnonRateThrottle])
 def menu_list(request):
     """
     GET /api/menu               — full available menu
@@ -34,37 +69,44 @@ def menu_list(request):
     GET /api/menu?diet=veg      — veg items only (no egg)
     GET /api/menu?diet=egg      — egg items only
     GET /api/menu?diet=nonveg   — non-veg, non-egg items only
+    GET /api/menu?outlet=<slug> — a branch's menu with its overrides applied
+
+    Served from the live menu snapshot (menu/snapshot.py).
     """
-    qs = (
-        MenuItem.objects.filter(is_available=True)
-        .select_related('category')
-        .order_by('category__display_order', 'name')
-    )
+    payload = _live_payload(request)
+    items = payload['items']
 
     category_id = request.query_params.get('category')
     if category_id:
-        qs = qs.filter(category_id=category_id)
+        try:
+            category_id = int(category_id)
+        except ValueError:
+            return Response({'detail': 'category must be an integer id.'}, status=400)
+        items = [item for item in items if item['category'] == category_id]
+        category_ids = [category_id]
+    else:
+        category_ids = [c['id'] for c in payload['categories']]
 
-    diet = request.query_params.get('diet')
-    if diet == 'veg':
-        qs = qs.filter(veg=True, egg=False)
-    elif diet == 'egg':
-        qs = qs.filter(egg=True)
-    elif diet == 'nonveg':
-        qs = qs.filter(veg=False, egg=False)
+    diet_filter = DIET_FILTERS.get(request.query_params.get('diet'))
+    if diet_filter:
+        items = [item for item in items if diet_filter(item)]
 
-    serializer = MenuItemSerializer(qs, many=True, context={'request': request})
-    return Response(serializer.data)
+    keys = edge.menu_keys(items, category_ids, request.query_params.get('outlet'))
+    if not category_id:
+        keys.add(edge.CATEGORIES)   # a new category's dishes appear here too
+    response = edge.expire_at(Response(_with_absolute_images(request, items)), payload['changes_at'])
+    return edge.add_keys(response, keys)
 
 
+@edge.edge_cache('menu')
 @api_view(['GET'])
+@authentication_classes([])
 @permission_classes([AllowAny])
-@throttle_classes([AnonRateThrottle])
+@throttle_classes([SharedAnonRateThrottle])
 def featured_items(request):
     """GET /api/featured — items marked as featured and available."""
-    qs = (
-        MenuItem.objects.filter(featured=True, is_available=True)
-        .select_related('category')
-    )
-    serializer = MenuItemSerializer(qs, many=True, context={'request': request})
-    return Response(serializer.data)
+    payload = _live_payload(request)
+    items = [item for item in payload['items'] if item['featured']]
+    keys = edge.menu_keys(items, outlet=request.query_params.get('outlet')) | {edge.FEATURED}
+    response = edge.expire_at(Response(_with_absolute_images(request, items)), payload['changes_at'])
+    return edge.add_keys(response, keys)
@@ -0,0 +1,107 @@
+"""
+Incremental maintenance of MenuFacet (item counts per category × diet ×
+availability).
+
+Every item contributes 1 to the row of its MenuItem.facet_key(). Changes
+are applied as F() deltas:
+
+  * single saves / deletes — through signals (menu/signals.py), using
+    the values the row had when it was loaded (MenuItem._counted)
+  * updates that bypass save() (the admin's availability toggle) call
+    record_change() themselves
+  * bulk rewrites (seed_menu) call rebuild() at the end
+
+Counts reach readers through the menu snapshot: BaseMenu reads the
+available counts once per publish (counts()) and stores them on each
+category, so /menu/ and /api/categories read them for free.
+check() compares the table with a fresh GROUP BY
+(`manage.py check_menu_facets`).
+"""
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F
+
+from .models import MenuFacet, MenuItem, diet_of
+
+DIETS = [value for value, _ in MenuFacet.DIETS]
+
+
+def empty_counts():
+    return {'all': 0, **{diet: 0 for diet in DIETS}}
+
+
+def apply_delta(key, delta):
+    """Add `delta` items to the facet `key` = (category id, diet, is_available)."""
+    category_id, diet, is_available = key
+    rows = MenuFacet.objects.filter(category_id=category_id, diet=diet, is_available=is_available)
+    if rows.update(count=F('count') + delta):
+        return
+    try:
+        with transaction.atomic():
+            MenuFacet.objects.create(
+                category_id=category_id, diet=diet, is_available=is_available, count=delta,
+            )
+    except IntegrityError:
+        # Created concurrently — apply to that row instead.
+        rows.update(count=F('count') + delta)
+
+
+def record_change(old_key, new_key):
+    """Apply the difference between two MenuItem.facet_key() values."""
+    if old_key == new_key:
+        return
+    if old_key is not None:
+        apply_delta(old_key, -1)
+    if new_key is not None:
+        apply_delta(new_key, +1)
+
+
+def computed():
+    """{facet key: count} straight from the MenuItem table."""
+    grouped = (
+        MenuItem.objects.order_by()
+        .values('category_id', 'veg', 'egg', 'is_available').annotate(n=Count('id'))
+    )
+    totals = {}
+    for group in grouped:
+        key = (group['category_id'], diet_of(group['veg'], group['egg']), group['is_available'])
+        totals[key] = totals.get(key, 0) + group['n']
+    return totals
+
+
+def stored():
+    """{facet key: count} as MenuFacet holds it (zero rows left out)."""
+    return {
+        (row.category_id, row.diet, row.is_available): row.count
+        for row in MenuFacet.objects.exclude(count=0)
+    }
+
+
+def rebuild():
+    """Recompute every facet row from the MenuItem table."""
+    rows = [
+        MenuFacet(category_id=category_id, diet=diet, is_available=is_available, count=n)
+        for (category_id, diet, is_available), n in computed().items()
+    ]
+    with transaction.atomic():
+        MenuFacet.objects.all().delete()
+        MenuFacet.objects.bulk_create(rows)
+
+
+def check():
+    """[(key, stored count, actual count)] for every facet that has drifted."""
+    actual, current = computed(), stored()
+    return [
+        (key, current.get(key, 0), actual.get(key, 0))
+        for key in sorted(actual.keys() | current.keys(), key=str)
+        if current.get(key, 0) != actual.get(key, 0)
+    ]
+
+
+def counts():
+    """{category id: {'all': n, 'veg': n, 'egg': n, 'nonveg': n}} of available items."""
+    per_category = {}
+    for row in MenuFacet.objects.filter(is_available=True).exclude(count=0):
+        entry = per_category.setdefault(row.category_id, empty_counts())
+        entry[row.diet] += row.count
+        entry['all'] += row.count
+    return per_category
@@ -0,0 +1,76 @@
+from decimal import Decimal
+
+from django import forms
+from django.core.exceptions import ValidationError
+from django.db import models
+
+from .pricing import to_paise, to_rupees
+
+
+class RupeeFormField(forms.DecimalField):
+    """Edits a paise value as rupees ("179.00") and cleans back to paise."""
+
+    def __init__(self, **kwargs):
+        kwargs.setdefault('max_digits', 10)
+        kwargs.setdefault('decimal_places', 2)
+        kwargs.setdefault('min_value', Decimal('0'))
+        super().__init__(**kwargs)
+
+    def prepare_value(self, value):
+        if isinstance(value, int):
+            return to_rupees(value)
+        return value
+
+    def clean(self, value):
+        return to_paise(super().clean(value))
+
+    def has_changed(self, initial, data):
+        # `initial` is the model's paise; compare in paise, not paise vs rupees.
+        if self.disabled:
+            return False
+        try:
+            data = to_paise(self.to_python(data))
+            if not isinstance(initial, int) and initial is not None:
+                initial = to_paise(self.to_python(initial))   # show_hidden_initial: rupees
+        except ValidationError:
+            return True
+        return initial != data
+
+
+class PaiseField(models.PositiveIntegerField):
+    """Money stored as integer paise, entered in forms as rupees."""
+
+    def formfield(self, **kwargs):
+        return super().formfield(**{'form_class': RupeeFormField, **kwargs})
+
+
+WEEKDAYS = [
+    (0, 'Mon'), (1, 'Tue'), (2, 'Wed'), (3, 'Thu'), (4, 'Fri'), (5, 'Sat'), (6, 'Sun'),
+]
+EVERY_DAY = 0b1111111
+
+
+class WeekdaysFormField(forms.TypedMultipleChoiceField):
+    """Edits a weekday bitmask as checkboxes and cleans back to the bitmask."""
+
+    widget = forms.CheckboxSelectMultiple
+
+    def __init__(self, **kwargs):
+        for unused in ('max_value', 'min_value', 'step_size'):
+            kwargs.pop(unused, None)
+        super().__init__(choices=WEEKDAYS, coerce=int, **kwargs)
+
+    def prepare_value(self, value):
+        if isinstance(value, int):
+            return [day for day, _ in WEEKDAYS if value & (1 << day)]
+        return value
+
+    def clean(self, value):
+        return sum(1 << day for day in super().clean(value))
+
+
+class WeekdaysField(models.PositiveSmallIntegerField):
+    """Days of the week as a bitmask (bit 0 = Monday), edited as checkboxes."""
+
+    def formfield(self, **kwargs):
+        return super().formfield(**{'form_class': WeekdaysFormField, **kwargs})
@@ -0,0 +1,124 @@
+"""
+Server-rendered menu cards for the /menu/ page.
+
+/menu/ ships the cards for its current filter in the initial HTML, and
+the category / diet tabs fetch just the card grid again with hx-get
+from /menu/cards/ (menu.views.menu_cards). Rendered grids are cached per
+(snapshot id, category, diet): the live snapshot id doubles as the menu
+version — every publish gets a new one, and each outlet has its own — so
+entries never need invalidating and old ones simply expire.
+
+The cards use the snapshot's relative image URLs, so a cached grid is
+the same for every request.
+
+The pills show item counts ("Veg (23)") from the counts stored on each
+snapshot category (menu/facets.py). An HTMX response carries the counts
+for its new filter as out-of-band swaps, next to the grid.
+"""
+from django.conf import settings
+from django.core.cache import caches
+from django.template.loader import render_to_string
+from django.utils.safestring import mark_safe
+
+ALL_CATEGORIES = 'all'
+DIET_FILTERS = {
+    'veg':    lambda item: item['veg'] and not item['egg'],
+    'egg':    lambda item: item['egg'],
+    'nonveg': lambda item: not item['veg'] and not item['egg'],
+}
+DIET_CHOICES = [
+    ('all',    'All'),
+    ('veg',    '🌿 Veg'),
+    ('egg',    '🥚 Egg'),
+    ('nonveg', '🔴 Non-Veg'),
+]
+CACHE_TIMEOUT = 24 * 60 * 60
+
+
+class InvalidFilter(ValueError):
+    pass
+
+
+def resolve_filters(params, categories):
+    """
+    Return (category, diet) from query params. `category` is a category id
+    or ALL_CATEGORIES and defaults to the first category; `diet` is a
+    DIET_FILTERS key or 'all'. Raises InvalidFilter for a malformed id.
+    """
+    category = params.get('category') or None
+    if category is None:
+        category = categories[0]['id'] if categories else ALL_CATEGORIES
+    elif category != ALL_CATEGORIES:
+        try:
+            category = int(category)
+        except ValueError:
+            raise InvalidFilter('category must be an integer id or "all".')
+    diet = params.get('diet')
+    if diet not in DIET_FILTERS:
+        diet = 'all'
+    return category, diet
+
+
+def filter_items(items, category, diet):
+    if category != ALL_CATEGORIES:
+        items = [item for item in items if item['category'] == category]
+    diet_filter = DIET_FILTERS.get(diet)
+    if diet_filter:
+        items = [item for item in items if diet_filter(item)]
+    return items
+
+
+def tab_counts(categories, category, diet):
+    """
+    Pill counts for a filter: ({category id or 'all': items in `diet`},
+    {diet or 'all': items in `category`}). Both are empty for snapshots
+    published before categories carried counts.
+    """
+    if not categories or 'counts' not in categories[0]:
+        return {}, {}
+    totals = {}
+    for c in categories:
+        for key, n in c['counts'].items():
+            totals[key] = totals.get(key, 0) + n
+    category_counts = {c['id']: c['counts'][diet] for c in categories}
+    category_counts[ALL_CATEGORIES] = totals[diet]
+    if category == ALL_CATEGORIES:
+        diet_counts = totals
+    else:
+        diet_counts = next((c['counts'] for c in categories if c['id'] == category), {})
+    return category_counts, diet_counts
+
+
+def pill_context(categories, category, diet):
+    """Template context for the pills: [(category, count)], total count, [(diet, label, count)]."""
+    category_counts, diet_counts = tab_counts(categories, category, diet)
+    return {
+        'category_tabs': [(c, category_counts.get(c['id'])) for c in categories],
+        'all_count': category_counts.get(ALL_CATEGORIES),
+        'diet_tabs': [(value, label, diet_counts.get(value)) for value, label in DIET_CHOICES],
+    }
+
+
+def render_counts(categories, category, diet, using=None):
+    """Out-of-band count updates for an HTMX response."""
+    return mark_safe(render_to_string(
+        'menu/_counts.html', pill_context(categories, category, diet), using=using,
+    ))
+
+
+def cache_key(snapshot_id, category, diet, segment=0):
+    # segment: the availability-window timeline entry in force (menu/schedule.py)
+    return f'menu:cards:{snapshot_id}.{segment}:{category}:{diet}'
+
+
+def render_cards(snapshot_id, payload, category, diet, using=None):
+    """The card grid HTML for one filter of one live snapshot, cached."""
+    cache = caches[settings.MENU_FRAGMENT_CACHE_ALIAS]
+    key = cache_key(snapshot_id, category, diet, payload.get('segment', 0))
+    html = cache.get(key)
+    if html is None:
+        html = render_to_string('menu/_cards.html', {
+            'items': filter_items(payload['items'], category, diet),
+        }, using=using)
+        cache.set(key, html, CACHE_TIMEOUT)
+    return mark_safe(html)
@@ -0,0 +1,105 @@
+"""
+Management command: bench_menu_fragments
+
+Usage:
+    python manage.py bench_menu_fragments
+    python manage.py bench_menu_fragments --requests 500 --outlet koramangala
+
+Compares the two ways /menu/ can get its dishes on screen, against the
+live menu snapshot:
+
+  * JSON   — GET /api/menu?category=&diet= (the Alpine client's path;
+    the browser still has to build every card itself)
+  * HTML   — the HTMX card grid from /menu/cards/, rendered
+    cold (cache miss) and served warm from the fragment cache
+
+For the first category and for "all", with and without a diet filter, it
+reports server time (p50) and response bytes, raw and gzipped. The full
+/menu/ page, which already contains the first category's cards, is
+measured too.
+"""
+import gzip
+import statistics
+import time
+
+from django.core.cache import caches
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.test import RequestFactory
+
+from menu import fragments
+from menu.api_views import menu_list
+from menu.snapshot import get_live_snapshot
+from menu.views import menu_cards, menu_page
+
+
+def _timed(call, requests):
+    timings = []
+    for _ in range(requests):
+        started = time.perf_counter()
+        response = call()
+        if hasattr(response, "render"):
+            response.render()
+        timings.append((time.perf_counter() - started) * 1000)
+        assert response.status_code == 200, response.status_code
+    return statistics.median(timings), response.content
+
+
+class Command(BaseCommand):
+    help = "Benchmark server-rendered menu fragments against the JSON API path."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--requests", type=int, default=300)
+        parser.add_argument("--outlet", default="", help="Outlet slug (default: base menu).")
+
+    def handle(self, *args, **options):
+        snapshot_id, payload = get_live_snapshot(options["outlet"] or None)
+        if not payload["categories"]:
+            raise CommandError("The live menu is empty — run seed_menu first.")
+
+        factory = RequestFactory()
+        cache = caches[settings.MENU_FRAGMENT_CACHE_ALIAS]
+        requests = options["requests"]
+        # Measure rendering, not the anonymous rate limit.
+        menu_list.cls.throttle_classes = []
+        base = {"outlet": options["outlet"]} if options["outlet"] else {}
+
+        first = payload["categories"][0]
+        self.stdout.write(
+            f"\n  snapshot {snapshot_id}: {len(payload['items'])} items, "
+            f"{len(payload['categories'])} categories, {requests} requests per row\n"
+        )
+        self.stdout.write(
+            f"  {'filter':<26}{'path':<12}{'p50 ms':>9}{'bytes':>10}{'gzip':>9}"
+        )
+        for category, label in ((first["id"], first["name"]), ("all", "All")):
+            for diet in ("all", "veg"):
+                params = {**base, "category": category}
+                if diet != "all":
+                    params["diet"] = diet
+                name = f"{label[:16]} / {diet}"
+
+                json_params = {k: v for k, v in params.items() if v != "all"}
+                self._row(name, "JSON", *_timed(
+                    lambda: menu_list(factory.get("/api/menu", json_params)), requests,
+                ))
+
+                key = fragments.cache_key(snapshot_id, category, diet, payload["segment"])
+                hx = lambda: menu_cards(factory.get("/menu/cards/", params, HTTP_HX_REQUEST="true"))
+
+                def cold():
+                    cache.delete(key)
+                    return hx()
+
+                self._row("", "HTML cold", *_timed(cold, requests))
+                self._row("", "HTML warm", *_timed(hx, requests))
+
+        self.stdout.write("")
+        self._row("/menu/ full page", "HTML warm", *_timed(
+            lambda: menu_page(factory.get("/menu/", base)), requests,
+        ))
+
+    def _row(self, name, path, p50, body):
+        self.stdout.write(
+            f"  {name:<26}{path:<12}{p50:>9.2f}{len(body):>10}{len(gzip.compress(body)):>9}"
+        )
@@ -0,0 +1,87 @@
+"""
+Management command: bench_menu_languages
+
+Usage:
+    python manage.py bench_menu_languages
+    python manage.py bench_menu_languages --requests 1000 --outlet koramangala
+
+Checks that serving the menu in another language costs the same as
+serving it in English. Each language has its own live snapshot
+(menu/snapshot.py), so a request should do the same work whatever it
+negotiates. Requests go through the full middleware stack with the test
+client, so language negotiation is included in the timing. For each path
+it reports throughput and p50 for English only, for every other language,
+and for a mixed stream that alternates languages the way real traffic
+does. The mixed stream shows whether the per-worker snapshot cache
+thrashes between languages.
+"""
+import itertools
+import statistics
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.test import Client
+from django.test.utils import override_settings
+
+from menu import snapshot
+from menu.api_views import category_list, featured_items, menu_list
+
+PATHS = ["/api/menu", "/api/categories", "/menu/?category=all"]
+
+
+class Command(BaseCommand):
+    help = "Benchmark per-language menu serving against single-language throughput."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--requests", type=int, default=500)
+        parser.add_argument("--outlet", default="", help="Outlet slug (default: base menu).")
+
+    def handle(self, *args, **options):
+        languages = snapshot.menu_languages()
+        outlet = options["outlet"] or None
+        for language in languages:
+            _, payload = snapshot.get_live_snapshot(outlet, language)
+            if not payload["items"]:
+                raise CommandError("The live menu is empty — run seed_menu first.")
+
+        # Measure serving, not the anonymous rate limit.
+        for view in (category_list, featured_items, menu_list):
+            view.cls.throttle_classes = []
+        client = Client()
+        requests = options["requests"]
+        streams = {f"{settings.LANGUAGE_CODE} only": [settings.LANGUAGE_CODE]}
+        streams.update({f"{code} only": [code] for code in languages if code != settings.LANGUAGE_CODE})
+        streams["mixed"] = languages
+
+        self.stdout.write(f"\n  {requests} requests per row, languages: {', '.join(languages)}\n")
+        self.stdout.write(f"  {'path':<24}{'stream':<12}{'req/s':>9}{'p50 ms':>9}{'vs ' + settings.LANGUAGE_CODE:>9}")
+        with override_settings(ALLOWED_HOSTS=["*"]):
+            for path in PATHS:
+                if outlet:
+                    path += ("&" if "?" in path else "?") + f"outlet={outlet}"
+                baseline, label = None, path
+                for name, stream in streams.items():
+                    rate, p50 = self._run(client, path, stream, requests)
+                    baseline = baseline or rate
+                    self.stdout.write(
+                        f"  {label:<24}{name:<12}{rate:>9.0f}{p50:>9.2f}{rate / baseline:>9.2f}"
+                    )
+                    label = ""
+
+    def _run(self, client, path, stream, requests):
+        languages = itertools.cycle(stream)
+        for _ in range(max(len(stream), requests // 5)):   # warm snapshots, fragments, caches
+            client.get(path, HTTP_ACCEPT_LANGUAGE=next(languages))
+        timings = []
+        started = time.perf_counter()
+        for _ in range(requests):
+            language = next(languages)
+            t0 = time.perf_counter()
+            response = client.get(path, HTTP_ACCEPT_LANGUAGE=language)
+            timings.append((time.perf_counter() - t0) * 1000)
+            if response.status_code != 200 or response["Content-Language"] != language:
+                raise CommandError(f"{path} [{language}]: {response.status_code} "
+                                   f"{response.get('Content-Language')}")
+        elapsed = time.perf_counter() - started
+        return requests / elapsed, statistics.median(timings)
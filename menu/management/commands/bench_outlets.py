@@ -0,0 +1,137 @@
+"""
+Management command: bench_outlets
+
+Usage:
+    python manage.py bench_outlets                      # 50 outlets × 1000 items
+    python manage.py bench_outlets --outlets 200 --items 2000 --overrides 100
+
+Creates a synthetic menu, outlets and per-outlet overrides inside a
+transaction that is rolled back at the end (nothing is left behind), then
+measures:
+
+  * publishing — base serialization, full republish (base + every
+    outlet), and rebuilding a single outlet after an override change
+  * serving — /api/menu?outlet=<slug> latency through the real view,
+    for one outlet versus all of them, to show resolution cost does not
+    grow with the number of outlets
+"""
+import random
+import statistics
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.test import RequestFactory
+
+from menu import snapshot
+from menu.models import Category, MenuItem, Outlet, OutletItemOverride
+
+
+class Command(BaseCommand):
+    help = "Benchmark per-outlet menu snapshot publishing and serving."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--outlets", type=int, default=50)
+        parser.add_argument("--items", type=int, default=1000)
+        parser.add_argument("--overrides", type=int, default=50,
+                            help="Overridden items per outlet.")
+        parser.add_argument("--requests", type=int, default=2000)
+
+    def handle(self, *args, **options):
+        with snapshot.publishing_paused(), transaction.atomic():
+            outlets = self._populate(options)
+            self._bench_publish(outlets)
+            self._bench_serve(outlets, options["requests"])
+            transaction.set_rollback(True)
+        snapshot._loaded.clear()
+        self.stdout.write("\n  (all benchmark rows rolled back)")
+
+    # ------------------------------------------------------------------
+    def _populate(self, options):
+        started = time.perf_counter()
+        categories = Category.objects.bulk_create([
+            Category(name=f"Bench Category {n}", display_order=100 + n) for n in range(20)
+        ])
+        MenuItem.objects.bulk_create([
+            MenuItem(
+                category=categories[n % len(categories)],
+                name=f"Bench Dish {n:05d}",
+                veg=n % 3 != 0,
+                price_regular=10000 + 100 * (n % 300),
+            )
+            for n in range(options["items"])
+        ], batch_size=500)
+        item_ids = list(
+            MenuItem.objects.filter(name__startswith="Bench Dish ").values_list("pk", flat=True)
+        )
+        outlets = Outlet.objects.bulk_create([
+            Outlet(name=f"Bench Outlet {n}", slug=f"bench-outlet-{n}")
+            for n in range(options["outlets"])
+        ])
+        rng = random.Random(42)
+        OutletItemOverride.objects.bulk_create([
+            OutletItemOverride(
+                outlet=outlet,
+                item_id=item_id,
+                price_regular=rng.choice([None, 15000, 22000]),
+                is_available=rng.choice([None, None, False]),
+                featured=rng.choice([None, True]),
+            )
+            for outlet in outlets
+            for item_id in rng.sample(item_ids, min(options["overrides"], len(item_ids)))
+        ], batch_size=1000)
+        self.stdout.write(
+            f"\n  {len(outlets)} outlets × {len(item_ids)} items, "
+            f"{options['overrides']} overrides each "
+            f"(populated in {time.perf_counter() - started:.2f} s)\n"
+        )
+        return outlets
+
+    def _bench_publish(self, outlets):
+        started = time.perf_counter()
+        base = snapshot.BaseMenu()
+        base_s = time.perf_counter() - started
+
+        started = time.perf_counter()
+        snapshot.publish(None, base)
+        snapshot.publish_outlets(outlets, base)
+        full_s = time.perf_counter() - started
+
+        target = outlets[0]
+        override = target.overrides.first()
+        override.price_regular = 9900
+        override.save()
+        started = time.perf_counter()
+        snapshot.publish_outlets([target])
+        one_s = time.perf_counter() - started
+
+        self.stdout.write("  Publishing")
+        self.stdout.write(f"    base serialization           {base_s * 1000:>9.1f} ms")
+        self.stdout.write(f"    base + {len(outlets):<4} outlets (full)   {full_s * 1000:>9.1f} ms"
+                          f"   ({full_s * 1000 / (len(outlets) + 1):.1f} ms/snapshot)")
+        self.stdout.write(f"    one outlet after an override {one_s * 1000:>9.1f} ms")
+
+    def _bench_serve(self, outlets, requests):
+        from menu.api_views import menu_list
+
+        factory = RequestFactory()
+        # Measure resolution and rendering, not the anonymous rate limit.
+        menu_list.cls.throttle_classes = []
+        self.stdout.write("\n  Serving /api/menu?outlet=<slug>  (warm per-worker cache)")
+        for label, pool in (("1 outlet", outlets[:1]), (f"{len(outlets)} outlets", outlets)):
+            snapshot._loaded.clear()
+            for outlet in pool:  # warm
+                menu_list(factory.get("/api/menu", {"outlet": outlet.slug}))
+            timings = []
+            for n in range(requests):
+                request = factory.get("/api/menu", {"outlet": pool[n % len(pool)].slug})
+                started = time.perf_counter()
+                response = menu_list(request)
+                response.render()
+                assert response.status_code == 200, response.status_code
+                timings.append((time.perf_counter() - started) * 1000)
+            timings.sort()
+            self.stdout.write(
+                f"    {label:<14} p50 {statistics.median(timings):>7.2f} ms"
+                f"   p99 {timings[int(len(timings) * 0.99)]:>7.2f} ms"
+            )
@@ -0,0 +1,41 @@
+"""
+Management command: check_menu_facets
+
+Usage:
+    python manage.py check_menu_facets
+    python manage.py check_menu_facets --repair
+
+Compares MenuFacet (dish counts per category × diet × availability) with
+a fresh count of the MenuItem table. The facets are kept up to date
+incrementally (menu/facets.py); raw SQL or bulk updates can make them
+drift. Exits non-zero on drift unless --repair is given, which rebuilds
+the table and republishes the menu so the pill counts pick it up.
+"""
+from django.core.management.base import BaseCommand, CommandError
+
+from menu import facets
+from menu.snapshot import publish_all
+
+
+class Command(BaseCommand):
+    help = "Check the menu's per-category / per-diet dish counts against the MenuItem table."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--repair", action="store_true",
+                            help="Rebuild the counts and republish the menu.")
+
+    def handle(self, *args, **options):
+        drift = facets.check()
+        for (category_id, diet, is_available), stored, actual in drift:
+            state = "available" if is_available else "unavailable"
+            self.stdout.write(
+                f"  category {category_id}, {diet}, {state}: stored {stored}, actual {actual}"
+            )
+        if not drift:
+            self.stdout.write(self.style.SUCCESS("✅  Menu facet counts match the menu."))
+            return
+        if not options["repair"]:
+            raise CommandError(f"{len(drift)} facet count(s) have drifted; run with --repair.")
+        facets.rebuild()
+        publish_all()
+        self.stdout.write(self.style.SUCCESS(f"✅  Rebuilt {len(drift)} drifted facet count(s) and republished."))
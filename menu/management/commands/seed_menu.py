@@ -8,6 +8,11 @@ Usage:
 Wipes ALL existing Category and MenuItem rows, then inserts the
 complete Dilli Da Dhaba menu exactly as photographed.
 
+The public menu is served from the live MenuSnapshot, so the rewrite is
+invisible to readers: the new menu is staged as a draft snapshot,
+verified, and only flipped live (one UPDATE) after the transaction
+commits. A failed run leaves the previous snapshot live.
+
 Rules applied:
   * veg / non-veg auto-detected from category + item name
   * Items explicitly flagged needs_verification=True where data
@@ -18,12 +23,12 @@ Rules applied:
     with needs_verification=True — exact values to be confirmed on-site
 """
 
-from decimal import Decimal
-
 from django.core.management.base import BaseCommand
 from django.db import transaction
 
+from menu import facets, snapshot
 from menu.models import Category, MenuItem
+from menu.pricing import to_paise
 
 # ---------------------------------------------------------------------------
 # Dataset
@@ -31,11 +36,9 @@ from menu.models import Category, MenuItem
 #
 # Item dict keys:
 #   name, veg, price_regular, price_half, price_full, needs_verification
-#   All prices are Decimal or None.
+#   Prices are given in rupees and stored as integer paise (or None).
 # ---------------------------------------------------------------------------
 
-D = Decimal  # shorthand
-
 
 def _item(
     name,
@@ -49,9 +52,9 @@ def _item(
     return dict(
         name=name,
         veg=veg,
-        price_regular=D(str(price_regular)) if price_regular is not None else None,
-        price_half=D(str(price_half)) if price_half is not None else None,
-        price_full=D(str(price_full)) if price_full is not None else None,
+        price_regular=to_paise(price_regular),
+        price_half=to_paise(price_half),
+        price_full=to_paise(price_full),
         needs_verification=needs_verification,
     )
 
@@ -314,10 +317,20 @@ class Command(BaseCommand):
             self._print_preview()
             return
 
-        with transaction.atomic():
+        with snapshot.publishing_paused(), transaction.atomic():
             self._wipe_existing()
             cat_count, item_count = self._insert_menu()
             self._verify_counts(cat_count, item_count)
+            facets.rebuild()   # bulk inserts send no signals
+            base = snapshot.BaseMenu()
+            drafts = [snapshot.stage(None, base, language) for language in snapshot.menu_languages()]
+            for draft in drafts:
+                self._verify_snapshot(draft)
+
+        for draft in drafts:
+            snapshot.flip(draft)
+            self.stdout.write(f"  ✔  Snapshot #{draft.pk} ({draft.language}) is now live.")
+        snapshot.publish_outlets(base=base)
 
         self.stdout.write(
             self.style.SUCCESS(
@@ -404,3 +417,11 @@ class Command(BaseCommand):
         self.stdout.write(
             f"\n  ✔  Verified: {db_cats} categories, {db_items} items in DB."
         )
+
+    def _verify_snapshot(self, draft):
+        if (draft.category_count, draft.item_count) != (EXPECTED_CATEGORIES, EXPECTED_ITEMS):
+            self.stderr.write(self.style.ERROR(
+                f"  ❌  Snapshot mismatch: {draft.category_count} categories, "
+                f"{draft.item_count} items"
+            ))
+            raise SystemExit(1)
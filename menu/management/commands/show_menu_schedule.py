@@ -0,0 +1,70 @@
+"""
+Management command: show_menu_schedule
+
+Usage:
+    python manage.py show_menu_schedule
+    python manage.py show_menu_schedule --outlet koramangala
+
+Prints the availability-window timeline of the live menu (menu/schedule.py):
+every moment of the week at which dishes appear or disappear, which
+timeline entry is in force now and when the visible menu next changes —
+the moment the cached menu pages and API responses expire.
+"""
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from menu import schedule
+from menu.models import MenuSnapshot, Outlet
+from menu.snapshot import get_live_snapshot
+
+DAYS = ['Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun']
+NAMES_SHOWN = 5
+
+
+def _names(items, ids):
+    names = sorted(items[i] for i in ids if i in items)
+    more = f" (+{len(names) - NAMES_SHOWN} more)" if len(names) > NAMES_SHOWN else ""
+    return ", ".join(names[:NAMES_SHOWN]) + more
+
+
+class Command(BaseCommand):
+    help = "Show when scheduled dishes appear on and disappear from the live menu."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--outlet", default="", help="Outlet slug (default: base menu).")
+
+    def handle(self, *args, **options):
+        try:
+            snapshot_id, visible = get_live_snapshot(options["outlet"] or None, settings.LANGUAGE_CODE)
+        except Outlet.DoesNotExist:
+            raise CommandError(f"No active outlet {options['outlet']!r}.")
+        payload = MenuSnapshot.objects.values_list("payload", flat=True).get(pk=snapshot_id)
+        timeline = payload.get("timeline") or []
+        if not timeline:
+            self.stdout.write(f"Snapshot {snapshot_id}: no availability windows; every dish is served all day.")
+            return
+
+        items = {item["id"]: item["name"] for item in payload["items"]}
+        self.stdout.write(
+            f"\n  Snapshot {snapshot_id}: {len(timeline)} timeline entries, "
+            f"times in {settings.TIME_ZONE}\n"
+        )
+        previous = set(timeline[-1][1])
+        for index, (minute, hidden) in enumerate(timeline):
+            hidden = set(hidden)
+            day, rest = divmod(minute, schedule.DAY_MINUTES)
+            marker = "▶" if index == visible["segment"] else " "
+            self.stdout.write(
+                f"  {marker} {DAYS[day]} {rest // 60:02d}:{rest % 60:02d}"
+                f"   {len(items) - len(hidden & items.keys()):>4} dishes served"
+            )
+            if previous - hidden:
+                self.stdout.write(f"        + {_names(items, previous - hidden)}")
+            if hidden - previous:
+                self.stdout.write(f"        − {_names(items, hidden - previous)}")
+            previous = hidden
+
+        changes_at = visible["changes_at"]
+        when = f"{timezone.localtime(changes_at):%a %H:%M}" if changes_at else "never"
+        self.stdout.write(f"\n  Visible menu next changes: {when}")
@@ -0,0 +1,29 @@
+# Generated by Django 5.1.15 on 2026-10-19 14:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('menu', '0002_add_egg_field'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='MenuSnapshot',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('payload', models.JSONField()),
+                ('category_count', models.PositiveIntegerField()),
+                ('item_count', models.PositiveIntegerField()),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('published_at', models.DateTimeField(blank=True, db_index=True, null=True)),
+            ],
+            options={
+                'verbose_name': 'Menu Snapshot',
+                'verbose_name_plural': 'Menu Snapshots',
+                'ordering': ['-published_at', '-id'],
+            },
+        ),
+    ]
@@ -0,0 +1,75 @@
+"""
+Store MenuItem prices as integer paise instead of DecimalField rupees.
+
+New columns are added alongside, filled from the old ones, then swapped in
+under the original names.
+"""
+from decimal import Decimal
+
+from django.db import migrations
+
+import menu.fields
+
+PRICE_FIELDS = ('price_half', 'price_full', 'price_regular')
+HELP_TEXT = {
+    'price_half':    'Half portion price (₹)',
+    'price_full':    'Full portion price (₹)',
+    'price_regular': 'Regular / single price (₹)',
+}
+
+
+def copy_to_paise(apps, schema_editor):
+    MenuItem = apps.get_model('menu', 'MenuItem')
+    items = list(MenuItem.objects.only('pk', *PRICE_FIELDS))
+    for item in items:
+        for field in PRICE_FIELDS:
+            rupees = getattr(item, field)
+            setattr(item, f'{field}_paise', None if rupees is None else int(rupees * 100))
+    MenuItem.objects.bulk_update(items, [f'{f}_paise' for f in PRICE_FIELDS], batch_size=500)
+
+
+def copy_to_rupees(apps, schema_editor):
+    MenuItem = apps.get_model('menu', 'MenuItem')
+    items = list(MenuItem.objects.only('pk', *(f'{f}_paise' for f in PRICE_FIELDS)))
+    for item in items:
+        for field in PRICE_FIELDS:
+            paise = getattr(item, f'{field}_paise')
+            setattr(item, field, None if paise is None else Decimal(paise).scaleb(-2))
+    MenuItem.objects.bulk_update(items, list(PRICE_FIELDS), batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('menu', '0003_menusnapshot'),
+    ]
+
+    operations = [
+        *[
+            migrations.AddField(
+                model_name='menuitem',
+                name=f'{field}_paise',
+                field=menu.fields.PaiseField(blank=True, null=True),
+            )
+            for field in PRICE_FIELDS
+        ],
+        migrations.RunPython(copy_to_paise, copy_to_rupees),
+        *[
+            migrations.RemoveField(model_name='menuitem', name=field)
+            for field in PRICE_FIELDS
+        ],
+        *[
+            migrations.RenameField(
+                model_name='menuitem', old_name=f'{field}_paise', new_name=field,
+            )
+            for field in PRICE_FIELDS
+        ],
+        *[
+            migrations.AlterField(
+                model_name='menuitem',
+                name=field,
+                field=menu.fields.PaiseField(blank=True, help_text=HELP_TEXT[field], null=True),
+            )
+            for field in PRICE_FIELDS
+        ],
+    ]
@@ -0,0 +1,68 @@
+# Generated by Django 5.1.15 on 2026-10-19 14:43
+
+import django.db.models.deletion
+import menu.fields
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('menu', '0004_prices_to_paise'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Outlet',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=100, unique=True)),
+                ('slug', models.SlugField(unique=True)),
+                ('is_active', models.BooleanField(default=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'verbose_name': 'Outlet',
+                'verbose_name_plural': 'Outlets',
+                'ordering': ['name'],
+            },
+        ),
+        migrations.CreateModel(
+            name='OutletItemOverride',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('price_half', menu.fields.PaiseField(blank=True, help_text='Half portion price (₹)', null=True)),
+                ('price_full', menu.fields.PaiseField(blank=True, help_text='Full portion price (₹)', null=True)),
+                ('price_regular', menu.fields.PaiseField(blank=True, help_text='Regular / single price (₹)', null=True)),
+                ('is_available', models.BooleanField(blank=True, help_text='Empty = same as base menu', null=True)),
+                ('featured', models.BooleanField(blank=True, help_text='Empty = same as base menu', null=True)),
+            ],
+            options={
+                'verbose_name': 'Outlet Override',
+                'verbose_name_plural': 'Outlet Overrides',
+            },
+        ),
+        migrations.AddField(
+            model_name='menusnapshot',
+            name='outlet',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='snapshots', to='menu.outlet'),
+        ),
+        migrations.AddIndex(
+            model_name='menusnapshot',
+            index=models.Index(fields=['outlet', 'published_at'], name='menu_snapshot_live_idx'),
+        ),
+        migrations.AddField(
+            model_name='outletitemoverride',
+            name='item',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='outlet_overrides', to='menu.menuitem'),
+        ),
+        migrations.AddField(
+            model_name='outletitemoverride',
+            name='outlet',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='overrides', to='menu.outlet'),
+        ),
+        migrations.AddConstraint(
+            model_name='outletitemoverride',
+            constraint=models.UniqueConstraint(fields=('outlet', 'item'), name='unique_outlet_item_override'),
+        ),
+    ]
@@ -0,0 +1,41 @@
+# Generated by Django 5.1.15 on 2026-10-19 15:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('menu', '0005_outlets'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='menusnapshot',
+            name='menu_snapshot_live_idx',
+        ),
+        migrations.AddField(
+            model_name='category',
+            name='name_hi',
+            field=models.CharField(blank=True, max_length=100, verbose_name='name (Hindi)'),
+        ),
+        migrations.AddField(
+            model_name='menuitem',
+            name='description_hi',
+            field=models.TextField(blank=True, verbose_name='description (Hindi)'),
+        ),
+        migrations.AddField(
+            model_name='menuitem',
+            name='name_hi',
+            field=models.CharField(blank=True, max_length=200, verbose_name='name (Hindi)'),
+        ),
+        migrations.AddField(
+            model_name='menusnapshot',
+            name='language',
+            field=models.CharField(default='en', max_length=10),
+        ),
+        migrations.AddIndex(
+            model_name='menusnapshot',
+            index=models.Index(fields=['outlet', 'language', 'published_at'], name='menu_snapshot_live_idx'),
+        ),
+    ]
@@ -0,0 +1,37 @@
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVector
+from django.db import migrations
+
+
+def search_index():
+    # Frozen copy of menu.search.search_index() as of this migration; later
+    # changes to menu/search.py need a migration of their own.
+    return GinIndex(
+        SearchVector('name', 'name_hi', 'description', config='simple'),
+        name='menu_item_search_idx',
+    )
+
+
+def add_search_index(apps, schema_editor):
+    # GIN full-text indexes are PostgreSQL-only; other databases keep the
+    # admin's icontains search (menu/search.py).
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.add_index(apps.get_model('menu', 'MenuItem'), search_index())
+
+
+def remove_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.remove_index(apps.get_model('menu', 'MenuItem'), search_index())
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('menu', '0006_menu_translations'),
+    ]
+
+    operations = [
+        migrations.RunPython(add_search_index, remove_search_index),
+    ]
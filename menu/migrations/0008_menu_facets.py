@@ -0,0 +1,49 @@
+# Generated by Django 5.1.15 on 2026-10-19 15:14
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def build_facets(apps, schema_editor):
+    MenuItem = apps.get_model('menu', 'MenuItem')
+    MenuFacet = apps.get_model('menu', 'MenuFacet')
+    rows = {}
+    grouped = (
+        MenuItem.objects.order_by()
+        .values('category_id', 'veg', 'egg', 'is_available').annotate(n=Count('id'))
+    )
+    for group in grouped:
+        diet = 'egg' if group['egg'] else 'veg' if group['veg'] else 'nonveg'
+        key = (group['category_id'], diet, group['is_available'])
+        row = rows.setdefault(key, MenuFacet(
+            category_id=key[0], diet=diet, is_available=key[2], count=0,
+        ))
+        row.count += group['n']
+    MenuFacet.objects.bulk_create(rows.values())
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('menu', '0007_menuitem_search_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='MenuFacet',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('diet', models.CharField(choices=[('veg', 'Veg'), ('egg', 'Egg'), ('nonveg', 'Non-veg')], max_length=6)),
+                ('is_available', models.BooleanField()),
+                ('count', models.IntegerField(default=0)),
+                ('category', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='facets', to='menu.category')),
+            ],
+            options={
+                'verbose_name': 'Menu Facet',
+                'verbose_name_plural': 'Menu Facets',
+                'constraints': [models.UniqueConstraint(fields=('category', 'diet', 'is_available'), name='unique_menu_facet')],
+            },
+        ),
+        migrations.RunPython(build_facets, migrations.RunPython.noop),
+    ]
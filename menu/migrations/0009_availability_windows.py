@@ -0,0 +1,33 @@
+# Generated by Django 5.1.15 on 2026-10-19 15:19
+
+import django.db.models.deletion
+import menu.fields
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('menu', '0008_menu_facets'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AvailabilityWindow',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('label', models.CharField(blank=True, help_text='e.g. Breakfast, Lunch, Dinner', max_length=50)),
+                ('days', menu.fields.WeekdaysField(default=127, help_text='Days on which the window starts')),
+                ('start_time', models.TimeField()),
+                ('end_time', models.TimeField(help_text='At or before the start time = ends the next day')),
+                ('category', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='availability_windows', to='menu.category')),
+                ('item', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='availability_windows', to='menu.menuitem')),
+            ],
+            options={
+                'verbose_name': 'Availability Window',
+                'verbose_name_plural': 'Availability Windows',
+                'ordering': ['start_time'],
+                'constraints': [models.CheckConstraint(condition=models.Q(models.Q(('category__isnull', True), ('item__isnull', False)), models.Q(('category__isnull', False), ('item__isnull', True)), _connector='OR'), name='availability_window_item_xor_category')],
+            },
+        ),
+    ]
@@ -1,11 +1,15 @@
 from django.db import models
 
+from .fields import EVERY_DAY, WEEKDAYS, PaiseField, WeekdaysField
+from .pricing import display_price
+
 
 class Category(models.Model):
     """
     Top-level grouping for menu items (e.g. Starters, Main Course, Breads).
     """
     name          = models.CharField(max_length=100, unique=True)
+    name_hi       = models.CharField('name (Hindi)', max_length=100, blank=True)
     display_order = models.PositiveSmallIntegerField(default=0, db_index=True)
     created_at    = models.DateTimeField(auto_now_add=True)
 
@@ -29,6 +33,9 @@ class MenuItem(models.Model):
     )
     name               = models.CharField(max_length=200)
     description        = models.TextField(blank=True)
+    # Translations: empty = show the English text (see menu/snapshot.py)
+    name_hi            = models.CharField('name (Hindi)', max_length=200, blank=True)
+    description_hi     = models.TextField('description (Hindi)', blank=True)
     veg                = models.BooleanField(
         default=True,
         help_text='Green dot = veg, Red dot = non-veg',
@@ -38,17 +45,17 @@ class MenuItem(models.Model):
         help_text='Contains egg but no meat (e.g. egg curry, egg bhurji). Set veg=False when this is True.',
     )
 
-    # Prices — at least one must be filled in
-    price_half         = models.DecimalField(
-        max_digits=8, decimal_places=2, null=True, blank=True,
+    # Prices in integer paise (₹179.00 = 17900) — at least one must be filled in
+    price_half         = PaiseField(
+        null=True, blank=True,
         help_text='Half portion price (₹)',
     )
-    price_full         = models.DecimalField(
-        max_digits=8, decimal_places=2, null=True, blank=True,
+    price_full         = PaiseField(
+        null=True, blank=True,
         help_text='Full portion price (₹)',
     )
-    price_regular      = models.DecimalField(
-        max_digits=8, decimal_places=2, null=True, blank=True,
+    price_regular      = PaiseField(
+        null=True, blank=True,
         help_text='Regular / single price (₹)',
     )
 
@@ -86,22 +93,186 @@ class MenuItem(models.Model):
     def __str__(self):
         return f'{self.name} [{self.category.name}]'
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Remember what MenuFacet currently counts for this row, so
+        # menu.facets can apply just the difference on save / delete.
+        if {'category_id', 'veg', 'egg', 'is_available'} <= set(field_names):
+            instance._counted = instance.facet_key()
+        return instance
+
+    def facet_key(self):
+        """(category id, diet, is_available): the MenuFacet row this item counts towards."""
+        return (self.category_id, diet_of(self.veg, self.egg), self.is_available)
+
     # ------------------------------------------------------------------
     # Convenience helpers (used in templates / serializers)
     # ------------------------------------------------------------------
     @property
     def display_price(self) -> str:
         """Return a human-friendly price string."""
-        parts = []
-        if self.price_regular is not None:
-            parts.append(f'₹{self.price_regular}')
-        else:
-            if self.price_half is not None:
-                parts.append(f'Half ₹{self.price_half}')
-            if self.price_full is not None:
-                parts.append(f'Full ₹{self.price_full}')
-        return '  /  '.join(parts) if parts else 'Price on request'
+        return display_price(self.price_regular, self.price_half, self.price_full)
 
     @property
     def has_half_full(self) -> bool:
         return self.price_half is not None and self.price_full is not None
+
+
+def diet_of(veg, egg):
+    """The /menu/ diet filter an item falls under: 'egg', 'veg' or 'nonveg'."""
+    if egg:
+        return 'egg'
+    return 'veg' if veg else 'nonveg'
+
+
+class MenuFacet(models.Model):
+    """
+    Number of items per (category, diet, availability). Maintained
+    incrementally by menu.facets; the menu pills show these counts
+    without a GROUP BY per page view.
+    """
+    DIETS = [('veg', 'Veg'), ('egg', 'Egg'), ('nonveg', 'Non-veg')]
+
+    category     = models.ForeignKey(Category, on_delete=models.CASCADE, related_name='facets')
+    diet         = models.CharField(max_length=6, choices=DIETS)
+    is_available = models.BooleanField()
+    count        = models.IntegerField(default=0)
+
+    class Meta:
+        verbose_name        = 'Menu Facet'
+        verbose_name_plural = 'Menu Facets'
+        constraints         = [
+            models.UniqueConstraint(fields=['category', 'diet', 'is_available'],
+                                    name='unique_menu_facet'),
+        ]
+
+    def __str__(self):
+        state = 'available' if self.is_available else 'unavailable'
+        return f'{self.category_id} / {self.diet} / {state}: {self.count}'
+
+
+class AvailabilityWindow(models.Model):
+    """
+    When a dish (or every dish of a category) is served, e.g. breakfast
+    07:00–11:00 on weekdays, in settings.TIME_ZONE. A dish with windows of
+    its own ignores its category's; a dish with none anywhere is served
+    all day. is_available still hides a dish at any time.
+
+    An end time at or before the start time runs past midnight.
+    The menu reads the windows through the snapshot's transition timeline
+    (menu/schedule.py), not per request.
+    """
+    item       = models.ForeignKey(
+        MenuItem,
+        on_delete=models.CASCADE,
+        null=True, blank=True,
+        related_name='availability_windows',
+    )
+    category   = models.ForeignKey(
+        Category,
+        on_delete=models.CASCADE,
+        null=True, blank=True,
+        related_name='availability_windows',
+    )
+    label      = models.CharField(max_length=50, blank=True, help_text='e.g. Breakfast, Lunch, Dinner')
+    days       = WeekdaysField(default=EVERY_DAY, help_text='Days on which the window starts')
+    start_time = models.TimeField()
+    end_time   = models.TimeField(help_text='At or before the start time = ends the next day')
+
+    class Meta:
+        verbose_name        = 'Availability Window'
+        verbose_name_plural = 'Availability Windows'
+        ordering            = ['start_time']
+        # CheckConstraint(condition=...) needs Django 5.1, the minimum in requirements.txt.
+        constraints         = [
+            models.CheckConstraint(
+                condition=models.Q(item__isnull=False, category__isnull=True)
+                | models.Q(item__isnull=True, category__isnull=False),
+                name='availability_window_item_xor_category',
+            ),
+        ]
+
+    def __str__(self):
+        days = ', '.join(name for day, name in WEEKDAYS if self.days & (1 << day))
+        when = f'{self.start_time:%H:%M}–{self.end_time:%H:%M} ({days})'
+        return f'{self.label} {when}' if self.label else when
+
+
+class Outlet(models.Model):
+    """
+    A branch. Serves the base menu with per-item overrides
+    (see OutletItemOverride); /api/menu?outlet=<slug>.
+    """
+    name       = models.CharField(max_length=100, unique=True)
+    slug       = models.SlugField(max_length=50, unique=True)
+    is_active  = models.BooleanField(default=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        verbose_name        = 'Outlet'
+        verbose_name_plural = 'Outlets'
+        ordering            = ['name']
+
+    def __str__(self):
+        return self.name
+
+
+class OutletItemOverride(models.Model):
+    """
+    Per-outlet change to one base MenuItem. Empty fields inherit the base value.
+    """
+    outlet        = models.ForeignKey(Outlet, on_delete=models.CASCADE, related_name='overrides')
+    item          = models.ForeignKey(MenuItem, on_delete=models.CASCADE, related_name='outlet_overrides')
+    price_half    = PaiseField(null=True, blank=True, help_text='Half portion price (₹)')
+    price_full    = PaiseField(null=True, blank=True, help_text='Full portion price (₹)')
+    price_regular = PaiseField(null=True, blank=True, help_text='Regular / single price (₹)')
+    is_available  = models.BooleanField(null=True, blank=True, help_text='Empty = same as base menu')
+    featured      = models.BooleanField(null=True, blank=True, help_text='Empty = same as base menu')
+
+    class Meta:
+        verbose_name        = 'Outlet Override'
+        verbose_name_plural = 'Outlet Overrides'
+        constraints         = [
+            models.UniqueConstraint(fields=['outlet', 'item'], name='unique_outlet_item_override'),
+        ]
+
+    def __str__(self):
+        return f'{self.item.name} @ {self.outlet.name}'
+
+
+class MenuSnapshot(models.Model):
+    """
+    Serialized copy of the public menu.
+
+    The public API and pages read only the live snapshot (the published one
+    with the latest published_at), so Category / MenuItem rows can be
+    rewritten freely; going live is a single-row UPDATE. See menu/snapshot.py.
+    Each outlet and language has its own line of snapshots; outlet=None is
+    the base menu.
+    """
+    outlet         = models.ForeignKey(
+        Outlet,
+        on_delete=models.CASCADE,
+        null=True, blank=True,
+        related_name='snapshots',
+    )
+    language       = models.CharField(max_length=10, default='en')
+    payload        = models.JSONField()
+    category_count = models.PositiveIntegerField()
+    item_count     = models.PositiveIntegerField()
+    created_at     = models.DateTimeField(auto_now_add=True)
+    published_at   = models.DateTimeField(null=True, blank=True, db_index=True)
+
+    class Meta:
+        verbose_name        = 'Menu Snapshot'
+        verbose_name_plural = 'Menu Snapshots'
+        ordering            = ['-published_at', '-id']
+        indexes             = [
+            models.Index(fields=['outlet', 'language', 'published_at'], name='menu_snapshot_live_idx'),
+        ]
+
+    def __str__(self):
+        state = f'published {self.published_at:%Y-%m-%d %H:%M}' if self.published_at else 'draft'
+        where = self.outlet.name if self.outlet_id else 'base menu'
+        return f'Snapshot #{self.pk} {where} [{self.language}] ({self.item_count} items, {state})'
@@ -0,0 +1,96 @@
+"""
+Prices are stored as integer paise (₹179.00 → 17900).
+
+format_paise() renders the API / display form ("179.00") without going
+through Decimal, and adjust_prices() applies a percentage or flat change
+to a whole queryset as one UPDATE statement.
+"""
+from decimal import ROUND_HALF_UP, Decimal
+
+from django.db.models import BigIntegerField, Case, F, IntegerField, Value, When
+from django.db.models.functions import Cast, Greatest
+
+PRICE_FIELDS = ('price_regular', 'price_half', 'price_full')
+
+# Rounding rule → step in paise.
+ROUNDING_STEPS = {
+    'paisa': 1,
+    'rupee': 100,
+    'five':  500,
+    'ten':   1000,
+}
+
+
+def to_paise(rupees):
+    """Convert rupees (int, str or Decimal) to integer paise; None passes through."""
+    if rupees is None:
+        return None
+    if isinstance(rupees, int):
+        return rupees * 100
+    return int((Decimal(str(rupees)) * 100).quantize(Decimal(1), rounding=ROUND_HALF_UP))
+
+
+def to_rupees(paise):
+    """Integer paise → Decimal rupees (for forms)."""
+    if paise is None:
+        return None
+    return Decimal(paise).scaleb(-2)
+
+
+def format_paise(paise):
+    """17900 → '179.00' (the shape the API has always returned)."""
+    if paise is None:
+        return None
+    rupees, rest = divmod(paise, 100)
+    return f'{rupees}.{rest:02d}'
+
+
+def display_price(price_regular, price_half, price_full):
+    """Human-friendly price string from paise values."""
+    if price_regular is not None:
+        return f'₹{format_paise(price_regular)}'
+    parts = []
+    if price_half is not None:
+        parts.append(f'Half ₹{format_paise(price_half)}')
+    if price_full is not None:
+        parts.append(f'Full ₹{format_paise(price_full)}')
+    return '  /  '.join(parts) if parts else 'Price on request'
+
+
+def _big(number):
+    return Value(number, output_field=BigIntegerField())
+
+
+def adjust_prices(queryset, *, percent=None, flat_paise=None, rounding='rupee'):
+    """
+    Apply `percent` (e.g. 10, -5 or Decimal('2.5'); hundredths at most) or
+    `flat_paise` (e.g. 1000 = +₹10) to every price column of `queryset` in a
+    single UPDATE, rounding half up to the nearest ROUNDING_STEPS[rounding]
+    paise. Empty prices stay empty; results never go below zero. Returns the
+    number of rows updated.
+
+    The arithmetic stays in integers (percent as basis points): integer
+    division truncates alike on SQLite and PostgreSQL, ROUND() of a float
+    does not. Operands are non-negative, so truncating is flooring.
+    """
+    if (percent is None) == (flat_paise is None):
+        raise ValueError('Pass exactly one of percent or flat_paise.')
+    step = ROUNDING_STEPS[rounding]
+
+    updates = {}
+    for field in PRICE_FIELDS:
+        price = Cast(F(field), BigIntegerField())   # price × 10000 overflows int4
+        if percent is not None:
+            basis_points = int((Decimal(str(percent)) * 100).quantize(Decimal(1), rounding=ROUND_HALF_UP))
+            divisor = 10000 * step
+            scaled = price * _big(10000 + basis_points)
+        else:
+            divisor = step
+            scaled = Greatest(price + _big(flat_paise), _big(0))
+        rounded = (scaled + _big(divisor // 2)) / _big(divisor) * _big(step)
+        updates[field] = Case(
+            When(**{f'{field}__isnull': True}, then=Value(None)),
+            default=Cast(rounded, IntegerField()),
+            output_field=IntegerField(),
+        )
+    return queryset.update(**updates)
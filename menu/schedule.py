@@ -0,0 +1,127 @@
+"""
+Availability schedules (AvailabilityWindow) as a weekly transition timeline.
+
+A menu snapshot does not drop dishes that are outside their windows at
+publish time. It stores every available dish plus a timeline: the
+minutes of the week (Monday 00:00 = 0, in settings.TIME_ZONE) at which
+the set of hidden scheduled dishes changes, each with that set:
+
+    [[0, [12, 13]], [420, [13]], [660, [12]], ...]
+
+Readers find the current entry with one bisect (segment_at). The same
+lookup gives the exact moment the visible menu next changes, so the
+worker's resolved payload, the card fragments and the CDN copies all
+expire at that boundary rather than on a short TTL (menu/snapshot.py,
+core/edge.py). A week holds a few dozen boundaries at most, so
+the timeline is built in full at every publish.
+"""
+from bisect import bisect_right
+from datetime import timedelta
+
+from django.utils import timezone
+
+DAY_MINUTES = 24 * 60
+WEEK_MINUTES = 7 * DAY_MINUTES
+
+
+def _minutes(time):
+    return time.hour * 60 + time.minute
+
+
+def window_ranges(window):
+    """[(start, end)] minutes of the week an AvailabilityWindow covers; end > start."""
+    start, end = _minutes(window.start_time), _minutes(window.end_time)
+    length = end - start if end > start else end - start + DAY_MINUTES
+    ranges = []
+    for day in range(7):
+        if window.days & (1 << day):
+            begin = day * DAY_MINUTES + start
+            if begin + length > WEEK_MINUTES:
+                # Sunday night into Monday morning.
+                ranges.append((begin, WEEK_MINUTES))
+                ranges.append((0, begin + length - WEEK_MINUTES))
+            else:
+                ranges.append((begin, begin + length))
+    return ranges
+
+
+def _covered(ranges, minute):
+    return any(start <= minute < end for start, end in ranges)
+
+
+def build_timeline(schedules):
+    """
+    Timeline for `schedules` ({item id: [(start, end)]} of the scheduled
+    items); [] when nothing is scheduled.
+    """
+    if not schedules:
+        return []
+    # Items sharing one set of windows (a category's) are evaluated once.
+    groups = {}
+    for item_id, ranges in schedules.items():
+        groups.setdefault(tuple(sorted(ranges)), []).append(item_id)
+    boundaries = sorted({0} | {
+        minute % WEEK_MINUTES for ranges in groups for bounds in ranges for minute in bounds
+    })
+
+    timeline = []
+    for minute in boundaries:
+        hidden = sorted(
+            item_id
+            for ranges, item_ids in groups.items() if not _covered(ranges, minute)
+            for item_id in item_ids
+        )
+        if not timeline or timeline[-1][1] != hidden:
+            timeline.append([minute, hidden])
+    return timeline
+
+
+def _week_start(when):
+    local = timezone.localtime(when)
+    midnight = local.replace(hour=0, minute=0, second=0, microsecond=0)
+    return midnight - timedelta(days=local.weekday())
+
+
+def segment_at(timeline, when=None):
+    """
+    (index, hidden item ids, changes_at) of the timeline entry in force at
+    `when` (default: now); changes_at is None if the menu never changes.
+    """
+    if not timeline:
+        return 0, frozenset(), None
+    when = when or timezone.now()
+    week_start = _week_start(when)
+    minute = (when - week_start).total_seconds() / 60
+    index = bisect_right([entry[0] for entry in timeline], minute) - 1
+    hidden = timeline[index][1]
+
+    # The next entry with a different set, wrapping into next week (the
+    # week's last entry may match the first).
+    offset = 0
+    for step in range(1, len(timeline) + 1):
+        position = index + step
+        if position >= len(timeline):
+            position -= len(timeline)
+            offset = WEEK_MINUTES
+        if timeline[position][1] != hidden:
+            changes_at = week_start + timedelta(minutes=timeline[position][0] + offset)
+            return index, frozenset(hidden), changes_at
+    return index, frozenset(hidden), None
+
+
+def changed_items(old, new):
+    """Ids of items hidden at some minute of the week by one timeline but not the other."""
+    if old == new:
+        return set()
+    boundaries = sorted({entry[0] for entry in old or [[0, []]]} | {entry[0] for entry in new or [[0, []]]})
+    changed = set()
+    for minute in boundaries:
+        changed |= _hidden_at(old, minute) ^ _hidden_at(new, minute)
+    return changed
+
+
+def _hidden_at(timeline, minute):
+    if not timeline:
+        return set()
+    index = bisect_right([entry[0] for entry in timeline], minute) - 1
+    return set(timeline[index][1])
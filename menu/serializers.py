@@ -1,9 +1,23 @@
 from rest_framework import serializers
 from .models import Category, MenuItem
+from .pricing import format_paise
+
+
+class RupeeField(serializers.Field):
+    """Integer paise rendered as the rupee string the API has always used ("179.00")."""
+
+    def __init__(self, **kwargs):
+        super().__init__(read_only=True, **kwargs)
+
+    def to_representation(self, value):
+        return format_paise(value)
 
 
 class MenuItemSerializer(serializers.ModelSerializer):
     category_name = serializers.CharField(source='category.name', read_only=True)
+    price_regular = RupeeField()
+    price_half    = RupeeField()
+    price_full    = RupeeField()
     display_price = serializers.CharField(read_only=True)
     has_half_full = serializers.BooleanField(read_only=True)
     image_url     = serializers.SerializerMethodField()
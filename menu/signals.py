@@ -0,0 +1,65 @@
+"""
+Republish menu snapshots whenever the menu or an outlet override changes.
+
+Base menu changes (Category, MenuItem, AvailabilityWindow) republish the
+base menu and every outlet; Outlet / OutletItemOverride changes republish only that outlet.
+Publishing waits for the surrounding transaction to commit, and a whole
+admin save (including bulk actions) publishes only once. Each publish
+purges the CDN keys of what changed (menu.snapshot.changed_keys).
+
+MenuItem saves and deletes also keep MenuFacet in step (menu/facets.py).
+"""
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from core.edge import outlet_key
+from core.purge import purge_keys
+
+from . import facets
+from .models import AvailabilityWindow, Category, MenuItem, Outlet, OutletItemOverride
+from .snapshot import schedule_publish
+
+
+@receiver(pre_save, sender=MenuItem)
+def item_presave(sender, instance, **kwargs):
+    # Instances built by hand rather than loaded (MenuItem(pk=..).save()),
+    # or loaded with .only() / .defer() leaving a counted field out.
+    if instance.pk is not None and not hasattr(instance, '_counted'):
+        old = MenuItem.objects.filter(pk=instance.pk).first()
+        instance._counted = old.facet_key() if old else None
+
+
+@receiver(post_save, sender=MenuItem)
+def item_saved(sender, instance, created, **kwargs):
+    old_key = None if created else getattr(instance, '_counted', None)
+    new_key = instance.facet_key()
+    facets.record_change(old_key, new_key)
+    instance._counted = new_key
+
+
+@receiver(post_delete, sender=MenuItem)
+def item_deleted(sender, instance, **kwargs):
+    facets.record_change(getattr(instance, '_counted', instance.facet_key()), None)
+
+
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+@receiver(post_save, sender=MenuItem)
+@receiver(post_delete, sender=MenuItem)
+@receiver(post_save, sender=AvailabilityWindow)
+@receiver(post_delete, sender=AvailabilityWindow)
+def menu_changed(sender, **kwargs):
+    schedule_publish()
+
+
+@receiver(post_save, sender=Outlet)
+def outlet_changed(sender, instance, **kwargs):
+    schedule_publish(instance.pk)
+    # A deactivated outlet is not republished, but its cached pages must go.
+    purge_keys({outlet_key(instance.slug)})
+
+
+@receiver(post_save, sender=OutletItemOverride)
+@receiver(post_delete, sender=OutletItemOverride)
+def override_changed(sender, instance, **kwargs):
+    schedule_publish(instance.outlet_id)
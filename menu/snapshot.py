@@ -0,0 +1,428 @@
+"""
+Versioned, atomically published copies of the public menu.
+
+Publishing happens in two steps:
+
+    snapshot = stage()     # serialize current Category / MenuItem rows (a draft)
+    flip(snapshot)         # one UPDATE: snapshot becomes the live menu
+
+Readers call get_live_snapshot(), which costs one indexed lookup per
+request; each worker keeps the decoded payload of recently used live
+snapshots in memory and only reloads one after a flip. Anything that
+rewrites the menu tables (seed_menu, admin edits) therefore never shows
+up half-done — the previous snapshot stays live until the flip.
+
+Every Outlet has its own line of snapshots holding the base menu with
+that outlet's OutletItemOverride rows already applied, so serving
+/api/menu?outlet=<slug> costs the same with 1 or 500 outlets. A base
+menu change republishes every outlet (the base is serialized once and
+reused); an override change republishes only its outlet.
+
+Translations work the same way: every outlet has one line of snapshots
+per language in settings.LANGUAGES, with the translated names already
+filled in (falling back to English), so a Hindi request reads a single
+row exactly like an English one. The language is the active one —
+LocaleMiddleware picks it per request (see core/i18n.py).
+
+Availability windows (AvailabilityWindow) do not need a publish at
+every boundary: a snapshot holds all available dishes plus the week's
+transition timeline (menu/schedule.py). get_live_snapshot() resolves
+it to what is visible now once per worker and boundary, and the result
+carries 'changes_at', the moment it stops being valid, for the caches
+downstream.
+
+Every flip also purges the CDN (core/purge.py) for exactly the items and
+categories that differ from the snapshot it replaces.
+
+Admin edits republish automatically once their transaction commits
+(see menu/signals.py); wrap bulk rewrites in publishing_paused() and
+publish explicitly at the end.
+"""
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone, translation
+
+from core import edge
+from core import purge as edge_purge
+
+from . import facets, schedule
+from .models import AvailabilityWindow, MenuSnapshot, Outlet, diet_of
+from .pricing import PRICE_FIELDS, display_price, format_paise
+
+KEEP_SNAPSHOTS = 10
+CACHED_SNAPSHOTS = 64
+ALL_OUTLETS = 'all'
+
+_local = threading.local()
+_loaded = OrderedDict()   # (outlet slug (None = base), language) → (snapshot id, payload, visible)
+_loaded_lock = threading.Lock()
+
+
+# ---------------------------------------------------------------------------
+# Languages
+# ---------------------------------------------------------------------------
+def menu_languages():
+    return [code for code, _ in settings.LANGUAGES]
+
+
+def menu_language(language=None):
+    """`language` (default: the active one) as one of settings.LANGUAGES."""
+    code = (language or translation.get_language() or settings.LANGUAGE_CODE).lower()
+    languages = menu_languages()
+    for candidate in (code, code.split('-')[0]):
+        if candidate in languages:
+            return candidate
+    return settings.LANGUAGE_CODE
+
+
+def _translated(obj, fields, language):
+    """{field: text} for the fields translated into `language` (<field>_<language>)."""
+    strings = {}
+    for field in fields:
+        text = getattr(obj, f'{field}_{language}', '')
+        if text:
+            strings[field] = text
+    return strings
+
+
+# ---------------------------------------------------------------------------
+# Building
+# ---------------------------------------------------------------------------
+class BaseMenu:
+    """The base menu serialized once, ready to be resolved for any outlet and language."""
+
+    def __init__(self):
+        from .models import Category, MenuItem
+        from .serializers import CategoryListSerializer, MenuItemSerializer
+
+        categories = list(Category.objects.all())
+        items = list(
+            MenuItem.objects.select_related('category')
+            .order_by('category__display_order', 'name')
+        )
+        # Available-item counts per category and diet, kept by menu.facets.
+        counts = facets.counts()
+        self.categories = [
+            {**c, 'counts': counts.get(c['id'], facets.empty_counts())}
+            for c in CategoryListSerializer(categories, many=True).data
+        ]
+        self.items = [dict(i) for i in MenuItemSerializer(items, many=True).data]
+        self.paise = {item.pk: tuple(getattr(item, f) for f in PRICE_FIELDS) for item in items}
+        self.translations = {
+            language: {
+                'categories': {c.pk: _translated(c, ('name',), language) for c in categories},
+                'items': {i.pk: _translated(i, ('name', 'description'), language) for i in items},
+            }
+            for language in menu_languages() if language != settings.LANGUAGE_CODE
+        }
+        self.timeline = self._timeline(items)
+
+    def _timeline(self, items):
+        """The week's transition timeline; an item's own windows replace its category's."""
+        by_item, by_category = {}, {}
+        for window in AvailabilityWindow.objects.all():
+            if window.item_id is not None:
+                by_item.setdefault(window.item_id, []).extend(schedule.window_ranges(window))
+            else:
+                by_category.setdefault(window.category_id, []).extend(schedule.window_ranges(window))
+        schedules = {}
+        for item in items:
+            ranges = by_item.get(item.pk) or by_category.get(item.category_id)
+            if ranges:
+                schedules[item.pk] = ranges
+        return schedule.build_timeline(schedules)
+
+    def payload(self, overrides=None, language=None):
+        """Resolved payload; `overrides` maps item id → OutletItemOverride."""
+        items = []
+        moved = []   # items an override made (un)available: (item, +1 | -1)
+        for item in self.items:
+            override = overrides.get(item['id']) if overrides else None
+            if override is not None:
+                resolved = self._apply(item, override)
+                if resolved['is_available'] != item['is_available']:
+                    moved.append((item, 1 if resolved['is_available'] else -1))
+                item = resolved
+            if item['is_available']:
+                items.append(item)
+        categories = _recount(self.categories, moved) if moved else self.categories
+        payload = {'categories': categories, 'items': items, 'timeline': self.timeline}
+        if language in self.translations:
+            payload = self._translate(payload, self.translations[language])
+        return payload
+
+    def _translate(self, payload, strings):
+        categories = [{**c, **strings['categories'][c['id']]} for c in payload['categories']]
+        names = {c['id']: c['name'] for c in categories}
+        items = [
+            {**item, **strings['items'][item['id']], 'category_name': names[item['category']]}
+            for item in payload['items']
+        ]
+        return {**payload, 'categories': categories, 'items': items}
+
+    def _apply(self, item, override):
+        item = dict(item)
+        prices = dict(zip(PRICE_FIELDS, self.paise[item['id']]))
+        for field in PRICE_FIELDS:
+            value = getattr(override, field)
+            if value is not None:
+                prices[field] = value
+                item[field] = format_paise(value)
+        item['display_price'] = display_price(
+            prices['price_regular'], prices['price_half'], prices['price_full'],
+        )
+        item['has_half_full'] = prices['price_half'] is not None and prices['price_full'] is not None
+        if override.is_available is not None:
+            item['is_available'] = override.is_available
+        if override.featured is not None:
+            item['featured'] = override.featured
+        return item
+
+
+def _recount(categories, moved):
+    """Category dicts with counts shifted by `moved` ([(item, +1 | -1)])."""
+    categories = {c['id']: {**c, 'counts': dict(c['counts'])} for c in categories}
+    for item, delta in moved:
+        counts = categories[item['category']]['counts']
+        counts[diet_of(item['veg'], item['egg'])] += delta
+        counts['all'] += delta
+    return list(categories.values())
+
+
+def build_payload(outlet=None, base=None, language=None):
+    base = base or BaseMenu()
+    if outlet is None:
+        return base.payload(language=language)
+    return base.payload({o.item_id: o for o in outlet.overrides.all()}, language)
+
+
+def stage(outlet=None, base=None, language=None):
+    """
+    Write the current menu (for `outlet`, or the base menu) in `language`
+    (default: settings.LANGUAGE_CODE) as a draft snapshot.
+    """
+    language = language or settings.LANGUAGE_CODE
+    payload = build_payload(outlet, base, language)
+    return MenuSnapshot.objects.create(
+        outlet=outlet,
+        language=language,
+        payload=payload,
+        category_count=len(payload['categories']),
+        item_count=len(payload['items']),
+    )
+
+
+def flip(snapshot, purge=True):
+    """
+    Make `snapshot` the live menu of its outlet and language with a
+    single-row UPDATE, then purge the CDN keys of whatever it changed
+    (see changed_keys).
+    """
+    previous = None
+    if purge:
+        previous = (
+            MenuSnapshot.objects.filter(
+                outlet_id=snapshot.outlet_id, language=snapshot.language, published_at__isnull=False,
+            )
+            .values_list('payload', flat=True).first()
+        )
+    MenuSnapshot.objects.filter(pk=snapshot.pk).update(published_at=timezone.now())
+    _prune(snapshot.outlet_id, snapshot.language)
+    if purge:
+        outlet_slug = snapshot.outlet.slug if snapshot.outlet_id else None
+        edge_purge.purge_keys(changed_keys(previous, snapshot.payload, outlet_slug))
+
+
+def publish(outlet=None, base=None, purge=True):
+    """Stage and flip the menu of `outlet` in every language; returns {language: snapshot}."""
+    base = base or BaseMenu()
+    snapshots = {}
+    with edge_purge.batched():
+        for language in menu_languages():
+            snapshots[language] = stage(outlet, base, language)
+            flip(snapshots[language], purge)
+    return snapshots
+
+
+def publish_outlets(outlets=None, base=None, purge=True):
+    """Republish `outlets` (default: every active outlet) from one base serialization."""
+    base = base or BaseMenu()
+    if outlets is None:
+        outlets = Outlet.objects.filter(is_active=True)
+    with edge_purge.batched():
+        for outlet in outlets:
+            publish(outlet, base, purge)
+    return base
+
+
+def publish_all():
+    base = BaseMenu()
+    publish(None, base)
+    # Outlet menus are the base menu plus unchanged overrides: the base
+    # diff already names every item and category that changed.
+    publish_outlets(base=base, purge=False)
+
+
+def changed_keys(old, new, outlet_slug=None):
+    """Surrogate keys (core/edge.py) of responses that differ between two payloads."""
+    if old is None:
+        return {edge.outlet_key(outlet_slug)} if outlet_slug else {edge.MENU}
+
+    keys = set()
+    if old['categories'] != new['categories']:
+        keys.add(edge.CATEGORIES)
+        old_cats = {c['id']: c for c in old['categories']}
+        new_cats = {c['id']: c for c in new['categories']}
+        keys.update(
+            edge.category_key(c) for c in old_cats.keys() | new_cats.keys()
+            if old_cats.get(c) != new_cats.get(c)
+        )
+
+    old_items = {item['id']: item for item in old['items']}
+    new_items = {item['id']: item for item in new['items']}
+    changed = {
+        item_id for item_id in old_items.keys() | new_items.keys()
+        if old_items.get(item_id) != new_items.get(item_id)
+    }
+    # Dishes whose windows changed show up (or go) at other times than before.
+    rescheduled = schedule.changed_items(old.get('timeline'), new.get('timeline'))
+    rescheduled &= old_items.keys() | new_items.keys()
+    if rescheduled:
+        keys.add(edge.CATEGORIES)   # the pill counts
+    for item_id in changed | rescheduled:
+        before, after = old_items.get(item_id), new_items.get(item_id)
+        keys.add(edge.item_key(item_id))
+        for version in (before, after):
+            if version is not None:
+                keys.add(edge.category_key(version['category']))
+                if version['featured']:
+                    keys.add(edge.FEATURED)
+
+    if len(keys) > edge.MAX_ITEM_KEYS:
+        keys = {edge.MENU}
+    if keys and outlet_slug:
+        keys.add(edge.outlet_key(outlet_slug))
+    return keys
+
+
+def _prune(outlet_id, language):
+    published = MenuSnapshot.objects.filter(
+        outlet_id=outlet_id, language=language, published_at__isnull=False,
+    )
+    keep = list(published.values_list('pk', flat=True)[:KEEP_SNAPSHOTS])
+    published.exclude(pk__in=keep).delete()
+
+
+# ---------------------------------------------------------------------------
+# Reading
+# ---------------------------------------------------------------------------
+def live_snapshot_id(outlet_slug=None, language=None):
+    snapshots = MenuSnapshot.objects.filter(
+        language=menu_language(language), published_at__isnull=False,
+    )
+    if outlet_slug is None:
+        snapshots = snapshots.filter(outlet__isnull=True)
+    else:
+        snapshots = snapshots.filter(outlet__slug=outlet_slug, outlet__is_active=True)
+    return snapshots.values_list('pk', flat=True).first()
+
+
+def visible_payload(payload, when=None):
+    """
+    `payload` as the menu looks at `when` (default: now): scheduled dishes
+    outside their windows left out and the category counts adjusted, plus
+
+        segment     index of the timeline entry in force
+        changes_at  when the visible menu next changes (None = never)
+    """
+    segment, hidden, changes_at = schedule.segment_at(payload.get('timeline'), when)
+    categories, items = payload['categories'], payload['items']
+    if hidden:
+        moved = [(item, -1) for item in items if item['id'] in hidden]
+        items = [item for item in items if item['id'] not in hidden]
+        if moved:
+            categories = _recount(categories, moved)
+    return {'categories': categories, 'items': items, 'segment': segment, 'changes_at': changes_at}
+
+
+def get_live_snapshot(outlet_slug=None, language=None):
+    """
+    Return (snapshot_id, payload) for the live menu of `outlet_slug`
+    (None = base menu) in `language` (default: the active language), as
+    visible right now (see visible_payload).
+
+    Publishes one on first use if none exists yet (fresh database, new
+    outlet or new language). Raises Outlet.DoesNotExist for unknown or
+    inactive outlets.
+    """
+    language = menu_language(language)
+    snapshot_id = live_snapshot_id(outlet_slug, language)
+    if snapshot_id is None:
+        outlet = None
+        if outlet_slug is not None:
+            outlet = Outlet.objects.get(slug=outlet_slug, is_active=True)
+        snapshot = stage(outlet, language=language)
+        flip(snapshot)
+        snapshot_id = snapshot.pk
+
+    key = (outlet_slug, language)
+    cached = _loaded.get(key)
+    if cached is not None and cached[0] == snapshot_id:
+        _, payload, visible = cached
+        if visible['changes_at'] is None or timezone.now() < visible['changes_at']:
+            return snapshot_id, visible
+    else:
+        payload = MenuSnapshot.objects.values_list('payload', flat=True).get(pk=snapshot_id)
+
+    visible = visible_payload(payload)
+    with _loaded_lock:
+        _loaded[key] = (snapshot_id, payload, visible)
+        _loaded.move_to_end(key)
+        while len(_loaded) > CACHED_SNAPSHOTS:
+            _loaded.popitem(last=False)
+    return snapshot_id, visible
+
+
+# ---------------------------------------------------------------------------
+# Automatic republishing after admin edits
+# ---------------------------------------------------------------------------
+@contextmanager
+def publishing_paused():
+    """Suppress automatic republishing inside the block (this thread only)."""
+    previous = getattr(_local, 'paused', False)
+    _local.paused = True
+    try:
+        yield
+    finally:
+        _local.paused = previous
+
+
+def _publish_on_commit():
+    pending, _local.pending = _local.pending, set()
+    if ALL_OUTLETS in pending:
+        publish_all()
+        return
+    outlets = Outlet.objects.filter(pk__in=pending, is_active=True)
+    if outlets:
+        publish_outlets(outlets)
+
+
+def schedule_publish(outlet_id=ALL_OUTLETS):
+    """
+    Republish once the current transaction commits: the base menu and every
+    outlet by default, or just one outlet. Repeated calls within a
+    transaction are merged into one publish.
+    """
+    if getattr(_local, 'paused', False):
+        return
+    connection = transaction.get_connection()
+    if not any(entry[1] is _publish_on_commit for entry in connection.run_on_commit):
+        # Nothing queued (or an earlier transaction rolled back): start fresh.
+        _local.pending = {outlet_id}
+        transaction.on_commit(_publish_on_commit)
+    else:
+        _local.pending.add(outlet_id)
@@ -0,0 +1,310 @@
+from datetime import datetime, time
+from decimal import Decimal
+from types import SimpleNamespace
+
+from django import forms
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from . import facets, schedule
+from .fields import EVERY_DAY
+from .models import AvailabilityWindow, Category, MenuItem, Outlet
+from .pricing import adjust_prices
+from .snapshot import BaseMenu, publish_all, publishing_paused
+
+AUTH_TABLES = ('django_session', 'auth_user', 'auth_permission', 'auth_group', 'token_blacklist')
+
+
+def _auth_queries(queries):
+    return [q['sql'] for q in queries if any(table in q['sql'] for table in AUTH_TABLES)]
+
+
+# The test runner sets DEBUG = False, and the manifest only exists after collectstatic.
+STATIC_STORAGES = {
+    'default': {'BACKEND': 'core.storage.HashedMediaStorage'},
+    'staticfiles': {'BACKEND': 'django.contrib.staticfiles.storage.StaticFilesStorage'},
+}
+
+
+@override_settings(EDGE_CACHE_ENABLED=False, STORAGES=STATIC_STORAGES)
+class PublicReadPathTests(TestCase):
+    """Public menu endpoints never load a session or a user."""
+
+    @classmethod
+    def setUpTestData(cls):
+        category = Category.objects.create(name='Starters', display_order=1)
+        MenuItem.objects.create(category=category, name='Paneer Tikka', price_regular=24900, featured=True)
+        MenuItem.objects.create(category=category, name='Chicken Tikka', veg=False, price_regular=29900)
+        publish_all()
+        cls.user = get_user_model().objects.create_user('guest', 'guest@example.com', 'x')
+
+    def assertNoAuthQueries(self, path, **headers):
+        self.client.get(path, **headers)   # warm the live snapshot and lazy imports
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(path, **headers)
+        self.assertEqual(response.status_code, 200, path)
+        self.assertEqual(_auth_queries(queries.captured_queries), [], path)
+
+    def test_api_ignores_session_cookie_and_bearer_token(self):
+        self.client.force_login(self.user)
+        for path in ('/api/menu', '/api/menu?diet=veg', '/api/categories', '/api/featured'):
+            with self.subTest(path=path):
+                self.assertNoAuthQueries(path, HTTP_AUTHORIZATION='Bearer not-a-real-token')
+
+    def test_anonymous_pages_do_not_touch_the_session_store(self):
+        for path in ('/', '/about/', '/contact/', '/menu/', '/menu/?category=all&diet=veg'):
+            with self.subTest(path=path):
+                self.assertNoAuthQueries(path)
+
+    def test_htmx_fragment_does_not_touch_the_session_store(self):
+        self.assertNoAuthQueries('/menu/cards/?category=all&diet=all', HTTP_HX_REQUEST='true')
+
+
+@override_settings(STORAGES=STATIC_STORAGES)
+class AdminChangelistQueryTests(TestCase):
+    """The MenuItem changelist's query count does not grow with the menu (menu/admin.py)."""
+
+    SMALL_MENU = 100
+    LARGE_MENU = 10_000
+
+    @classmethod
+    def setUpTestData(cls):
+        with publishing_paused():   # leave run_on_commit empty for the toggle tests
+            cls.category = Category.objects.create(name='Query check', display_order=999)
+        cls.user = get_user_model().objects.create_superuser('query-check', 'query-check@example.com', 'x')
+        cls._grow(cls.SMALL_MENU)
+
+    @classmethod
+    def _grow(cls, size):
+        existing = MenuItem.objects.count()
+        MenuItem.objects.bulk_create(
+            (
+                MenuItem(
+                    category=cls.category,
+                    name=f'Query check dish {n}',
+                    description=f'Slow-cooked dish number {n} with onion, tomato and spices.',
+                    price_regular=10_000 + n,
+                )
+                for n in range(existing, size)
+            ),
+            batch_size=1000,
+        )
+
+    def setUp(self):
+        self.client.force_login(self.user)
+        self.changelist = reverse('admin:menu_menuitem_changelist')
+
+    def assertNumQueriesAtBothSizes(self, num, request):
+        """`request` issues `num` queries with SMALL_MENU dishes and again with LARGE_MENU."""
+        for size in (self.SMALL_MENU, self.LARGE_MENU):
+            self._grow(size)
+            request()   # warm per-process caches (content types, templates)
+            with self.subTest(dishes=size), self.assertNumQueries(num):
+                response = request()
+            self.assertEqual(response.status_code, 200)
+
+    def test_changelist(self):
+        self.assertNumQueriesAtBothSizes(5, lambda: self.client.get(self.changelist))
+
+    def test_search(self):
+        self.assertNumQueriesAtBothSizes(5, lambda: self.client.get(self.changelist, {'q': 'dish 42'}))
+
+    def test_category_filter(self):
+        self.assertNumQueriesAtBothSizes(
+            5, lambda: self.client.get(self.changelist, {'category__id__exact': self.category.pk}),
+        )
+
+    def test_page_two(self):
+        self.assertNumQueriesAtBothSizes(5, lambda: self.client.get(self.changelist, {'p': 2}))
+
+    def test_toggle_featured_is_a_single_row_update(self):
+        item = MenuItem.objects.order_by('pk').first()
+        toggle = reverse('admin:menu_menuitem_toggle', args=[item.pk, 'featured'])
+        self.assertNumQueriesAtBothSizes(7, lambda: self.client.post(toggle, {'value': '1'}))
+
+        with CaptureQueriesContext(connection) as queries:
+            self.client.post(toggle, {'value': '0'})
+        updates = [q['sql'] for q in queries.captured_queries
+                   if q['sql'].startswith('UPDATE') and 'menu_menuitem' in q['sql']]
+        self.assertEqual(len(updates), 1, updates)
+
+    def test_toggle_republishes_each_outlet_and_language_once(self):
+        # A base-menu flag shows in every outlet's and language's snapshot, so
+        # the on-commit publish stages all of them from one serialization.
+        Outlet.objects.bulk_create(Outlet(name=f'Outlet {n}', slug=f'outlet-{n}') for n in range(2))
+        item = MenuItem.objects.order_by('pk').first()
+        url = reverse('admin:menu_menuitem_toggle', args=[item.pk, 'is_available'])
+
+        def toggle():
+            # Run the on-commit callbacks, then drop them as a real commit would.
+            start = len(connection.run_on_commit)
+            with self.captureOnCommitCallbacks(execute=True):
+                response = self.client.post(url, {'value': '1'})
+            del connection.run_on_commit[start:]
+            return response
+
+        self.assertNumQueriesAtBothSizes(42, toggle)   # 7 for the toggle, 35 to publish
+        with CaptureQueriesContext(connection) as queries:
+            toggle()
+        staged = [q['sql'] for q in queries.captured_queries
+                  if q['sql'].startswith('INSERT INTO "menu_menusnapshot"')]
+        self.assertEqual(len(staged), 3 * len(settings.LANGUAGES))
+
+
+@override_settings(EDGE_CACHE_ENABLED=True, STORAGES=STATIC_STORAGES)
+class LanguageNegotiationTests(TestCase):
+    """The language comes from ?lang or Accept-Language; the cookie is neither read nor set."""
+
+    @classmethod
+    def setUpTestData(cls):
+        category = Category.objects.create(name='Starters', name_hi='स्टार्टर', display_order=1)
+        MenuItem.objects.create(category=category, name='Paneer Tikka', price_regular=24900)
+        publish_all()
+
+    def test_language_cookie_is_ignored(self):
+        self.client.cookies.load({'django_language': 'hi'})
+        response = self.client.get('/menu/', HTTP_ACCEPT_ENCODING='gzip')
+        self.assertEqual(response['Content-Language'], 'en')
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+        self.assertNotIn('Cookie', response['Vary'])
+
+    def test_lang_parameter_and_accept_language(self):
+        for path, headers in (('/menu/?lang=hi', {}), ('/menu/', {'HTTP_ACCEPT_LANGUAGE': 'hi-IN,hi;q=0.9'})):
+            with self.subTest(path=path, headers=headers):
+                response = self.client.get(path, **headers)
+                self.assertEqual(response['Content-Language'], 'hi')
+                self.assertFalse(response.cookies)
+                self.assertIn('public', response['Cache-Control'])
+
+
+class PriceTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.category = Category.objects.create(name='Mains', display_order=1)
+
+    def test_unchanged_rupee_input_is_not_a_change(self):
+        item = MenuItem.objects.create(category=self.category, name='Dal Makhani', price_regular=18900)
+        form_class = forms.modelform_factory(MenuItem, fields=['price_regular'])
+        self.assertEqual(form_class({'price_regular': '189.00'}, instance=item).changed_data, [])
+        self.assertEqual(form_class({'price_regular': '189.50'}, instance=item).changed_data, ['price_regular'])
+
+    def test_adjust_prices_rounds_half_up_in_integers(self):
+        item = MenuItem.objects.create(category=self.category, name='Dal Makhani', price_regular=18900)
+        adjust_prices(MenuItem.objects.all(), percent=Decimal('2.5'), rounding='paisa')
+        item.refresh_from_db()
+        self.assertEqual(item.price_regular, 19373)   # 19372.5
+        self.assertIsNone(item.price_half)
+
+        adjust_prices(MenuItem.objects.all(), percent=-10, rounding='five')
+        item.refresh_from_db()
+        self.assertEqual(item.price_regular, 17500)   # 17435.7
+
+        adjust_prices(MenuItem.objects.all(), flat_paise=-20000, rounding='rupee')
+        item.refresh_from_db()
+        self.assertEqual(item.price_regular, 0)
+
+
+def _window(start, end, days=EVERY_DAY):
+    return SimpleNamespace(start_time=time(*start), end_time=time(*end), days=days)
+
+
+def _local(*args):
+    return timezone.make_aware(datetime(*args))
+
+
+SUNDAY = 1 << 6
+LATE_SUNDAY = 6 * schedule.DAY_MINUTES + 22 * 60   # Sun 22:00, minute of the week
+
+
+class ScheduleTests(SimpleTestCase):
+    """menu/schedule.py: window ranges, the weekly timeline and lookups in it."""
+
+    def test_overnight_window_ends_the_next_day(self):
+        self.assertEqual(schedule.window_ranges(_window((22, 0), (2, 0), days=1)), [(22 * 60, 26 * 60)])
+
+    def test_sunday_night_wraps_into_monday_morning(self):
+        self.assertEqual(
+            schedule.window_ranges(_window((22, 0), (2, 0), days=SUNDAY)),
+            [(LATE_SUNDAY, schedule.WEEK_MINUTES), (0, 120)],
+        )
+
+    def test_timeline_merges_items_and_wraps(self):
+        late = schedule.window_ranges(_window((22, 0), (2, 0), days=SUNDAY))
+        timeline = schedule.build_timeline({1: late, 2: late})
+        self.assertEqual(timeline, [[0, []], [120, [1, 2]], [LATE_SUNDAY, []]])
+        self.assertEqual(schedule.build_timeline({}), [])
+
+    def test_changes_at_wraps_into_next_week(self):
+        timeline = schedule.build_timeline({1: schedule.window_ranges(_window((22, 0), (2, 0), days=SUNDAY))})
+        # 2026-10-25 is a Sunday.
+        index, hidden, changes_at = schedule.segment_at(timeline, _local(2026, 10, 25, 23, 0))
+        self.assertEqual((index, hidden), (2, frozenset()))
+        self.assertEqual(changes_at, _local(2026, 10, 26, 2, 0))
+
+        index, hidden, changes_at = schedule.segment_at(timeline, _local(2026, 10, 21, 12, 0))
+        self.assertEqual((index, hidden), (1, frozenset({1})))
+        self.assertEqual(changes_at, _local(2026, 10, 25, 22, 0))
+
+    def test_unscheduled_menu_never_changes(self):
+        self.assertEqual(schedule.segment_at([]), (0, frozenset(), None))
+
+    def test_changed_items(self):
+        breakfast = schedule.window_ranges(_window((7, 0), (11, 0)))
+        old = schedule.build_timeline({1: breakfast, 2: breakfast})
+        new = schedule.build_timeline({1: breakfast, 2: schedule.window_ranges(_window((7, 0), (12, 0)))})
+        self.assertEqual(schedule.changed_items(old, old), set())
+        self.assertEqual(schedule.changed_items(old, new), {2})
+        self.assertEqual(schedule.changed_items(old, []), {1, 2})
+
+
+class ItemWindowTests(TestCase):
+    def test_item_windows_replace_its_categorys(self):
+        category = Category.objects.create(name='Breakfast', display_order=1)
+        poha = MenuItem.objects.create(category=category, name='Poha', price_regular=9900)
+        kebab = MenuItem.objects.create(category=category, name='Seekh Kebab', price_regular=29900)
+        AvailabilityWindow.objects.create(category=category, start_time=time(7), end_time=time(11))
+        AvailabilityWindow.objects.create(item=kebab, start_time=time(18), end_time=time(22))
+        timeline = BaseMenu().timeline
+
+        # 2026-10-19 is a Monday.
+        _, hidden, _ = schedule.segment_at(timeline, _local(2026, 10, 19, 8, 0))
+        self.assertEqual(hidden, {kebab.pk})
+        _, hidden, _ = schedule.segment_at(timeline, _local(2026, 10, 19, 19, 0))
+        self.assertEqual(hidden, {poha.pk})
+
+
+class FacetTests(TestCase):
+    """menu/facets.py: counts kept by deltas stay equal to a fresh GROUP BY."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.category = Category.objects.create(name='Mains', display_order=1)
+        cls.item = MenuItem.objects.create(category=cls.category, name='Dal Makhani', price_regular=18900)
+
+    def test_same_key_is_a_no_op(self):
+        key = self.item.facet_key()
+        with self.assertNumQueries(0):
+            facets.record_change(key, key)
+
+    def test_update_outside_save_moves_the_count(self):
+        # What the admin's availability toggle does: update(), then record_change().
+        old_key = self.item.facet_key()
+        MenuItem.objects.filter(pk=self.item.pk).update(is_available=False)
+        self.item.is_available = False
+        facets.record_change(old_key, self.item.facet_key())
+
+        self.assertEqual(facets.check(), [])
+        self.assertEqual(facets.counts(), {})
+        self.assertEqual(facets.stored(), {(self.category.pk, 'veg', False): 1})
+
+    def test_new_and_deleted_items(self):
+        paneer = MenuItem.objects.create(category=self.category, name='Paneer Tikka', price_regular=24900)
+        self.assertEqual(facets.counts()[self.category.pk], {'all': 2, 'veg': 2, 'egg': 0, 'nonveg': 0})
+        paneer.delete()
+        self.assertEqual(facets.counts()[self.category.pk]['all'], 1)
+        self.assertEqual(facets.check(), [])
@@ -2,8 +2,9 @@
 Template URL routes for menu-related pages.
 """
 from django.urls import path
-from .views import menu_page
+from .views import menu_cards, menu_page
 
 urlpatterns = [
     path('', menu_page, name='menu'),
+    path('cards/', menu_cards, name='menu-cards'),
 ]
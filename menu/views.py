@@ -1,11 +1,99 @@
 """
 Template-rendered views for the /menu/ page.
 """
-from django.shortcuts import render
-from .models import Category
+from django.conf import settings
+from django.http import Http404, HttpResponse, HttpResponseBadRequest
+from django.urls import reverse
 
+from core import edge
+from core.i18n import LANGUAGE_PARAM, requested_language
+from core.rendering import engine_for, render_public
 
+from . import fragments
+from .models import Outlet
+from .snapshot import get_live_snapshot, menu_language
+
+
+def _language_links(request):
+    """(code, label, url) per language: this page with ?lang=<code>."""
+    links = []
+    for code, label in settings.LANGUAGES:
+        query = request.GET.copy()
+        query[LANGUAGE_PARAM] = code
+        links.append((code, label, f'{request.path}?{query.urlencode()}'))
+    return links
+
+
+def _filtered(request):
+    """(snapshot id, payload, category, diet) for the request's filters."""
+    try:
+        snapshot_id, payload = get_live_snapshot(request.GET.get('outlet') or None)
+    except Outlet.DoesNotExist:
+        raise Http404('Unknown outlet.')
+    category, diet = fragments.resolve_filters(request.GET, payload['categories'])
+    return snapshot_id, payload, category, diet
+
+
+def _tag(response, request, payload, category, diet):
+    if category == fragments.ALL_CATEGORIES:
+        category_ids = [c['id'] for c in payload['categories']]
+    else:
+        category_ids = [category]
+    items = fragments.filter_items(payload['items'], category, diet)
+    # CATEGORIES: the tab bar on full pages, new categories' dishes on "All".
+    keys = edge.menu_keys(items, category_ids, request.GET.get('outlet')) | {edge.CATEGORIES}
+    edge.expire_at(response, payload['changes_at'])
+    return edge.add_keys(response, keys)
+
+
+@edge.edge_cache('page')
 def menu_page(request):
-    """Public menu page — renders a full menu driven by the JS/API."""
-    categories = Category.objects.all().order_by('display_order')
-    return render(request, 'menu/menu.html', {'categories': categories})
+    """
+    Public menu page, server-rendered: the cards for the selected category
+    (the first one by default) and diet are in the initial HTML. HTMX tab
+    clicks fetch just the card grid from menu_cards.
+
+        /menu/?category=<id|all>&diet=<veg|egg|nonveg>&outlet=<slug>&lang=<en|hi>
+
+    Dish and category names are in the active language (core/i18n.py).
+    """
+    try:
+        snapshot_id, payload, category, diet = _filtered(request)
+    except fragments.InvalidFilter as exc:
+        return HttpResponseBadRequest(str(exc))
+    cards = fragments.render_cards(snapshot_id, payload, category, diet, using=engine_for(request))
+    response = render_public(request, 'menu/menu.html', {
+        **fragments.pill_context(payload['categories'], category, diet),
+        'active_category': category,
+        'active_diet': diet,
+        'outlet': request.GET.get('outlet', ''),
+        'lang': requested_language(request) or '',
+        'language': menu_language(),
+        'language_links': _language_links(request),
+        'cards': cards,
+    })
+    return _tag(response, request, payload, category, diet)
+
+
+@edge.edge_cache('page')
+def menu_cards(request):
+    """
+    The card grid for /menu/'s filters plus the pill counts as out-of-band
+    swaps; what the HTMX tabs request. It has its own URL so that no cache
+    can confuse it with the full page, and HX-Push-Url puts the matching
+    /menu/ URL in the address bar.
+
+        /menu/cards/?category=<id|all>&diet=<veg|egg|nonveg>&outlet=<slug>&lang=<en|hi>
+    """
+    try:
+        snapshot_id, payload, category, diet = _filtered(request)
+    except fragments.InvalidFilter as exc:
+        return HttpResponseBadRequest(str(exc))
+    # The grid is swapped into /menu/, so it is rendered like that page.
+    using = engine_for(request, 'menu')
+    cards = fragments.render_cards(snapshot_id, payload, category, diet, using=using)
+    counts = fragments.render_counts(payload['categories'], category, diet, using=using)
+    response = HttpResponse(cards + counts)
+    query = request.GET.urlencode()
+    response['HX-Push-Url'] = f"{reverse('menu')}?{query}" if query else reverse('menu')
+    return _tag(response, request, payload, category, diet)
@@ -0,0 +1,41 @@
+from django.contrib import admin
+
+from menu.pricing import format_paise
+
+from .models import Order, OrderLine
+
+
+class OrderLineInline(admin.TabularInline):
+    model           = OrderLine
+    extra           = 0
+    can_delete      = False
+    fields          = ('line_no', 'item_name', 'portion', 'quantity', 'unit_price', 'line_total')
+    readonly_fields = fields
+
+    def has_add_permission(self, request, obj=None):
+        return False
+
+
+@admin.register(Order)
+class OrderAdmin(admin.ModelAdmin):
+    list_display    = ('short_id', 'created_at', 'customer_name', 'phone', 'outlet',
+                       'line_count', 'total_display', 'status')
+    list_filter     = ('status', 'outlet')
+    list_editable   = ('status',)
+    list_select_related = ('outlet',)
+    search_fields   = ('customer_name', 'phone', 'id')
+    date_hierarchy  = 'created_at'
+    readonly_fields = ('id', 'idempotency_key', 'request_hash', 'outlet', 'customer_name',
+                       'phone', 'notes', 'total', 'line_count', 'menu_snapshot', 'created_at')
+    inlines         = (OrderLineInline,)
+
+    def has_add_permission(self, request):
+        return False
+
+    @admin.display(description='Order')
+    def short_id(self, obj):
+        return str(obj.pk)[:8]
+
+    @admin.display(description='Total', ordering='total')
+    def total_display(self, obj):
+        return f'₹{format_paise(obj.total)}'
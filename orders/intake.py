@@ -0,0 +1,341 @@
+"""
+Order intake: validation against the live menu snapshot, idempotent
+persistence and an optional write-behind queue.
+
+Validation never queries MenuItem. Cart lines are priced from the live
+MenuSnapshot (menu/snapshot.py), indexed once per snapshot into
+{item id: (name, {portion: paise})} and kept in memory until the next flip.
+
+Idempotency: the Order primary key is derived from the Idempotency-Key,
+scoped to the customer's phone number and keyed with SECRET_KEY (see
+order_id_for), so a retry of the same submission can only ever hit the
+same row, and nobody can work out another client's order id from a key.
+A retry is answered from the stored row before the cart is checked
+against the menu again; one whose body differs from the stored
+request_hash is rejected.
+
+Persistence is two bulk INSERTs per batch (orders, then lines). With
+settings.ORDERS_WRITE_BEHIND the request only validates and enqueues, and
+a per-process writer thread inserts up to ORDERS_BATCH_SIZE orders per
+transaction with ignore_conflicts, so retries racing through the queue
+still collapse onto one row.
+
+The write-behind queue lives in the worker's memory only. Its limits:
+
+  * orders are flushed on a clean exit (atexit); a worker killed by the
+    gunicorn timeout, SIGKILL or the OOM killer loses orders it already
+    answered 202 for;
+  * until written, a queued order is known only to its own worker: GET
+    /api/orders/<id>/ on another worker is a 404, and a retry landing
+    on another worker is checked against the database only.
+
+Leave it off where an accepted order must never be lost.
+"""
+import atexit
+import hashlib
+import hmac
+import json
+import logging
+import queue
+import threading
+import time
+import uuid
+
+from django.conf import settings
+from django.db import (
+    DatabaseError, IntegrityError, OperationalError, close_old_connections, transaction,
+)
+from django.utils import timezone
+
+from menu.models import Outlet
+from menu.pricing import to_paise
+from menu.snapshot import get_live_snapshot
+
+from .models import Order, OrderLine
+
+logger = logging.getLogger(__name__)
+
+ORDER_NAMESPACE = uuid.UUID('5d1c7a4e-2b7f-4d0e-9c8a-6f1e3b2a9d40')
+PORTION_FIELDS = {'regular': 'price_regular', 'half': 'price_half', 'full': 'price_full'}
+MAX_INDEXES = 64
+
+
+class OrderRejected(Exception):
+    """Raised with a DRF-style error dict when a cart cannot be accepted."""
+
+    def __init__(self, detail, status=400):
+        super().__init__(detail)
+        self.detail = detail
+        self.status = status
+
+
+# ---------------------------------------------------------------------------
+# Menu index (per snapshot, in memory)
+# ---------------------------------------------------------------------------
+_indexes = {}
+_indexes_lock = threading.Lock()
+
+
+def menu_index(outlet_slug=None):
+    """Return (snapshot_id, outlet_id, {item_id: (name, {portion: paise})})."""
+    try:
+        # Orders record dish names in the kitchen's language, whatever the customer reads.
+        snapshot_id, payload = get_live_snapshot(outlet_slug, settings.LANGUAGE_CODE)
+    except Outlet.DoesNotExist:
+        raise OrderRejected({'outlet': ['Unknown outlet.']})
+
+    # Dishes outside their availability windows are not orderable either.
+    key = (snapshot_id, payload['segment'])
+    cached = _indexes.get(key)
+    if cached is not None:
+        return cached
+
+    outlet_id = None
+    if outlet_slug is not None:
+        outlet_id = Outlet.objects.values_list('pk', flat=True).get(slug=outlet_slug)
+    items = {
+        item['id']: (
+            item['name'],
+            {
+                portion: to_paise(item[field])
+                for portion, field in PORTION_FIELDS.items()
+                if item[field] is not None
+            },
+        )
+        for item in payload['items']
+    }
+    with _indexes_lock:
+        if len(_indexes) >= MAX_INDEXES:
+            _indexes.clear()
+        _indexes[key] = (snapshot_id, outlet_id, items)
+    return _indexes[key]
+
+
+# ---------------------------------------------------------------------------
+# Building
+# ---------------------------------------------------------------------------
+def order_id_for(idempotency_key, phone):
+    """The Order id for a client's Idempotency-Key: private to that phone number and this site."""
+    if not idempotency_key:
+        return uuid.uuid4()
+    digits = ''.join(c for c in phone if c.isdigit())
+    scoped = hmac.new(
+        settings.SECRET_KEY.encode(), f'{digits}\n{idempotency_key}'.encode(), hashlib.sha256,
+    ).hexdigest()
+    return uuid.uuid5(ORDER_NAMESPACE, scoped)
+
+
+def request_hash(data):
+    canonical = json.dumps(data, sort_keys=True, separators=(',', ':'), default=str)
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+def build_order(data, idempotency_key=''):
+    """
+    Price validated input (OrderInputSerializer.validated_data) against the
+    live menu. Returns unsaved (Order, [OrderLine]); raises OrderRejected.
+    """
+    snapshot_id, outlet_id, items = menu_index(data.get('outlet') or None)
+    order = Order(
+        id=order_id_for(idempotency_key, data['phone']),
+        idempotency_key=idempotency_key,
+        request_hash=request_hash(data),
+        outlet_id=outlet_id,
+        customer_name=data['customer_name'],
+        phone=data['phone'],
+        notes=data.get('notes', ''),
+        menu_snapshot=snapshot_id,
+        created_at=timezone.now(),
+    )
+
+    lines, errors, total = [], {}, 0
+    for line_no, line in enumerate(data['lines'], start=1):
+        entry = items.get(line['item'])
+        if entry is None:
+            errors[line_no] = f"Item {line['item']} is not on the menu right now."
+            continue
+        name, prices = entry
+        unit_price = prices.get(line['portion'])
+        if unit_price is None:
+            errors[line_no] = f"{name} has no {line['portion']} portion."
+            continue
+        line_total = unit_price * line['quantity']
+        total += line_total
+        lines.append(OrderLine(
+            order=order,
+            line_no=line_no,
+            item_id=line['item'],
+            item_name=name,
+            portion=line['portion'],
+            quantity=line['quantity'],
+            unit_price=unit_price,
+            line_total=line_total,
+        ))
+    if errors:
+        raise OrderRejected({'lines': errors})
+
+    order.total = total
+    order.line_count = len(lines)
+    return order, lines
+
+
+# ---------------------------------------------------------------------------
+# Persisting
+# ---------------------------------------------------------------------------
+def find_existing(order_id, body_hash):
+    """
+    Return the stored order `order_id`, or None. Raises OrderRejected (422)
+    if its Idempotency-Key was used for a different order (`body_hash`).
+    """
+    existing = Order.objects.filter(pk=order_id).first()
+    if existing is not None and existing.request_hash != body_hash:
+        raise OrderRejected(
+            {'detail': 'Idempotency-Key was already used for a different order.'}, status=422,
+        )
+    return existing
+
+
+def find_queued(order_id, body_hash):
+    """
+    (order, lines) still waiting in this worker's write-behind queue, or
+    None; raises OrderRejected (422) like find_existing.
+    """
+    if write_behind is None:
+        return None
+    queued = write_behind.get_pending(order_id)
+    if queued is not None and queued[0].request_hash != body_hash:
+        raise OrderRejected(
+            {'detail': 'Idempotency-Key was already used for a different order.'}, status=422,
+        )
+    return queued
+
+
+def save_order(order, lines):
+    """
+    Insert one order synchronously. Returns (order, created); a concurrent
+    retry that won the race returns the stored row with created=False.
+    """
+    try:
+        with transaction.atomic():
+            Order.objects.bulk_create([order])
+            OrderLine.objects.bulk_create(lines)
+    except IntegrityError:
+        existing = find_existing(order.pk, order.request_hash) if order.idempotency_key else None
+        if existing is None:
+            raise
+        return existing, False
+    return order, True
+
+
+def save_batch(batch):
+    """Insert many (order, lines) pairs in one transaction; duplicates are skipped."""
+    with transaction.atomic():
+        Order.objects.bulk_create([order for order, _ in batch], ignore_conflicts=True)
+        OrderLine.objects.bulk_create(
+            [line for _, lines in batch for line in lines], ignore_conflicts=True,
+        )
+
+
+class WriteBehindQueue:
+    """Per-process queue drained by one writer thread in batched transactions."""
+
+    def __init__(self):
+        self.queue = queue.Queue(maxsize=settings.ORDERS_QUEUE_MAX)
+        self.pending = {}   # order id → (order, lines), until written
+        self.lock = threading.Lock()
+        self.thread = None
+        atexit.register(self.flush)
+
+    def submit(self, order, lines):
+        """Enqueue; returns False when the queue is full (caller writes synchronously)."""
+        self._ensure_thread()
+        with self.lock:
+            self.pending[order.pk] = (order, lines)
+        try:
+            self.queue.put_nowait((order, lines))
+        except queue.Full:
+            with self.lock:
+                self.pending.pop(order.pk, None)
+            return False
+        return True
+
+    def get_pending(self, order_id):
+        return self.pending.get(order_id)
+
+    def flush(self, timeout=30):
+        """Stop the writer after it has written everything queued (process exit)."""
+        if self.thread is not None and self.thread.is_alive():
+            self.queue.put(_STOP, timeout=timeout)
+            self.thread.join(timeout)
+
+    def _ensure_thread(self):
+        if self.thread is None or not self.thread.is_alive():
+            with self.lock:
+                if self.thread is None or not self.thread.is_alive():
+                    self.thread = threading.Thread(
+                        target=self._run, name='orders-write-behind', daemon=True,
+                    )
+                    self.thread.start()
+
+    def _run(self):
+        batch_size = settings.ORDERS_BATCH_SIZE
+        flush_after = settings.ORDERS_FLUSH_MS / 1000
+        while True:
+            batch = [self.queue.get()]
+            deadline = time.monotonic() + flush_after
+            while len(batch) < batch_size and batch[-1] is not _STOP:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self.queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            stopping = batch[-1] is _STOP
+            batch = [entry for entry in batch if entry is not _STOP]
+            if batch:
+                self._write(batch)
+            if stopping:
+                return
+
+    def _write(self, batch):
+        try:
+            self._save(batch)
+        except DatabaseError:
+            # Some row is bad (e.g. its menu item was deleted meanwhile):
+            # isolate it instead of failing the whole batch.
+            for pair in batch:
+                self._write_one(pair)
+        with self.lock:
+            for order, _ in batch:
+                self.pending.pop(order.pk, None)
+
+    def _write_one(self, pair):
+        order, lines = pair
+        try:
+            try:
+                self._save([pair])
+            except IntegrityError:
+                logger.warning('Order %s references deleted menu items; keeping names only', order.pk)
+                for line in lines:
+                    line.item_id = None
+                self._save([pair])
+        except DatabaseError:
+            logger.exception('Write-behind could not store order %s; dropping it', order.pk)
+
+    def _save(self, batch):
+        """save_batch(), retried while the database is unavailable or locked."""
+        delay = 0.05
+        while True:
+            close_old_connections()
+            try:
+                return save_batch(batch)
+            except OperationalError:
+                # Never drop accepted orders: retry until the database is back.
+                logger.exception('Write-behind insert of %d orders failed; retrying', len(batch))
+                time.sleep(delay)
+                delay = min(delay * 2, 5)
+
+
+_STOP = object()
+write_behind = WriteBehindQueue() if settings.ORDERS_WRITE_BEHIND else None
@@ -0,0 +1,184 @@
+"""
+Management command: orders_stress
+
+Usage:
+    python manage.py orders_stress                          # 2000 orders, 50 clients
+    python manage.py orders_stress --orders 5000 --concurrency 200 --write-behind
+    python manage.py orders_stress --server none --port 8000
+
+Starts gunicorn (gunicorn.conf.py, order throttle lifted) against the
+configured DATABASE_URL — SQLite in WAL mode or Postgres — and submits
+orders concurrently over keep-alive connections. A share of submissions
+(--retry-rate) is sent a second time with the same Idempotency-Key on a
+different connection, racing the original, like a mobile client retrying
+after a timeout.
+
+After the server has shut down (which flushes any write-behind queue),
+the database is checked: every distinct key must have exactly one order
+with all of its lines and the expected total. Lost or duplicated orders
+fail the command. Stress orders are deleted afterwards unless --keep.
+"""
+import asyncio
+import json
+import random
+import time
+import uuid
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db.models import Count, Sum
+
+from core.loadgen import HTTPConnection, free_port, start_server, stop_server, wait_for_port
+from menu.pricing import to_paise
+from menu.snapshot import get_live_snapshot
+from orders.models import Order
+
+PHONE = "+91 98100 00000"
+
+
+class Command(BaseCommand):
+    help = "Concurrent order submissions with retries; verifies no lost or duplicate orders."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--orders", type=int, default=2000, help="Distinct orders to place.")
+        parser.add_argument("--concurrency", type=int, default=50)
+        parser.add_argument("--retry-rate", type=float, default=0.2,
+                            help="Share of orders submitted twice, concurrently.")
+        parser.add_argument("--write-behind", action="store_true",
+                            help="Run the server with ORDERS_WRITE_BEHIND=true.")
+        parser.add_argument("--server", default="gunicorn", choices=["gunicorn", "uvicorn", "none"])
+        parser.add_argument("--port", type=int, help="Port of an existing server (--server none).")
+        parser.add_argument("--keep", action="store_true", help="Keep the stress orders.")
+
+    def handle(self, *args, **options):
+        run_tag = f"stress-{uuid.uuid4().hex[:8]}"
+        submissions, expected = self._plan(run_tag, options)
+
+        if options["server"] == "none":
+            if not options["port"]:
+                raise CommandError("--server none needs --port")
+            port, proc = options["port"], None
+        else:
+            port = free_port()
+            proc = start_server(options["server"], port, {
+                "ORDER_THROTTLE_RATE": "1000000/min",
+                "ORDERS_WRITE_BEHIND": "true" if options["write_behind"] else "false",
+            })
+            if not wait_for_port(port):
+                stop_server(proc)
+                raise CommandError(f"{options['server']} did not start listening in time")
+        try:
+            statuses, elapsed = asyncio.run(self._submit(port, submissions, options["concurrency"]))
+        finally:
+            if proc is not None:
+                stop_server(proc)   # graceful: write-behind queues flush on exit
+
+        self.stdout.write(
+            f"\n  {len(submissions)} submissions ({len(expected)} distinct orders) in "
+            f"{elapsed:.1f} s — {len(submissions) / elapsed:.0f} req/s"
+        )
+        self.stdout.write("  responses: " + ", ".join(
+            f"{code or 'error'}×{n}" for code, n in sorted(statuses.items(), key=lambda kv: kv[0] or 0)
+        ))
+        problems = self._verify(run_tag, expected)
+        if not options["keep"]:
+            Order.objects.filter(customer_name=run_tag).delete()
+        if problems:
+            for problem in problems[:20]:
+                self.stderr.write(self.style.ERROR(f"  ❌  {problem}"))
+            raise CommandError(f"{len(problems)} problem(s) found")
+        self.stdout.write(self.style.SUCCESS(
+            f"  ✔  {len(expected)} orders stored exactly once with all lines and correct totals"
+        ))
+
+    # ------------------------------------------------------------------
+    def _plan(self, run_tag, options):
+        _, payload = get_live_snapshot()
+        priced = [
+            (item["id"], portion, to_paise(item[field]))
+            for item in payload["items"]
+            for portion, field in (("regular", "price_regular"), ("half", "price_half"),
+                                   ("full", "price_full"))
+            if item[field] is not None
+        ]
+        if not priced:
+            raise CommandError("The live menu is empty — run seed_menu first.")
+
+        rng = random.Random(7)
+        submissions, expected = [], {}
+        for _ in range(options["orders"]):
+            key = str(uuid.uuid4())
+            picks = rng.sample(priced, rng.randint(1, min(6, len(priced))))
+            lines = [{"item": i, "portion": p, "quantity": rng.randint(1, 3)} for i, p, _ in picks]
+            total = sum(price * line["quantity"] for (_, _, price), line in zip(picks, lines))
+            body = json.dumps({
+                "customer_name": run_tag,
+                "phone": PHONE,
+                "lines": lines,
+            }).encode()
+            expected[key] = (len(lines), total)
+            submissions.append((key, body))
+            if rng.random() < options["retry_rate"]:
+                submissions.append((key, body))
+        rng.shuffle(submissions)
+        return submissions, expected
+
+    async def _submit(self, port, submissions, concurrency):
+        pending = asyncio.Queue()
+        for entry in submissions:
+            pending.put_nowait(entry)
+        statuses = {}
+
+        async def client():
+            conn = HTTPConnection("127.0.0.1", port, {
+                "X-Forwarded-Proto": "https",
+                "Content-Type": "application/json",
+            })
+            try:
+                while not pending.empty():
+                    key, body = pending.get_nowait()
+                    for attempt in range(5):
+                        try:
+                            status, _, _ = await conn.request(
+                                "POST", "/api/orders/", body, {"Idempotency-Key": key},
+                            )
+                        except (OSError, asyncio.IncompleteReadError, ValueError):
+                            status = None
+                            await conn.close()
+                        # Retry like a client would: same key, after errors.
+                        if status is not None and status < 500:
+                            break
+                        await asyncio.sleep(0.05 * (attempt + 1))
+                    statuses[status] = statuses.get(status, 0) + 1
+            finally:
+                await conn.close()
+
+        started = time.monotonic()
+        await asyncio.gather(*[client() for _ in range(concurrency)])
+        return statuses, time.monotonic() - started
+
+    def _verify(self, run_tag, expected):
+        from orders.intake import order_id_for
+
+        stored = {
+            row["pk"]: row
+            for row in Order.objects.filter(customer_name=run_tag)
+            .annotate(lines_stored=Count("lines"), lines_total=Sum("lines__line_total"))
+            .values("pk", "idempotency_key", "total", "line_count", "lines_stored", "lines_total")
+        }
+        problems = []
+        seen_keys = set()
+        for row in stored.values():
+            if row["idempotency_key"] in seen_keys:
+                problems.append(f"duplicate order for key {row['idempotency_key']}")
+            seen_keys.add(row["idempotency_key"])
+        for key, (line_count, total) in expected.items():
+            row = stored.get(order_id_for(key, PHONE))
+            if row is None:
+                problems.append(f"lost order for key {key}")
+            elif (row["line_count"], row["lines_stored"]) != (line_count, line_count):
+                problems.append(f"order {row['pk']}: {row['lines_stored']}/{line_count} lines")
+            elif row["total"] != total or row["lines_total"] != total:
+                problems.append(f"order {row['pk']}: total {row['total']} ≠ expected {total}")
+        if len(stored) > len(expected):
+            problems.append(f"{len(stored) - len(expected)} unexpected extra orders")
+        return problems
@@ -0,0 +1,61 @@
+# Generated by Django 5.1.15 on 2026-10-19 14:46
+
+import django.db.models.deletion
+import django.utils.timezone
+import menu.fields
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('menu', '0005_outlets'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Order',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('idempotency_key', models.CharField(blank=True, max_length=255)),
+                ('request_hash', models.CharField(help_text='SHA-256 of the submitted order; a retry must match it.', max_length=64)),
+                ('customer_name', models.CharField(max_length=100)),
+                ('phone', models.CharField(max_length=20)),
+                ('notes', models.TextField(blank=True)),
+                ('status', models.CharField(choices=[('received', 'Received'), ('accepted', 'Accepted'), ('ready', 'Ready'), ('completed', 'Completed'), ('cancelled', 'Cancelled')], db_index=True, default='received', max_length=20)),
+                ('total', menu.fields.PaiseField(help_text='Order total (₹)')),
+                ('line_count', models.PositiveSmallIntegerField()),
+                ('menu_snapshot', models.PositiveBigIntegerField(help_text='MenuSnapshot the prices were taken from.')),
+                ('created_at', models.DateTimeField(db_index=True, default=django.utils.timezone.now)),
+                ('outlet', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='orders', to='menu.outlet')),
+            ],
+            options={
+                'verbose_name': 'Order',
+                'verbose_name_plural': 'Orders',
+                'ordering': ['-created_at'],
+            },
+        ),
+        migrations.CreateModel(
+            name='OrderLine',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('line_no', models.PositiveSmallIntegerField()),
+                ('item_name', models.CharField(max_length=200)),
+                ('portion', models.CharField(choices=[('regular', 'Regular'), ('half', 'Half'), ('full', 'Full')], max_length=10)),
+                ('quantity', models.PositiveSmallIntegerField()),
+                ('unit_price', menu.fields.PaiseField(help_text='Unit price (₹)')),
+                ('line_total', menu.fields.PaiseField(help_text='Line total (₹)')),
+                ('item', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='menu.menuitem')),
+                ('order', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='lines', to='orders.order')),
+            ],
+            options={
+                'verbose_name': 'Order Line',
+                'verbose_name_plural': 'Order Lines',
+                'ordering': ['order', 'line_no'],
+                'constraints': [models.UniqueConstraint(fields=('order', 'line_no'), name='unique_order_line_no')],
+            },
+        ),
+    ]
@@ -0,0 +1,96 @@
+import uuid
+
+from django.db import models
+from django.utils import timezone
+
+from menu.fields import PaiseField
+from menu.pricing import format_paise
+
+
+class Order(models.Model):
+    """
+    An online order. The primary key is derived from the client's
+    Idempotency-Key and phone number (see orders.intake.order_id_for), so
+    a retried submission maps onto the same row instead of creating a
+    duplicate.
+    """
+    STATUS_RECEIVED  = 'received'
+    STATUS_ACCEPTED  = 'accepted'
+    STATUS_READY     = 'ready'
+    STATUS_COMPLETED = 'completed'
+    STATUS_CANCELLED = 'cancelled'
+    STATUS_CHOICES   = [
+        (STATUS_RECEIVED,  'Received'),
+        (STATUS_ACCEPTED,  'Accepted'),
+        (STATUS_READY,     'Ready'),
+        (STATUS_COMPLETED, 'Completed'),
+        (STATUS_CANCELLED, 'Cancelled'),
+    ]
+
+    id              = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    idempotency_key = models.CharField(max_length=255, blank=True)
+    request_hash    = models.CharField(
+        max_length=64,
+        help_text='SHA-256 of the submitted order; a retry must match it.',
+    )
+    outlet          = models.ForeignKey(
+        'menu.Outlet',
+        on_delete=models.SET_NULL,
+        null=True, blank=True,
+        related_name='orders',
+    )
+    customer_name   = models.CharField(max_length=100)
+    phone           = models.CharField(max_length=20)
+    notes           = models.TextField(blank=True)
+    status          = models.CharField(
+        max_length=20, choices=STATUS_CHOICES, default=STATUS_RECEIVED, db_index=True,
+    )
+    total           = PaiseField(help_text='Order total (₹)')
+    line_count      = models.PositiveSmallIntegerField()
+    menu_snapshot   = models.PositiveBigIntegerField(
+        help_text='MenuSnapshot the prices were taken from.',
+    )
+    # Set at submission time, not insert time (write-behind inserts later).
+    created_at      = models.DateTimeField(default=timezone.now, db_index=True)
+
+    class Meta:
+        verbose_name        = 'Order'
+        verbose_name_plural = 'Orders'
+        ordering            = ['-created_at']
+
+    def __str__(self):
+        return f'Order {str(self.pk)[:8]} — {self.customer_name} ₹{format_paise(self.total)}'
+
+
+class OrderLine(models.Model):
+    """One cart line, with the item name and price frozen at order time."""
+    PORTION_CHOICES = [
+        ('regular', 'Regular'),
+        ('half',    'Half'),
+        ('full',    'Full'),
+    ]
+
+    order      = models.ForeignKey(Order, on_delete=models.CASCADE, related_name='lines')
+    line_no    = models.PositiveSmallIntegerField()
+    item       = models.ForeignKey(
+        'menu.MenuItem',
+        on_delete=models.SET_NULL,
+        null=True, blank=True,
+        related_name='+',
+    )
+    item_name  = models.CharField(max_length=200)
+    portion    = models.CharField(max_length=10, choices=PORTION_CHOICES)
+    quantity   = models.PositiveSmallIntegerField()
+    unit_price = PaiseField(help_text='Unit price (₹)')
+    line_total = PaiseField(help_text='Line total (₹)')
+
+    class Meta:
+        verbose_name        = 'Order Line'
+        verbose_name_plural = 'Order Lines'
+        ordering            = ['order', 'line_no']
+        constraints         = [
+            models.UniqueConstraint(fields=['order', 'line_no'], name='unique_order_line_no'),
+        ]
+
+    def __str__(self):
+        return f'{self.quantity} × {self.item_name} ({self.portion})'
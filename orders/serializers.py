@@ -0,0 +1,42 @@
+from rest_framework import serializers
+
+from menu.pricing import format_paise
+
+
+class OrderLineInputSerializer(serializers.Serializer):
+    item     = serializers.IntegerField(min_value=1)
+    portion  = serializers.ChoiceField(choices=['regular', 'half', 'full'], default='regular')
+    quantity = serializers.IntegerField(min_value=1, max_value=50, default=1)
+
+
+class OrderInputSerializer(serializers.Serializer):
+    """POST /api/orders/ body. Prices are never taken from the client."""
+    outlet        = serializers.SlugField(required=False, allow_blank=True)
+    customer_name = serializers.CharField(max_length=100)
+    phone         = serializers.RegexField(r'^\+?[0-9][0-9 -]{7,18}$', max_length=20)
+    notes         = serializers.CharField(max_length=500, required=False, allow_blank=True)
+    lines         = OrderLineInputSerializer(many=True, allow_empty=False, max_length=50)
+
+
+def order_representation(order, lines=None, status=None):
+    """Response body for an order (built directly; no model serializer per line)."""
+    if lines is None:
+        lines = order.lines.all()
+    return {
+        'id':         str(order.pk),
+        'status':     status or order.status,
+        'total':      format_paise(order.total),
+        'created_at': order.created_at.isoformat(),
+        'lines': [
+            {
+                'line_no':    line.line_no,
+                'item':       line.item_id,
+                'item_name':  line.item_name,
+                'portion':    line.portion,
+                'quantity':   line.quantity,
+                'unit_price': format_paise(line.unit_price),
+                'line_total': format_paise(line.line_total),
+            }
+            for line in lines
+        ],
+    }
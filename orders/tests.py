@@ -0,0 +1,87 @@
+import json
+from unittest import mock
+
+from django.test import TestCase
+
+from menu.models import Category, MenuItem
+from menu.snapshot import publish_all
+
+from . import intake
+from .models import Order
+from .serializers import OrderInputSerializer
+from .throttling import OrderRateThrottle
+
+PHONE = '+91 98765 43210'
+
+
+@mock.patch.object(OrderRateThrottle, 'allow_request', return_value=True)
+class IdempotentOrderTests(TestCase):
+    """Retries with the same Idempotency-Key collapse onto one order (orders/intake.py)."""
+
+    @classmethod
+    def setUpTestData(cls):
+        category = Category.objects.create(name='Mains', display_order=1)
+        cls.item = MenuItem.objects.create(category=category, name='Dal Makhani', price_regular=18900)
+        publish_all()
+
+    def body(self, quantity=1, phone=PHONE):
+        return {
+            'customer_name': 'Asha',
+            'phone': phone,
+            'lines': [{'item': self.item.pk, 'quantity': quantity}],
+        }
+
+    def validated(self, body):
+        serializer = OrderInputSerializer(data=body)
+        serializer.is_valid(raise_exception=True)
+        return serializer.validated_data
+
+    def post(self, body, key='retry-1'):
+        return self.client.post('/api/orders/', json.dumps(body), content_type='application/json',
+                                HTTP_IDEMPOTENCY_KEY=key)
+
+    def test_order_id_is_scoped_to_the_phone_number(self, _):
+        self.assertEqual(intake.order_id_for('k', '+91 98765 43210'), intake.order_id_for('k', '919876543210'))
+        self.assertNotEqual(intake.order_id_for('k', PHONE), intake.order_id_for('k', '+91 90000 00000'))
+        self.assertNotEqual(intake.order_id_for('', PHONE), intake.order_id_for('', PHONE))
+
+    def test_retry_is_replayed_even_after_the_menu_changed(self, _):
+        first = self.post(self.body())
+        self.assertEqual(first.status_code, 201)
+
+        MenuItem.objects.filter(pk=self.item.pk).update(is_available=False)
+        publish_all()
+        retry = self.post(self.body())
+        self.assertEqual(retry.status_code, 200)
+        self.assertEqual(retry['Idempotent-Replayed'], 'true')
+        self.assertEqual(retry.json()['id'], first.json()['id'])
+        self.assertEqual(Order.objects.count(), 1)
+
+    def test_same_key_from_another_phone_is_another_order(self, _):
+        self.assertEqual(self.post(self.body()).status_code, 201)
+        self.assertEqual(self.post(self.body(phone='+91 90000 00000')).status_code, 201)
+        self.assertEqual(Order.objects.count(), 2)
+
+    def test_key_reused_for_a_different_order_is_rejected(self, _):
+        self.assertEqual(self.post(self.body()).status_code, 201)
+        self.assertEqual(self.post(self.body(quantity=2)).status_code, 422)
+
+    def test_losing_a_concurrent_insert_returns_the_stored_order(self, _):
+        data = self.validated(self.body())
+        order, lines = intake.build_order(data, 'race')
+        intake.save_order(order, lines)
+        again, lines = intake.build_order(data, 'race')
+        stored, created = intake.save_order(again, lines)
+        self.assertFalse(created)
+        self.assertEqual(stored.pk, order.pk)
+
+    def test_retry_of_a_queued_order(self, _):
+        queue = intake.WriteBehindQueue()
+        order, lines = intake.build_order(self.validated(self.body()), 'queued')
+        queue.pending[order.pk] = (order, lines)   # as submit() leaves it, without the writer
+        with mock.patch.object(intake, 'write_behind', queue):
+            retry = self.post(self.body(), key='queued')
+            self.assertEqual(retry.status_code, 202)
+            self.assertEqual(retry.json()['status'], 'queued')
+            self.assertEqual(self.post(self.body(quantity=2), key='queued').status_code, 422)
+        self.assertEqual(queue.queue.qsize(), 0)
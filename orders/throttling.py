@@ -0,0 +1,12 @@
+from core.throttling import TokenBucketRateThrottle
+
+
+class OrderRateThrottle(TokenBucketRateThrottle):
+    """Order submissions per client IP ('orders' rate)."""
+    scope = 'orders'
+
+    def get_cache_key(self, request, view):
+        return self.cache_format % {
+            'scope': self.scope,
+            'ident': self.get_ident(request),
+        }
@@ -0,0 +1,13 @@
+"""
+URL routes for online orders, under /api/orders/
+
+Views are imported on first use (see core.lazy).
+"""
+from django.urls import path
+
+from core.lazy import lazy_view
+
+urlpatterns = [
+    path('',                lazy_view('orders.views.order_create', csrf=False), name='api-order-create'),
+    path('<uuid:order_id>/', lazy_view('orders.views.order_detail', csrf=False), name='api-order-detail'),
+]
@@ -0,0 +1,93 @@
+"""
+Online order API.
+
+  POST /api/orders/       — place an order (send an Idempotency-Key header
+                            so retries never create a second order)
+  GET  /api/orders/<id>/  — order status
+
+Both are public: authentication_classes([]) skips JWT/session work, and
+submissions are throttled per IP with OrderRateThrottle.
+"""
+from rest_framework import status
+from rest_framework.decorators import (
+    api_view,
+    authentication_classes,
+    permission_classes,
+    throttle_classes,
+)
+from rest_framework.permissions import AllowAny
+from rest_framework.response import Response
+
+from . import intake
+from .models import Order
+from .serializers import OrderInputSerializer, order_representation
+from .throttling import OrderRateThrottle
+
+MAX_KEY_LENGTH = 255
+
+
+@api_view(['POST'])
+@authentication_classes([])
+@permission_classes([AllowAny])
+@throttle_classes([OrderRateThrottle])
+def order_create(request):
+    """
+    201 — order stored
+    200 — retry of an already stored order (Idempotent-Replayed: true)
+    202 — accepted into the write-behind queue (ORDERS_WRITE_BEHIND), or a
+          retry of an order still queued in this worker
+    422 — Idempotency-Key reused for a different order
+
+    A 202 is only as durable as the worker holding the queue: see the
+    write-behind limits in orders/intake.py.
+    """
+    key = request.headers.get('Idempotency-Key', '').strip()
+    if len(key) > MAX_KEY_LENGTH:
+        return Response({'detail': 'Idempotency-Key is too long.'}, status=400)
+
+    serializer = OrderInputSerializer(data=request.data)
+    serializer.is_valid(raise_exception=True)
+    data = serializer.validated_data
+    try:
+        # A retry gets the stored order even if the menu has changed since.
+        if key:
+            order_id = intake.order_id_for(key, data['phone'])
+            body_hash = intake.request_hash(data)
+            existing = intake.find_existing(order_id, body_hash)
+            if existing is not None:
+                return Response(order_representation(existing), headers={'Idempotent-Replayed': 'true'})
+            queued = intake.find_queued(order_id, body_hash)
+            if queued is not None:
+                return Response(order_representation(*queued, status='queued'),
+                                status=status.HTTP_202_ACCEPTED,
+                                headers={'Location': f'/api/orders/{order_id}/',
+                                         'Idempotent-Replayed': 'true'})
+
+        order, lines = intake.build_order(data, key)
+
+        location = f'/api/orders/{order.pk}/'
+        if intake.write_behind is not None and intake.write_behind.submit(order, lines):
+            return Response(order_representation(order, lines, status='queued'),
+                            status=status.HTTP_202_ACCEPTED, headers={'Location': location})
+
+        order, created = intake.save_order(order, lines)
+    except intake.OrderRejected as exc:
+        return Response(exc.detail, status=exc.status)
+
+    if not created:
+        return Response(order_representation(order), headers={'Idempotent-Replayed': 'true'})
+    return Response(order_representation(order, lines),
+                    status=status.HTTP_201_CREATED, headers={'Location': location})
+
+
+@api_view(['GET'])
+@authentication_classes([])
+@permission_classes([AllowAny])
+def order_detail(request, order_id):
+    order = Order.objects.filter(pk=order_id).first()
+    if order is None:
+        # Only this worker knows its queued orders (see orders/intake.py).
+        if intake.write_behind is not None and intake.write_behind.get_pending(order_id):
+            return Response({'id': str(order_id), 'status': 'queued'})
+        return Response({'detail': 'Not found.'}, status=404)
+    return Response(order_representation(order))
@@ -1,5 +1,7 @@
 from django.contrib import admin
-from .models import Review
+
+from . import aggregates
+from .models import Review, ReviewAggregate
 
 
 @admin.register(Review)
@@ -9,9 +11,26 @@ class ReviewAdmin(admin.ModelAdmin):
     list_filter   = ('is_approved', 'rating', 'source')
     search_fields = ('reviewer_name', 'body')
     readonly_fields = ('created_at',)
-    actions = ['approve_reviews']
+    actions = ['approve_reviews', 'unapprove_reviews']
 
     @admin.action(description='Approve selected reviews')
     def approve_reviews(self, request, queryset):
-        updated = queryset.update(is_approved=True)
+        updated = aggregates.bulk_set_approved(queryset, True)
         self.message_user(request, f'{updated} review(s) approved.')
+
+    @admin.action(description='Unapprove selected reviews')
+    def unapprove_reviews(self, request, queryset):
+        updated = aggregates.bulk_set_approved(queryset, False)
+        self.message_user(request, f'{updated} review(s) unapproved.')
+
+
+@admin.register(ReviewAggregate)
+class ReviewAggregateAdmin(admin.ModelAdmin):
+    list_display = ('source', 'count', 'average', 'stars_5', 'stars_4', 'stars_3',
+                    'stars_2', 'stars_1', 'updated_at')
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
@@ -0,0 +1,110 @@
+"""
+Incremental maintenance of ReviewAggregate.
+
+Every approved review contributes (count 1, its rating, one star bucket)
+to the row of its source. Changes are applied as F() deltas:
+
+  * single saves / deletes — through signals (reviews/signals.py), using
+    the values the row had when it was loaded (Review._counted)
+  * bulk approve / unapprove — bulk_set_approved() groups the affected
+    rows by (source, rating) and applies one delta per group, in the same
+    transaction as the UPDATE
+
+rebuild() recomputes everything from scratch (migration, repairs).
+"""
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F
+
+from core.edge import REVIEWS
+from core.purge import purge_keys
+
+from .models import Review, ReviewAggregate
+
+STARS = range(1, 6)
+
+
+def apply_delta(source, rating, delta):
+    """Add `delta` reviews of `rating` stars to `source`."""
+    changes = {
+        'count':           F('count') + delta,
+        'rating_sum':      F('rating_sum') + delta * rating,
+        f'stars_{rating}': F(f'stars_{rating}') + delta,
+    }
+    if ReviewAggregate.objects.filter(source=source).update(**changes):
+        return
+    try:
+        with transaction.atomic():
+            ReviewAggregate.objects.create(
+                source=source, count=delta, rating_sum=delta * rating,
+                **{f'stars_{rating}': delta},
+            )
+    except IntegrityError:
+        # Created concurrently — apply to that row instead.
+        ReviewAggregate.objects.filter(source=source).update(**changes)
+
+
+def record_change(old_key, new_key):
+    """Apply the difference between two Review.aggregate_key() values."""
+    if old_key == new_key:
+        return
+    if old_key is not None:
+        apply_delta(*old_key, -1)
+    if new_key is not None:
+        apply_delta(*new_key, +1)
+
+
+def bulk_set_approved(queryset, approved):
+    """
+    queryset.update(is_approved=approved) with the aggregates kept in step.
+    Returns the number of reviews whose status changed.
+    """
+    with transaction.atomic():
+        changing = queryset.filter(is_approved=not approved)
+        groups = list(
+            changing.order_by().values('source', 'rating').annotate(n=Count('id'))
+        )
+        updated = changing.update(is_approved=approved)
+        sign = 1 if approved else -1
+        for group in groups:
+            apply_delta(group['source'], group['rating'], sign * group['n'])
+        if updated:
+            purge_keys({REVIEWS})
+    return updated
+
+
+def rebuild():
+    """Recompute every aggregate row from the approved reviews."""
+    rows = {}
+    grouped = (
+        Review.objects.filter(is_approved=True)
+        .order_by().values('source', 'rating').annotate(n=Count('id'))
+    )
+    for group in grouped:
+        row = rows.setdefault(group['source'], ReviewAggregate(source=group['source']))
+        row.count += group['n']
+        row.rating_sum += group['n'] * group['rating']
+        setattr(row, f"stars_{group['rating']}", getattr(row, f"stars_{group['rating']}") + group['n'])
+    with transaction.atomic():
+        ReviewAggregate.objects.all().delete()
+        ReviewAggregate.objects.bulk_create(rows.values())
+
+
+def summary():
+    """Overall and per-source totals (sums a handful of per-source rows)."""
+    sources = list(ReviewAggregate.objects.filter(count__gt=0).order_by('-count', 'source'))
+    count = sum(row.count for row in sources)
+    rating_sum = sum(row.rating_sum for row in sources)
+    return {
+        'count':        count,
+        'average':      round(rating_sum / count, 2) if count else None,
+        'distribution': {str(s): sum(getattr(row, f'stars_{s}') for row in sources) for s in STARS},
+        'sources': [
+            {
+                'source':       row.source,
+                'count':        row.count,
+                'average':      row.average,
+                'distribution': {str(s): getattr(row, f'stars_{s}') for s in STARS},
+            }
+            for row in sources
+        ],
+    }
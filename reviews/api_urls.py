@@ -0,0 +1,13 @@
+"""
+URL routes for the public reviews API, under /api/
+
+Views are imported on first use (see core.lazy).
+"""
+from django.urls import path
+
+from core.lazy import lazy_view
+
+urlpatterns = [
+    path('reviews',         lazy_view('reviews.api_views.review_list', csrf=False),    name='api-reviews'),
+    path('reviews/summary', lazy_view('reviews.api_views.review_summary', csrf=False), name='api-reviews-summary'),
+]
@@ -0,0 +1,47 @@
+"""
+DRF API views for public reviews. Read-only and unauthenticated, like
+menu.api_views.
+"""
+from rest_framework.decorators import (
+    api_view,
+    authentication_classes,
+    permission_classes,
+    throttle_classes,
+)
+from rest_framework.permissions import AllowAny
+from rest_framework.response import Response
+
+from core import edge
+from core.throttling import SharedAnonRateThrottle
+
+from . import aggregates
+from .models import Review
+from .pagination import KeysetPagination
+from .serializers import ReviewSerializer
+
+
+@edge.edge_cache('reviews')
+@api_view(['GET'])
+@authentication_classes([])
+@permission_classes([AllowAny])
+@throttle_classes([SharedAnonRateThrottle])
+def review_list(request):
+    """
+    GET /api/reviews                  — approved reviews, newest first
+    GET /api/reviews?limit=50         — page size (max 100)
+    GET /api/reviews?cursor=<cursor>  — next page (use the `next` URL)
+    """
+    paginator = KeysetPagination()
+    page = paginator.paginate_queryset(Review.objects.filter(is_approved=True), request)
+    response = paginator.get_paginated_response(ReviewSerializer(page, many=True).data)
+    return edge.add_keys(response, {edge.REVIEWS})
+
+
+@edge.edge_cache('reviews')
+@api_view(['GET'])
+@authentication_classes([])
+@permission_classes([AllowAny])
+@throttle_classes([SharedAnonRateThrottle])
+def review_summary(request):
+    """GET /api/reviews/summary — count, average, star histogram, per-source breakdown."""
+    return edge.add_keys(Response(aggregates.summary()), {edge.REVIEWS})
@@ -0,0 +1,261 @@
+"""
+Management command: import_reviews
+
+Usage:
+    python manage.py import_reviews google_reviews.csv --source Google
+    python manage.py import_reviews zomato.jsonl --source Zomato --approve
+    python manage.py import_reviews export.json --batch-size 5000 --dry-run
+
+Streams a CSV, JSON-array or JSON-lines export (format from the file
+extension, or --format) and inserts new reviews in batched bulk_create
+calls, one transaction per batch. Memory stays flat regardless of file
+size: rows are read one at a time and only the current batch is held.
+
+Duplicates are skipped by Review.content_hash (reviewer, body, source;
+case and whitespace insensitive) — one indexed `IN` query per batch, no
+per-row lookups — so re-running an import, or importing overlapping
+exports, is safe.
+
+Column names are matched loosely so Google / Zomato exports work as-is:
+  reviewer_name  reviewer_name, reviewer, author, author_name, user_name, name
+  body           body, comment, review, review_text, text
+  rating         rating, stars, star_rating, starRating  (1–5, "4.0", "FIVE")
+  created_at     created_at, date, create_time, createTime, timestamp, time
+  source         source (else --source)
+"""
+import csv
+import json
+import math
+import os
+import time
+from datetime import datetime, timezone as dt_timezone
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.utils import timezone
+
+from core.edge import REVIEWS
+from core.purge import purge_keys
+from reviews import aggregates
+from reviews.models import Review
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+ALIASES = {
+    'reviewer_name': ('reviewer_name', 'reviewer', 'author', 'author_name', 'user_name', 'name'),
+    'body':          ('body', 'comment', 'review', 'review_text', 'text'),
+    'rating':        ('rating', 'stars', 'star_rating', 'starrating'),
+    'created_at':    ('created_at', 'date', 'create_time', 'createtime', 'timestamp', 'time'),
+    'source':        ('source',),
+}
+STAR_WORDS = {'ONE': 1, 'TWO': 2, 'THREE': 3, 'FOUR': 4, 'FIVE': 5}
+
+
+def iter_json_array(fh, chunk_size=1 << 16):
+    """Yield the objects of a top-level JSON array without loading the file."""
+    decoder = json.JSONDecoder()
+    buffer = ''
+    started = False
+    eof = False
+    while True:
+        stripped = buffer.lstrip(' \t\r\n,')
+        if not started and stripped.startswith('['):
+            started = True
+            stripped = stripped[1:].lstrip(' \t\r\n,')
+        buffer = stripped
+        if not started and buffer:
+            raise CommandError('Expected a JSON array (use --format jsonl for JSON lines).')
+        if started and buffer.startswith(']'):
+            return
+        if buffer and started:
+            try:
+                obj, end = decoder.raw_decode(buffer)
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+            else:
+                yield obj
+                buffer = buffer[end:]
+                continue
+        if eof:
+            if buffer.strip():
+                raise CommandError('Unexpected end of JSON array.')
+            return
+        chunk = fh.read(chunk_size)
+        if not chunk:
+            eof = True
+        buffer += chunk
+
+
+def iter_rows(path, fmt):
+    with open(path, encoding='utf-8-sig', newline='') as fh:
+        if fmt == 'csv':
+            yield from csv.DictReader(fh)
+        elif fmt == 'jsonl':
+            for line in fh:
+                if line.strip():
+                    yield json.loads(line)
+        else:
+            yield from iter_json_array(fh)
+
+
+def _pick(row, field):
+    for alias in ALIASES[field]:
+        value = row.get(alias)
+        if value not in (None, ''):
+            return value
+    return None
+
+
+def _parse_rating(value):
+    if isinstance(value, str) and value.strip().upper() in STAR_WORDS:
+        return STAR_WORDS[value.strip().upper()]
+    number = float(value)
+    if not math.isfinite(number):
+        raise ValueError(f'rating {value!r} is not a number')
+    rating = round(number)
+    if not 1 <= rating <= 5:
+        raise ValueError(f'rating {value!r} out of range')
+    return rating
+
+
+def _parse_date(value):
+    if value is None:
+        return None
+    if isinstance(value, (int, float)) or str(value).isdigit():
+        seconds = float(value)
+        if seconds > 1e11:   # milliseconds
+            seconds /= 1000
+        return datetime.fromtimestamp(seconds, tz=dt_timezone.utc)
+    parsed = datetime.fromisoformat(str(value).replace('Z', '+00:00'))
+    if timezone.is_naive(parsed):
+        parsed = timezone.make_aware(parsed)
+    return parsed
+
+
+class Command(BaseCommand):
+    help = "Stream-import reviews from Google / Zomato CSV or JSON exports, skipping duplicates."
+
+    def add_arguments(self, parser):
+        parser.add_argument("path")
+        parser.add_argument("--format", choices=["csv", "json", "jsonl"],
+                            help="Defaults to the file extension.")
+        parser.add_argument("--source", default="",
+                            help="Source for rows without one (e.g. Google, Zomato).")
+        parser.add_argument("--approve", action="store_true",
+                            help="Publish imported reviews immediately.")
+        parser.add_argument("--batch-size", type=int, default=2000)
+        parser.add_argument("--dry-run", action="store_true",
+                            help="Parse and dedupe only; insert nothing.")
+
+    def handle(self, *args, **options):
+        path = options["path"]
+        if not os.path.exists(path):
+            raise CommandError(f"{path} does not exist")
+        fmt = options["format"] or os.path.splitext(path)[1].lstrip(".").lower()
+        if fmt not in ("csv", "json", "jsonl"):
+            raise CommandError("Cannot tell the format; pass --format csv|json|jsonl")
+
+        self.stats = {"read": 0, "inserted": 0, "existing": 0, "in_batch": 0, "invalid": 0}
+        self.options = options
+        started = time.perf_counter()
+        batch = []
+        for row in iter_rows(path, fmt):
+            self.stats["read"] += 1
+            review = self._build(row)
+            if review is None:
+                continue
+            batch.append(review)
+            if len(batch) >= options["batch_size"]:
+                self._flush(batch)
+                batch = []
+                self._progress(started)
+        if batch:
+            self._flush(batch)
+        if self.options["approve"] and self.stats["inserted"] and not options["dry_run"]:
+            purge_keys({REVIEWS})   # once, not per batch
+
+        elapsed = time.perf_counter() - started
+        s = self.stats
+        self.stdout.write(self.style.SUCCESS(
+            f"\n✅  {s['read']} rows in {elapsed:.1f} s ({s['read'] / max(elapsed, 1e-9):.0f} rows/s)"
+            f" — {s['inserted']} inserted, {s['existing']} already present, "
+            f"{s['in_batch']} duplicated within the file, {s['invalid']} invalid"
+            f"{' (dry run)' if options['dry_run'] else ''}"
+        ))
+        if resource is not None:
+            peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+            self.stdout.write(f"   peak RSS {peak:.0f} MB")
+
+    # ------------------------------------------------------------------
+    def _build(self, raw):
+        row = {str(k).strip().lower(): v for k, v in raw.items()}
+        reviewer = _pick(row, "reviewer_name")
+        body = _pick(row, "body")
+        try:
+            rating = _parse_rating(_pick(row, "rating"))
+        except (TypeError, ValueError):
+            rating = None
+        try:
+            created_at = _parse_date(_pick(row, "created_at")) or timezone.now()
+        except (TypeError, ValueError, OverflowError, OSError):
+            # An unreadable date does not make the review itself invalid.
+            created_at = timezone.now()
+        if not reviewer or not body or rating is None:
+            self.stats["invalid"] += 1
+            return None
+
+        reviewer = str(reviewer).strip()[:100]
+        body = str(body).strip()
+        source = str(_pick(row, "source") or self.options["source"]).strip()[:50]
+        return Review(
+            reviewer_name=reviewer,
+            body=body,
+            rating=rating,
+            source=source,
+            created_at=created_at,
+            is_approved=self.options["approve"],
+            content_hash=Review.compute_hash(reviewer, body, source),
+        )
+
+    def _flush(self, batch):
+        unique = {}
+        for review in batch:
+            if review.content_hash in unique:
+                self.stats["in_batch"] += 1
+            else:
+                unique[review.content_hash] = review
+
+        existing = set(
+            Review.objects.filter(content_hash__in=list(unique))
+            .values_list("content_hash", flat=True)
+        )
+        new = [r for h, r in unique.items() if h not in existing]
+        self.stats["existing"] += len(unique) - len(new)
+        if self.options["dry_run"]:
+            self.stats["inserted"] += len(new)   # would be inserted
+            return
+        if not new:
+            return
+
+        with transaction.atomic():
+            Review.objects.bulk_create(new)
+            if self.options["approve"]:
+                # bulk_create sends no signals; keep ReviewAggregate in step.
+                groups = {}
+                for review in new:
+                    key = (review.source, review.rating)
+                    groups[key] = groups.get(key, 0) + 1
+                for (source, rating), n in groups.items():
+                    aggregates.apply_delta(source, rating, n)
+        self.stats["inserted"] += len(new)
+
+    def _progress(self, started):
+        elapsed = time.perf_counter() - started
+        self.stdout.write(
+            f"  … {self.stats['read']} rows, {self.stats['inserted']} inserted "
+            f"({self.stats['read'] / elapsed:.0f} rows/s)"
+        )
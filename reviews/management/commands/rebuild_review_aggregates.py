@@ -0,0 +1,25 @@
+"""
+Management command: rebuild_review_aggregates
+
+Usage:
+    python manage.py rebuild_review_aggregates
+
+Recomputes ReviewAggregate from the approved reviews. The aggregates are
+kept up to date incrementally (reviews/aggregates.py); run this after
+raw SQL changes or to repair drift.
+"""
+from django.core.management.base import BaseCommand
+
+from reviews import aggregates
+
+
+class Command(BaseCommand):
+    help = "Recompute review aggregates (count, average, star histogram) from scratch."
+
+    def handle(self, *args, **options):
+        aggregates.rebuild()
+        summary = aggregates.summary()
+        self.stdout.write(self.style.SUCCESS(
+            f"✅  {summary['count']} approved reviews across "
+            f"{len(summary['sources'])} source(s), average {summary['average']}"
+        ))
@@ -0,0 +1,56 @@
+# Generated by Django 5.1.15 on 2026-10-19 14:49
+
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def build_aggregates(apps, schema_editor):
+    Review = apps.get_model('reviews', 'Review')
+    ReviewAggregate = apps.get_model('reviews', 'ReviewAggregate')
+    rows = {}
+    grouped = (
+        Review.objects.filter(is_approved=True)
+        .order_by().values('source', 'rating').annotate(n=Count('id'))
+    )
+    for group in grouped:
+        row = rows.setdefault(group['source'], ReviewAggregate(source=group['source']))
+        row.count += group['n']
+        row.rating_sum += group['n'] * group['rating']
+        field = f"stars_{group['rating']}"
+        setattr(row, field, getattr(row, field) + group['n'])
+    ReviewAggregate.objects.bulk_create(rows.values())
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reviews', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ReviewAggregate',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('source', models.CharField(blank=True, max_length=50, unique=True)),
+                ('count', models.PositiveIntegerField(default=0)),
+                ('rating_sum', models.PositiveIntegerField(default=0)),
+                ('stars_1', models.PositiveIntegerField(default=0)),
+                ('stars_2', models.PositiveIntegerField(default=0)),
+                ('stars_3', models.PositiveIntegerField(default=0)),
+                ('stars_4', models.PositiveIntegerField(default=0)),
+                ('stars_5', models.PositiveIntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'Review Aggregate',
+                'verbose_name_plural': 'Review Aggregates',
+                'ordering': ['-count'],
+            },
+        ),
+        migrations.AddIndex(
+            model_name='review',
+            index=models.Index(fields=['is_approved', '-created_at', '-id'], name='review_keyset_idx'),
+        ),
+        migrations.RunPython(build_aggregates, migrations.RunPython.noop),
+    ]
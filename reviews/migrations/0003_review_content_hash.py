@@ -0,0 +1,45 @@
+# Generated by Django 5.1.15 on 2026-10-19 14:50
+
+import hashlib
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+def _hash(*parts):
+    # Frozen copy of Review.compute_hash at the time of this migration.
+    canonical = '\x1f'.join(' '.join((p or '').split()).casefold() for p in parts)
+    return hashlib.sha256(canonical.encode()).hexdigest()[:32]
+
+
+def backfill_hashes(apps, schema_editor):
+    Review = apps.get_model('reviews', 'Review')
+    batch = []
+    for review in Review.objects.only('pk', 'reviewer_name', 'body', 'source').iterator(chunk_size=2000):
+        review.content_hash = _hash(review.reviewer_name, review.body, review.source)
+        batch.append(review)
+        if len(batch) >= 2000:
+            Review.objects.bulk_update(batch, ['content_hash'])
+            batch = []
+    Review.objects.bulk_update(batch, ['content_hash'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reviews', '0002_review_aggregates'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='review',
+            name='content_hash',
+            field=models.CharField(blank=True, db_index=True, editable=False, help_text='Hash of reviewer, body and source, for import dedupe.', max_length=32),
+        ),
+        migrations.AlterField(
+            model_name='review',
+            name='created_at',
+            field=models.DateTimeField(default=django.utils.timezone.now),
+        ),
+        migrations.RunPython(backfill_hashes, migrations.RunPython.noop),
+    ]
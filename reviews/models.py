@@ -1,5 +1,8 @@
+import hashlib
+
 from django.db import models
 from django.core.validators import MinValueValidator, MaxValueValidator
+from django.utils import timezone
 
 
 class Review(models.Model):
@@ -21,10 +24,77 @@ class Review(models.Model):
         default=False,
         help_text='Only approved reviews appear on the website.',
     )
-    created_at    = models.DateTimeField(auto_now_add=True)
+    # Settable so imported reviews keep their original date.
+    created_at    = models.DateTimeField(default=timezone.now)
+    content_hash  = models.CharField(
+        max_length=32, db_index=True, editable=False, blank=True,
+        help_text='Hash of reviewer, body and source, for import dedupe.',
+    )
 
     class Meta:
         ordering = ['-created_at']
+        indexes  = [
+            # Keyset pagination for /api/reviews (reviews.api_views).
+            models.Index(
+                fields=['is_approved', '-created_at', '-id'],
+                name='review_keyset_idx',
+            ),
+        ]
 
     def __str__(self):
         return f'{self.reviewer_name} — {self.rating}★'
+
+    def save(self, *args, **kwargs):
+        self.content_hash = self.compute_hash(self.reviewer_name, self.body, self.source)
+        super().save(*args, **kwargs)
+
+    @staticmethod
+    def compute_hash(reviewer_name, body, source):
+        """Whitespace- and case-insensitive identity of a review (128-bit hex)."""
+        canonical = '\x1f'.join(
+            ' '.join(part.split()).casefold()
+            for part in (reviewer_name or '', body or '', source or '')
+        )
+        return hashlib.sha256(canonical.encode()).hexdigest()[:32]
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Remember what the aggregates currently count for this row, so
+        # reviews.aggregates can apply just the difference on save / delete.
+        instance._counted = instance.aggregate_key()
+        return instance
+
+    def aggregate_key(self):
+        """(source, rating) if this review counts towards the aggregates, else None."""
+        if self.is_approved:
+            return (self.source, self.rating)
+        return None
+
+
+class ReviewAggregate(models.Model):
+    """
+    Running totals over approved reviews, one row per source. Maintained
+    incrementally by reviews.aggregates; never computed per page view.
+    """
+    source     = models.CharField(max_length=50, unique=True, blank=True)
+    count      = models.PositiveIntegerField(default=0)
+    rating_sum = models.PositiveIntegerField(default=0)
+    stars_1    = models.PositiveIntegerField(default=0)
+    stars_2    = models.PositiveIntegerField(default=0)
+    stars_3    = models.PositiveIntegerField(default=0)
+    stars_4    = models.PositiveIntegerField(default=0)
+    stars_5    = models.PositiveIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name        = 'Review Aggregate'
+        verbose_name_plural = 'Review Aggregates'
+        ordering            = ['-count']
+
+    def __str__(self):
+        return f'{self.source or "(no source)"}: {self.count} reviews'
+
+    @property
+    def average(self):
+        return round(self.rating_sum / self.count, 2) if self.count else None
@@ -0,0 +1,65 @@
+"""
+Keyset pagination over (created_at, id), newest first.
+
+The cursor is the (created_at, id) of the last row on the previous page,
+so every page is one range scan on review_keyset_idx
+(is_approved, -created_at, -id). Deep pages cost the same as the first,
+unlike OFFSET pagination.
+"""
+import base64
+from datetime import datetime
+
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+
+class KeysetPagination(BasePagination):
+    page_size     = 20
+    max_page_size = 100
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        limit = self._limit(request)
+        cursor = request.query_params.get('cursor')
+        if cursor:
+            created_at, pk = self._decode(cursor)
+            queryset = queryset.filter(
+                Q(created_at__lt=created_at) | Q(created_at=created_at, id__lt=pk)
+            )
+        rows = list(queryset.order_by('-created_at', '-id')[:limit + 1])
+        self.has_next = len(rows) > limit
+        rows = rows[:limit]
+        self.last = rows[-1] if rows else None
+        return rows
+
+    def get_paginated_response(self, data):
+        next_url = None
+        if self.has_next:
+            next_url = replace_query_param(
+                self.request.build_absolute_uri(), 'cursor', self._encode(self.last),
+            )
+        return Response({'next': next_url, 'results': data})
+
+    def _limit(self, request):
+        try:
+            limit = int(request.query_params.get('limit', self.page_size))
+        except ValueError:
+            limit = self.page_size
+        return max(1, min(limit, self.max_page_size))
+
+    @staticmethod
+    def _encode(row):
+        raw = f'{row.created_at.isoformat()}|{row.pk}'
+        return base64.urlsafe_b64encode(raw.encode()).decode().rstrip('=')
+
+    @staticmethod
+    def _decode(cursor):
+        try:
+            raw = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4)).decode()
+            created_at, pk = raw.rsplit('|', 1)
+            return datetime.fromisoformat(created_at), int(pk)
+        except (ValueError, UnicodeDecodeError):
+            raise NotFound('Invalid cursor.')
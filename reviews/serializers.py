@@ -0,0 +1,9 @@
+from rest_framework import serializers
+
+from .models import Review
+
+
+class ReviewSerializer(serializers.ModelSerializer):
+    class Meta:
+        model  = Review
+        fields = ['id', 'reviewer_name', 'rating', 'body', 'source', 'created_at']
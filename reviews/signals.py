@@ -0,0 +1,39 @@
+"""
+Keep ReviewAggregate in step with single-review saves and deletes, and
+purge the CDN's cached reviews when a published review changes. Bulk
+updates go through reviews.aggregates.bulk_set_approved instead.
+"""
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from core.edge import REVIEWS
+from core.purge import purge_keys
+
+from . import aggregates
+from .models import Review
+
+
+@receiver(pre_save, sender=Review)
+def review_presave(sender, instance, **kwargs):
+    # Instances built by hand rather than loaded (Review(pk=..).save()).
+    if instance.pk is not None and not hasattr(instance, '_counted'):
+        old = Review.objects.filter(pk=instance.pk).first()
+        instance._counted = old.aggregate_key() if old else None
+
+
+@receiver(post_save, sender=Review)
+def review_saved(sender, instance, created, **kwargs):
+    old_key = None if created else getattr(instance, '_counted', None)
+    new_key = instance.aggregate_key()
+    aggregates.record_change(old_key, new_key)
+    instance._counted = new_key
+    if old_key is not None or new_key is not None:   # was or is published
+        purge_keys({REVIEWS})
+
+
+@receiver(post_delete, sender=Review)
+def review_deleted(sender, instance, **kwargs):
+    old_key = getattr(instance, '_counted', instance.aggregate_key())
+    aggregates.record_change(old_key, None)
+    if old_key is not None:
+        purge_keys({REVIEWS})
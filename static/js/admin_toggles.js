@@ -0,0 +1,44 @@
+/**
+ * Dilli Da Dhaba — admin_toggles.js
+ * Featured / available switches on the MenuItem changelist (menu/admin.py).
+ * Each click POSTs one flag of one item; the page is not reloaded.
+ */
+'use strict';
+
+(function () {
+  const ICON_YES = 'icon-yes.svg';
+  const ICON_NO = 'icon-no.svg';
+
+  function csrfToken() {
+    const input = document.querySelector('[name=csrfmiddlewaretoken]');
+    return input ? input.value : '';
+  }
+
+  function show(button, value) {
+    const img = button.querySelector('img');
+    button.setAttribute('aria-pressed', value ? 'true' : 'false');
+    img.src = img.src.replace(value ? ICON_NO : ICON_YES, value ? ICON_YES : ICON_NO);
+    img.alt = value ? 'True' : 'False';
+  }
+
+  document.addEventListener('click', async (event) => {
+    const button = event.target.closest('button.menu-toggle');
+    if (!button || button.disabled) return;
+    const value = button.getAttribute('aria-pressed') !== 'true';
+    button.disabled = true;
+    try {
+      const response = await fetch(button.dataset.url, {
+        method: 'POST',
+        headers: { 'X-CSRFToken': csrfToken() },
+        body: new URLSearchParams({ value: value ? '1' : '0' }),
+        credentials: 'same-origin',
+      });
+      if (!response.ok) throw new Error(`HTTP ${response.status}`);
+      show(button, value);
+    } catch (err) {
+      window.alert(`Could not save the change (${err.message}). Reload the page and try again.`);
+    } finally {
+      button.disabled = false;
+    }
+  });
+})();
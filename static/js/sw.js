@@ -0,0 +1,215 @@
+/**
+ * Dilli Da Dhaba — service worker (served at /sw.js, see core/offline.py).
+ *
+ * Caches
+ *   ddd-shell-<shell_version>  styles, scripts, fonts         cache-first
+ *   ddd-menu-<menu_version>    pages, menu API, tab grids     network-first
+ *   ddd-images                 dish photos (LRU, capped)      cache-first
+ *
+ * /sw-manifest.json says which versions are current. A cache for a
+ * version that has not changed is left alone, so a menu edit only
+ * re-downloads the menu, and a deploy only the shell.
+ */
+'use strict';
+
+const MANIFEST_URL = '/sw-manifest.json';
+const STATE_CACHE = 'ddd-state';
+const IMAGE_CACHE = 'ddd-images';
+const NETWORK_TIMEOUT_MS = 4000;
+
+let manifest = null;
+let lastCheck = 0;
+let checking = null;
+
+/* ---------------------------------------------------------------------------
+   1. Manifest & precaching
+--------------------------------------------------------------------------- */
+const shellCache = (m) => `ddd-shell-${m.shell_version}`;
+const menuCache = (m) => `ddd-menu-${m.menu_version}`;
+
+function toRequest(entry) {
+  if (typeof entry === 'string') {
+    const crossOrigin = new URL(entry, self.location).origin !== self.location.origin;
+    return new Request(entry, crossOrigin ? { mode: 'no-cors' } : {});
+  }
+  return new Request(entry.url, { headers: entry.headers || {} });
+}
+
+async function fillCache(name, entries) {
+  const cache = await caches.open(name);
+  await Promise.all(entries.map(async (entry) => {
+    const request = toRequest(entry);
+    const response = await fetch(request, { cache: 'no-cache' });
+    if (!response.ok && response.type !== 'opaque') {
+      throw new Error(`Precache of ${request.url} failed: ${response.status}`);
+    }
+    await cache.put(request, response);
+  }));
+}
+
+async function loadManifest() {
+  if (manifest) return manifest;
+  const state = await caches.open(STATE_CACHE);
+  const stored = await state.match(MANIFEST_URL);
+  manifest = stored ? await stored.json() : null;
+  return manifest;
+}
+
+async function installVersion(next) {
+  const current = await loadManifest();
+  // A version whose cache is fully built is never downloaded again.
+  if (!(await caches.has(shellCache(next)))) {
+    await fillCache(`${shellCache(next)}-tmp`, next.shell);
+    await renameCache(`${shellCache(next)}-tmp`, shellCache(next));
+  }
+  if (!(await caches.has(menuCache(next)))) {
+    await fillCache(`${menuCache(next)}-tmp`, next.menu);
+    await renameCache(`${menuCache(next)}-tmp`, menuCache(next));
+  }
+  const state = await caches.open(STATE_CACHE);
+  await state.put(MANIFEST_URL, new Response(JSON.stringify(next)));
+  manifest = next;
+  if (current) await deleteStaleCaches();
+}
+
+async function renameCache(from, to) {
+  const source = await caches.open(from);
+  const target = await caches.open(to);
+  for (const request of await source.keys()) {
+    await target.put(request, await source.match(request));
+  }
+  await caches.delete(from);
+}
+
+async function deleteStaleCaches() {
+  const keep = new Set([STATE_CACHE, IMAGE_CACHE, shellCache(manifest), menuCache(manifest)]);
+  for (const name of await caches.keys()) {
+    if (name.startsWith('ddd-') && !keep.has(name)) await caches.delete(name);
+  }
+}
+
+async function checkForUpdate(force = false) {
+  const m = await loadManifest();
+  const interval = ((m && m.check_interval) || 300) * 1000;
+  if (!force && Date.now() - lastCheck < interval) return;
+  if (checking) return checking;
+  lastCheck = Date.now();
+  checking = (async () => {
+    try {
+      const response = await fetch(MANIFEST_URL, { cache: 'no-store' });
+      if (!response.ok) return;
+      const next = await response.json();
+      if (!m || next.shell_version !== m.shell_version || next.menu_version !== m.menu_version) {
+        await installVersion(next);
+      }
+    } catch (err) {
+      // Offline or flaky: keep serving what we have.
+    } finally {
+      checking = null;
+    }
+  })();
+  return checking;
+}
+
+self.addEventListener('install', (event) => {
+  event.waitUntil(
+    fetch(MANIFEST_URL, { cache: 'no-store' })
+      .then((response) => response.json())
+      .then(installVersion)
+      .then(() => self.skipWaiting())
+  );
+});
+
+self.addEventListener('activate', (event) => {
+  event.waitUntil(
+    loadManifest()
+      .then((m) => m && deleteStaleCaches())
+      .then(() => self.clients.claim())
+  );
+});
+
+/* ---------------------------------------------------------------------------
+   2. Images — cache-first with an LRU entry cap
+--------------------------------------------------------------------------- */
+async function trimImages(cache, limit) {
+  const keys = await cache.keys();   // insertion order: oldest first
+  for (let i = 0; i < keys.length - limit; i++) await cache.delete(keys[i]);
+}
+
+async function imageResponse(request) {
+  const cache = await caches.open(IMAGE_CACHE);
+  const hit = await cache.match(request);
+  if (hit) {
+    // Re-insert to mark as most recently used.
+    await cache.delete(request);
+    await cache.put(request, hit.clone());
+    return hit;
+  }
+  const response = await fetch(request);
+  if (response.ok) {
+    await cache.put(request, response.clone());
+    const m = await loadManifest();
+    await trimImages(cache, (m && m.image_cache_entries) || 80);
+  }
+  return response;
+}
+
+/* ---------------------------------------------------------------------------
+   3. Pages & menu API — network-first, cached copy when offline or slow
+--------------------------------------------------------------------------- */
+function timeout(ms) {
+  return new Promise((_, reject) => setTimeout(() => reject(new Error('timeout')), ms));
+}
+
+async function networkFirst(request, isNavigation) {
+  const m = await loadManifest();
+  try {
+    const response = await Promise.race([fetch(request), timeout(NETWORK_TIMEOUT_MS)]);
+    if (response.ok && m) {
+      const cache = await caches.open(menuCache(m));
+      await cache.put(request, response.clone());
+    }
+    return response;
+  } catch (err) {
+    const cached = await caches.match(request);
+    if (cached) return cached;
+    if (isNavigation) {
+      // e.g. /menu/?category=3&diet=veg → the cached /menu/ page.
+      const page = await caches.match(request, { ignoreSearch: true });
+      if (page) return page;
+      const home = await caches.match('/');
+      if (home) return home;
+    }
+    throw err;
+  }
+}
+
+async function cacheFirst(request) {
+  const cached = await caches.match(request);
+  return cached || fetch(request);
+}
+
+self.addEventListener('fetch', (event) => {
+  const { request } = event;
+  if (request.method !== 'GET') return;
+  const url = new URL(request.url);
+  const sameOrigin = url.origin === self.location.origin;
+  if (sameOrigin && url.pathname.startsWith('/admin/')) return;   // per-user pages
+  const mediaPrefix = (manifest && manifest.media_prefix) || '/media/';
+
+  if (request.mode === 'navigate') {
+    event.waitUntil(checkForUpdate());
+    event.respondWith(networkFirst(request, true));
+  } else if (sameOrigin && url.pathname.startsWith(mediaPrefix)) {
+    event.respondWith(imageResponse(request));
+  } else if (sameOrigin && (url.pathname.startsWith('/api/menu') || url.pathname === '/api/categories'
+                            || request.headers.get('HX-Request'))) {
+    event.respondWith(networkFirst(request, false));
+  } else if (sameOrigin ? url.pathname.startsWith('/static/') : request.destination !== '') {
+    event.respondWith(cacheFirst(request));
+  }
+});
+
+self.addEventListener('message', (event) => {
+  if (event.data === 'check-for-update') event.waitUntil(checkForUpdate(true));
+});